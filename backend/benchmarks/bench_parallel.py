@@ -0,0 +1,68 @@
+"""
+Scaling benchmark for shared-memory sharded per-asset metrics.
+
+Run from backend/:
+    python -m benchmarks.bench_parallel --periods 2520 --assets 5000
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from core.parallel import run_sharded, compute_asset_metric_table
+from core.regime_detection import compute_rolling_volatility
+
+
+def _time(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--periods", type=int, default=2520)
+    parser.add_argument("--assets", type=int, default=5000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    returns = pd.DataFrame(
+        rng.normal(0.0003, 0.015, size=(args.periods, args.assets)),
+        index=pd.bdate_range("2000-01-03", periods=args.periods),
+        columns=[f"A{i}" for i in range(args.assets)]
+    )
+
+    workers = [1]
+    while workers[-1] * 2 <= args.max_workers:
+        workers.append(workers[-1] * 2)
+    if workers[-1] != args.max_workers:
+        workers.append(args.max_workers)
+
+    cases = {
+        "metric_table": lambda n: run_sharded(compute_asset_metric_table, returns, n_workers=n),
+        "rolling_volatility": lambda n: run_sharded(
+            compute_rolling_volatility, returns, n_workers=n, output="panel", window=60
+        ),
+    }
+
+    print(f"returns: {args.periods} x {args.assets}, best of {args.repeat}")
+    print(f"{'case':<20}{'workers':>8}{'seconds':>10}{'speedup':>9}{'efficiency':>12}")
+    for name, case in cases.items():
+        baseline = None
+        for n in workers:
+            elapsed = _time(lambda: case(n), args.repeat)
+            baseline = baseline or elapsed
+            speedup = baseline / elapsed
+            print(f"{name:<20}{n:>8}{elapsed:>10.3f}{speedup:>9.2f}{speedup / n:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
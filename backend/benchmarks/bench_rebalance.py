@@ -0,0 +1,70 @@
+"""
+Warm vs cold turnover-aware rebalance.
+
+Day 1 is solved cold; day 2 appends a few new return rows (so Σ changes a
+little) and is solved both cold and warm from day 1's RebalanceState.
+
+The warm solve starts an active-set method from day 1's trading pattern
+and only factorizes the block of assets that trade; cold solves run ADMM.
+The "method" column shows which path produced each answer.
+
+Run from backend/:
+    python -m benchmarks.bench_rebalance --assets 500 --periods 1000 --new-rows 1
+"""
+import argparse
+import time
+
+import numpy as np
+
+from core.rebalance import RebalanceState, rebalance_portfolio
+
+
+def _solve(cov, current, args, state=None):
+    start = time.perf_counter()
+    result = rebalance_portfolio(
+        cov,
+        current,
+        linear_cost=args.linear_cost,
+        quadratic_cost=args.quadratic_cost,
+        max_turnover=args.max_turnover,
+        state=state
+    )
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--assets", type=int, default=500)
+    parser.add_argument("--periods", type=int, default=1000)
+    parser.add_argument("--new-rows", type=int, default=1)
+    parser.add_argument("--linear-cost", type=float, default=0.001)
+    parser.add_argument("--quadratic-cost", type=float, default=0.01)
+    parser.add_argument("--max-turnover", type=float, default=0.2)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    total = args.periods + args.new_rows
+    returns = rng.normal(0, 0.01, size=(total, args.assets)) + rng.normal(0, 0.008, size=(total, 1))
+
+    cov_day1 = np.cov(returns[:args.periods], rowvar=False) * 252
+    cov_day2 = np.cov(returns[args.new_rows:], rowvar=False) * 252
+    current = np.ones(args.assets) / args.assets
+
+    state = RebalanceState()
+    day1, day1_ms = _solve(cov_day1, current, args, state)
+    held = day1["weights"]
+
+    cold, cold_ms = _solve(cov_day2, held, args)
+    warm, warm_ms = _solve(cov_day2, held, args, state)
+
+    print(f"assets={args.assets} periods={args.periods} new_rows={args.new_rows}")
+    print(f"{'run':<10}{'ms':>10}{'iters':>8}{'method':>12}{'turnover':>10}")
+    for name, result, ms in [("day1", day1, day1_ms), ("day2 cold", cold, cold_ms), ("day2 warm", warm, warm_ms)]:
+        print(f"{name:<10}{ms:>10.1f}{result['iterations']:>8}{result['method']:>12}{result['turnover']:>10.4f}")
+    print(f"warm/cold time: {warm_ms / cold_ms:.2f}")
+    print(f"max |w_warm - w_cold|: {np.abs(warm['weights'] - cold['weights']).max():.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Equal-risk-contribution solver benchmark: coordinate descent vs an SLSQP baseline.
+
+Run from backend/:
+    python -m benchmarks.bench_risk_parity --assets 50 100 250 1000 --slsqp-max 250
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+from scipy.optimize import minimize
+
+from core.optimization import risk_budget_weights
+
+
+def slsqp_risk_parity(cov: np.ndarray) -> np.ndarray:
+    """
+    Textbook ERC baseline: minimize squared deviations of risk shares from 1/N.
+    """
+    n = cov.shape[0]
+
+    def objective(w):
+        contributions = w * (cov @ w)
+        return np.sum((contributions / contributions.sum() - 1.0 / n) ** 2)
+
+    result = minimize(
+        objective,
+        np.ones(n) / n,
+        method="SLSQP",
+        bounds=[(1e-6, 1.0)] * n,
+        constraints={"type": "eq", "fun": lambda w: np.sum(w) - 1},
+        options={"maxiter": 1000, "ftol": 1e-14}
+    )
+    return result.x
+
+
+def max_share_error(cov: np.ndarray, w: np.ndarray) -> float:
+    contributions = w * (cov @ w)
+    return float(np.max(np.abs(contributions / contributions.sum() - 1.0 / len(w))))
+
+
+def random_covariance(n: int, rng: np.random.Generator) -> np.ndarray:
+    returns = rng.normal(0, 0.01, size=(max(2 * n, 500), n)) + rng.normal(0, 0.01, size=(max(2 * n, 500), 1))
+    return np.cov(returns, rowvar=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--assets", type=int, nargs="+", default=[50, 100, 250, 1000])
+    parser.add_argument("--slsqp-max", type=int, default=250, help="skip the SLSQP baseline above this size")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    print(f"{'assets':>7}{'ccd ms':>10}{'ccd err':>11}{'slsqp ms':>11}{'slsqp err':>11}{'speedup':>9}")
+
+    for n in args.assets:
+        cov = random_covariance(n, rng)
+        cov_df = pd.DataFrame(cov)
+
+        start = time.perf_counter()
+        w_ccd = risk_budget_weights(cov_df)
+        ccd_ms = (time.perf_counter() - start) * 1000
+
+        if n <= args.slsqp_max:
+            start = time.perf_counter()
+            w_slsqp = slsqp_risk_parity(cov)
+            slsqp_ms = (time.perf_counter() - start) * 1000
+            print(f"{n:>7}{ccd_ms:>10.2f}{max_share_error(cov, w_ccd):>11.2e}"
+                  f"{slsqp_ms:>11.1f}{max_share_error(cov, w_slsqp):>11.2e}{slsqp_ms / ccd_ms:>9.1f}")
+        else:
+            print(f"{n:>7}{ccd_ms:>10.2f}{max_share_error(cov, w_ccd):>11.2e}{'-':>11}{'-':>11}{'-':>9}")
+
+
+if __name__ == "__main__":
+    main()
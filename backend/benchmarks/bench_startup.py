@@ -0,0 +1,122 @@
+"""
+Cold-start cost of the API: time to import the app, and latency of the
+first and second /api/risk-report requests, with and without warm-up.
+
+Every measurement runs in a fresh interpreter (this module re-invoked
+with --child), so nothing is already imported or initialized. With
+warm-up, the first request is sent once /api/ready returns 200 and the
+wait is reported separately.
+
+Run from backend/:
+    python -m benchmarks.bench_startup --repeats 5 --assets 10 --periods 500
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+def _payload(n_assets, n_periods, seed):
+    # Pure Python so the parent process never imports numpy
+    rng = random.Random(seed)
+    prices = {}
+    for i in range(n_assets):
+        level, series = 100.0, []
+        for _ in range(n_periods):
+            level *= 1 + rng.gauss(0, 0.01)
+            series.append(level)
+        prices[f"ASSET{i}"] = series
+    return {
+        "prices": prices,
+        "weights": [1 / n_assets] * n_assets,
+        "freq": "daily",
+        "confidence_level": 0.95,
+        "window": 20,
+        "risk_free_rate": 0.02,
+        "high_vol_threshold": 0.03,
+        "low_vol_threshold": 0.01
+    }
+
+
+def _child_import():
+    start = time.perf_counter()
+    import main  # noqa: F401
+    elapsed = time.perf_counter() - start
+    heavy = [m for m in ("numpy", "pandas", "scipy") if m in sys.modules]
+    return {"import_ms": elapsed * 1000, "heavy_modules_loaded": heavy}
+
+
+def _child_requests(n_assets, n_periods):
+    payload = _payload(n_assets, n_periods, seed=0)
+    start = time.perf_counter()
+    import main
+    result = {"import_ms": (time.perf_counter() - start) * 1000}
+
+    from fastapi.testclient import TestClient
+
+    with TestClient(main.app) as client:
+        start = time.perf_counter()
+        while client.get("/api/ready").status_code == 503:
+            time.sleep(0.005)
+        result["ready_wait_ms"] = (time.perf_counter() - start) * 1000
+
+        for name in ("first_request_ms", "second_request_ms"):
+            start = time.perf_counter()
+            response = client.post("/api/risk-report", json=payload)
+            result[name] = (time.perf_counter() - start) * 1000
+            if response.status_code != 200:
+                sys.exit(f"POST /api/risk-report returned {response.status_code}: {response.text[:300]}")
+
+    return result
+
+
+def _run_child(mode, args, warmup):
+    env = dict(os.environ, RISK_API_WARMUP="1" if warmup else "0")
+    command = [
+        sys.executable, "-m", "benchmarks.bench_startup", "--child", mode,
+        "--assets", str(args.assets), "--periods", str(args.periods)
+    ]
+    output = subprocess.run(command, cwd=BACKEND_DIR, env=env, capture_output=True, text=True)
+    if output.returncode != 0:
+        message = output.stderr.strip().splitlines()[-1] if output.stderr.strip() else "no output"
+        sys.exit(f"{mode} child (warm-up {'on' if warmup else 'off'}) failed: {message}")
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--assets", type=int, default=10)
+    parser.add_argument("--periods", type=int, default=500)
+    parser.add_argument("--child", choices=["import", "requests"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child == "import":
+        print(json.dumps(_child_import()))
+        return
+    if args.child == "requests":
+        print(json.dumps(_child_requests(args.assets, args.periods)))
+        return
+
+    imports = [_run_child("import", args, warmup=False) for _ in range(args.repeats)]
+    print(f"assets={args.assets} periods={args.periods} repeats={args.repeats}")
+    print(f"import main: {statistics.median(r['import_ms'] for r in imports):.1f} ms (median)")
+    print(f"heavy modules loaded at import: {imports[0]['heavy_modules_loaded'] or 'none'}")
+
+    columns = ["import_ms", "ready_wait_ms", "first_request_ms", "second_request_ms"]
+    print(f"{'warm-up':<10}" + "".join(f"{c:>20}" for c in columns))
+    for warmup in (False, True):
+        runs = [_run_child("requests", args, warmup) for _ in range(args.repeats)]
+        medians = [statistics.median(r[c] for r in runs) for c in columns]
+        print(f"{'on' if warmup else 'off':<10}" + "".join(f"{m:>20.1f}" for m in medians))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,408 @@
+"""
+HTTP load test across the six analytics routes: /api/risk-report, /api/optimize,
+/api/stress-test, /api/var-cvar, /api/risk-summary and /api/risk-history.
+
+Payloads are synthetic (random universe size N, history length T and
+weights) and generated up front, so the timed loop only sends requests.
+By default the app runs in-process through httpx's ASGI transport (fully
+offline). Pass --url to target a running server, e.g. a local
+`uvicorn main:app --workers 4`. Add --server-pid to sample that server's
+RSS, which needs psutil.
+
+Payloads repeat across requests (--pool-size per route), so identical
+concurrent requests to coalesced routes share one computation; the number
+merged during the timed run (from /api/metrics/coalescing) is recorded with
+the results. Pass --unique-payloads to make every request body distinct.
+
+Results (throughput, p50/p95/p99 latency, error rate, coalescing and peak RSS
+per endpoint) are printed and written as JSON to --output. Compare two runs
+with --compare.
+
+Run from backend/:
+    python -m benchmarks.load_test --concurrency 16 --requests 2000 --output before.json
+    python -m benchmarks.load_test --url http://127.0.0.1:8000 --server-pid 1234 --duration 60
+    python -m benchmarks.load_test --compare before.json after.json
+"""
+import argparse
+import asyncio
+import json
+import platform
+import resource
+import sys
+import time
+
+import httpx
+import numpy as np
+
+ROUTES = ["risk-report", "optimize", "stress-test", "var-cvar", "risk-summary", "risk-history"]
+
+
+# --- Payloads ---
+
+def _prices(rng, n_assets, n_periods):
+    returns = rng.normal(0.0003, 0.012, size=(n_periods, n_assets)) + rng.normal(0, 0.006, size=(n_periods, 1))
+    prices = 100 * np.exp(np.cumsum(returns, axis=0))
+    return {f"ASSET{i}": prices[:, i].round(4).tolist() for i in range(n_assets)}
+
+
+def _returns(rng, n_assets, n_periods):
+    returns = rng.normal(0.0003, 0.012, size=(n_periods, n_assets)) + rng.normal(0, 0.006, size=(n_periods, 1))
+    return {f"ASSET{i}": returns[:, i].round(6).tolist() for i in range(n_assets)}
+
+
+def _weights(rng, n_assets):
+    return rng.dirichlet(np.ones(n_assets)).round(6).tolist()
+
+
+def _report_config(rng):
+    return {
+        "freq": "daily",
+        "confidence_level": float(rng.choice([0.95, 0.99])),
+        "window": int(rng.choice([20, 60])),
+        "risk_free_rate": 0.02,
+        "high_vol_threshold": 0.03,
+        "low_vol_threshold": 0.01
+    }
+
+
+def make_payload(route, rng, n_assets, n_periods):
+    if route in ("risk-report", "risk-summary"):
+        return {"prices": _prices(rng, n_assets, n_periods), "weights": _weights(rng, n_assets), **_report_config(rng)}
+    if route == "risk-history":
+        config = _report_config(rng)
+        config.pop("confidence_level")
+        return {"prices": _prices(rng, n_assets, n_periods), **config}
+    if route == "optimize":
+        return {"returns": _returns(rng, n_assets, n_periods), "freq": "daily", "risk_free_rate": 0.02}
+    if route == "var-cvar":
+        return {"returns": _returns(rng, n_assets, n_periods), "confidence_level": 0.95}
+    if route == "stress-test":
+        prices = _prices(rng, n_assets, n_periods)
+        shocked = rng.choice(list(prices), size=max(1, n_assets // 3), replace=False)
+        return {
+            "prices": prices,
+            "weights": _weights(rng, n_assets),
+            "shock": {asset: float(rng.uniform(-0.3, -0.05)) for asset in shocked}
+        }
+    raise ValueError(f"Unknown route: {route}")
+
+
+def build_payload_pool(routes, args):
+    rng = np.random.default_rng(args.seed)
+    pool = {}
+    for route in routes:
+        pool[route] = []
+        for _ in range(args.pool_size):
+            n_assets = int(rng.integers(args.min_assets, args.max_assets + 1))
+            n_periods = int(rng.integers(args.min_periods, args.max_periods + 1))
+            pool[route].append(json.dumps(make_payload(route, rng, n_assets, n_periods)).encode())
+    return pool
+
+
+def unique_body(body, n):
+    """
+    Make a payload's bytes unique without changing the request: trailing JSON
+    whitespace encoding n in binary (space = 0, tab = 1). Coalescing keys on
+    the raw body, so tagged requests are never merged.
+    """
+    return body + format(n, "b").replace("0", " ").replace("1", "\t").encode()
+
+
+# --- Load generation ---
+
+class RSSSampler:
+    """
+    Peak RSS of a server process (psutil), polled in the background.
+    """
+
+    def __init__(self, pid, interval=0.1):
+        import psutil
+        self._process = psutil.Process(pid)
+        self._interval = interval
+        self.peak = 0
+
+    async def run(self):
+        while True:
+            self.peak = max(self.peak, self._process.memory_info().rss)
+            await asyncio.sleep(self._interval)
+
+
+async def _worker(client, routes, pool, rng, deadline, remaining, sent, unique, records):
+    headers = {"content-type": "application/json"}
+    while time.perf_counter() < deadline:
+        if remaining is not None:
+            if remaining[0] <= 0:
+                return
+            remaining[0] -= 1
+
+        route = routes[int(rng.integers(len(routes)))]
+        body = pool[route][int(rng.integers(len(pool[route])))]
+        if unique:
+            body = unique_body(body, sent[0])
+            sent[0] += 1
+        records.append(await _timed_post(client, route, body, headers))
+
+
+async def _coalescing_stats(client):
+    """
+    Server coalescing counters, or None if the target does not expose them.
+    """
+    try:
+        response = await client.get("/api/metrics/coalescing")
+        return response.json()["endpoints"] if response.status_code == 200 else None
+    except Exception:
+        return None
+
+
+def coalescing_delta(before, after):
+    """
+    Per-endpoint executed/merged counts between two /api/metrics/coalescing snapshots.
+    """
+    if before is None or after is None:
+        return None
+    delta = {}
+    for name, counts in after.items():
+        start = before.get(name, {})
+        delta[name] = {key: value - start.get(key, 0) for key, value in counts.items()}
+    return delta
+
+
+async def _timed_post(client, route, body, headers):
+    """
+    Send one request; any failure (HTTP error status, transport error or
+    exception) is recorded as an error rather than aborting the run.
+
+    Returns:
+        tuple: (route, seconds, ok, error message or None)
+    """
+    start = time.perf_counter()
+    try:
+        response = await client.post(f"/api/{route}", content=body, headers=headers)
+        ok = response.status_code < 400
+        error = None if ok else f"HTTP {response.status_code}: {response.text[:200]}"
+    except Exception as e:
+        ok, error = False, f"{type(e).__name__}: {e}"
+    return route, time.perf_counter() - start, ok, error
+
+
+async def run_load(args, routes, pool):
+    if args.url:
+        client = httpx.AsyncClient(base_url=args.url, timeout=args.timeout)
+        lifespan = None
+    else:
+        from main import app, lifespan as app_lifespan
+        # Server exceptions become 500 responses (counted as errors) instead of propagating
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        client = httpx.AsyncClient(transport=transport, base_url="http://loadtest", timeout=args.timeout)
+        lifespan = app_lifespan(app)
+
+    sampler = RSSSampler(args.server_pid) if args.server_pid else None
+    sampler_task = asyncio.create_task(sampler.run()) if sampler else None
+
+    records, warmup, coalescing = [], [], None
+    headers = {"content-type": "application/json"}
+    try:
+        if lifespan is not None:
+            await lifespan.__aenter__()
+
+        # One warm-up request per route, reported separately from the timed run
+        for route in routes:
+            warmup.append(await _timed_post(client, route, pool[route][0], headers))
+
+        deadline = time.perf_counter() + (args.duration if args.duration else float("inf"))
+        remaining = None if args.duration else [args.requests]
+        seeds = np.random.SeedSequence(args.seed).spawn(args.concurrency)
+        sent = [0]
+        coalescing_before = await _coalescing_stats(client)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(
+            _worker(client, routes, pool, np.random.default_rng(s), deadline, remaining, sent,
+                    args.unique_payloads, records)
+            for s in seeds
+        ))
+        elapsed = time.perf_counter() - start
+        coalescing = coalescing_delta(coalescing_before, await _coalescing_stats(client))
+    finally:
+        if sampler_task is not None:
+            sampler_task.cancel()
+        if lifespan is not None:
+            await lifespan.__aexit__(None, None, None)
+        await client.aclose()
+
+    if sampler is not None:
+        peak_rss, rss_source = sampler.peak, "server"
+    elif not args.url:
+        # ru_maxrss is KiB on Linux, bytes on macOS
+        scale = 1 if sys.platform == "darwin" else 1024
+        peak_rss, rss_source = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale, "in-process"
+    else:
+        peak_rss, rss_source = None, None
+
+    return records, warmup, elapsed, peak_rss, rss_source, coalescing
+
+
+# --- Reporting ---
+
+def _summarize(latencies, ok, elapsed):
+    latencies = np.asarray(latencies) * 1000
+    n = len(latencies)
+    if n == 0:
+        return {"requests": 0}
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+    errors = int(n - np.sum(ok))
+    return {
+        "requests": n,
+        "errors": errors,
+        "error_rate": errors / n,
+        "throughput_rps": n / elapsed,
+        "mean_ms": float(latencies.mean()),
+        "p50_ms": float(p50),
+        "p95_ms": float(p95),
+        "p99_ms": float(p99),
+        "max_ms": float(latencies.max())
+    }
+
+
+def summarize(records, elapsed, routes, max_error_samples=3):
+    endpoints = {}
+    for route in routes:
+        rows = [r for r in records if r[0] == route]
+        endpoints[route] = _summarize([r[1] for r in rows], [r[2] for r in rows], elapsed)
+        errors = list(dict.fromkeys(r[3] for r in rows if r[3] is not None))
+        if errors:
+            endpoints[route]["error_samples"] = errors[:max_error_samples]
+    overall = _summarize([r[1] for r in records], [r[2] for r in records], elapsed)
+    return endpoints, overall
+
+
+def print_results(result):
+    print(f"target={result['config']['target']} concurrency={result['config']['concurrency']} "
+          f"elapsed={result['elapsed_s']:.1f}s")
+    for route, warm in result["warmup"].items():
+        if not warm["ok"]:
+            print(f"warm-up {route} failed: {warm['error']}")
+    print(f"{'endpoint':<16}{'requests':>10}{'rps':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>10}")
+    for name, stats in [*result["endpoints"].items(), ("overall", result["overall"])]:
+        if not stats["requests"]:
+            continue
+        print(f"{name:<16}{stats['requests']:>10}{stats['throughput_rps']:>10.1f}{stats['p50_ms']:>10.1f}"
+              f"{stats['p95_ms']:>10.1f}{stats['p99_ms']:>10.1f}{stats['error_rate']:>10.2%}")
+    for name, stats in result["endpoints"].items():
+        for error in stats.get("error_samples", []):
+            print(f"{name} error: {error}")
+    if result["coalescing"] is not None:
+        for name, counts in result["coalescing"].items():
+            if counts.get("merged"):
+                print(f"{name}: {counts['merged']} of {counts['merged'] + counts['executed']} requests "
+                      f"coalesced into another's computation")
+    elif not result["config"]["unique_payloads"]:
+        print("coalescing counters unavailable; repeated payloads may have been merged")
+    if result["peak_rss_bytes"] is not None:
+        print(f"peak RSS ({result['rss_source']}): {result['peak_rss_bytes'] / 1024 ** 2:.1f} MiB")
+
+
+def compare(old_path, new_path):
+    with open(old_path) as f:
+        old = json.load(f)
+    with open(new_path) as f:
+        new = json.load(f)
+
+    metrics = ["throughput_rps", "p50_ms", "p95_ms", "p99_ms", "error_rate"]
+    print(f"{old.get('label') or old_path} -> {new.get('label') or new_path}")
+    print(f"{'endpoint':<16}{'metric':<16}{'old':>12}{'new':>12}{'change':>10}")
+    names = [n for n in old["endpoints"] if n in new["endpoints"]] + ["overall"]
+    for name in names:
+        before = old["overall"] if name == "overall" else old["endpoints"][name]
+        after = new["overall"] if name == "overall" else new["endpoints"][name]
+        if not before.get("requests") or not after.get("requests"):
+            continue
+        for metric in metrics:
+            a, b = before[metric], after[metric]
+            change = f"{(b - a) / a:+.1%}" if a else "n/a"
+            print(f"{name:<16}{metric:<16}{a:>12.3f}{b:>12.3f}{change:>10}")
+
+    if old.get("peak_rss_bytes") and new.get("peak_rss_bytes"):
+        a, b = old["peak_rss_bytes"] / 1024 ** 2, new["peak_rss_bytes"] / 1024 ** 2
+        print(f"{'overall':<16}{'peak_rss_mib':<16}{a:>12.1f}{b:>12.1f}{(b - a) / a:>+10.1%}")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="Base URL of a running server; in-process ASGI app if omitted")
+    parser.add_argument("--server-pid", type=int, help="Server PID for peak RSS sampling (needs psutil)")
+    parser.add_argument("--routes", nargs="+", choices=ROUTES, default=ROUTES)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=500, help="Total requests (ignored with --duration)")
+    parser.add_argument("--duration", type=float, help="Run for this many seconds instead of a request count")
+    parser.add_argument("--min-assets", type=int, default=3)
+    parser.add_argument("--max-assets", type=int, default=30)
+    parser.add_argument("--min-periods", type=int, default=250)
+    parser.add_argument("--max-periods", type=int, default=1000)
+    parser.add_argument("--pool-size", type=int, default=20, help="Distinct payloads per route")
+    parser.add_argument("--unique-payloads", action="store_true",
+                        help="Make every request body unique so no requests are coalesced")
+    parser.add_argument("--timeout", type=float, default=120.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--label", help="Name for this run (e.g. a version or commit)")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), help="Compare two result files and exit")
+    return parser
+
+
+def run_load_test(args) -> dict:
+    """
+    Generate payloads, run the load and summarize it.
+
+    Returns:
+        dict: JSON-ready results (see --output)
+    """
+    pool = build_payload_pool(args.routes, args)
+    records, warmup, elapsed, peak_rss, rss_source, coalescing = asyncio.run(run_load(args, args.routes, pool))
+    endpoints, overall = summarize(records, elapsed, args.routes)
+
+    return {
+        "label": args.label,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "config": {
+            "target": args.url or "in-process",
+            "routes": args.routes,
+            "concurrency": args.concurrency,
+            "requests": None if args.duration else args.requests,
+            "duration": args.duration,
+            "assets": [args.min_assets, args.max_assets],
+            "periods": [args.min_periods, args.max_periods],
+            "pool_size": args.pool_size,
+            "unique_payloads": args.unique_payloads,
+            "seed": args.seed
+        },
+        "elapsed_s": elapsed,
+        "warmup": {
+            route: {"ms": seconds * 1000, "ok": ok, "error": error}
+            for route, seconds, ok, error in warmup
+        },
+        "endpoints": endpoints,
+        "overall": overall,
+        "coalescing": coalescing,
+        "peak_rss_bytes": peak_rss,
+        "rss_source": rss_source
+    }
+
+
+def main():
+    args = build_parser().parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    result = run_load_test(args)
+    print_results(result)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(result, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
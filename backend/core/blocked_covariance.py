@@ -0,0 +1,203 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_MAX_MEMORY_BYTES = 256 * 1024 ** 2
+
+
+def _resolve_block_rows(n_cols: int, max_memory_bytes: int, block_rows: int | None) -> int:
+    """
+    Rows per block so that two N x N float64 accumulators plus a block and
+    its centered copy fit in `max_memory_bytes`.
+    """
+    if block_rows is not None:
+        if block_rows < 1:
+            raise ValueError("block_rows must be a positive integer.")
+        return block_rows
+
+    fixed = 2 * 8 * n_cols ** 2
+    per_row = 2 * 8 * n_cols
+    if max_memory_bytes <= fixed + per_row:
+        raise ValueError(
+            f"max_memory_bytes={max_memory_bytes} is too small for {n_cols} assets "
+            f"(need more than {fixed + per_row} bytes)."
+        )
+    return int((max_memory_bytes - fixed) // per_row)
+
+
+def _parquet_value_columns(schema) -> list:
+    """
+    Numeric data columns of a Parquet schema, excluding the pandas index
+    columns recorded in its metadata (e.g. a named DatetimeIndex).
+    """
+    import pyarrow.types as pat
+
+    index_columns = set()
+    pandas_metadata = schema.pandas_metadata
+    if pandas_metadata:
+        index_columns = {c for c in pandas_metadata.get("index_columns", []) if isinstance(c, str)}
+
+    names, rejected = [], []
+    for field in schema:
+        if field.name in index_columns or field.name.startswith("__index_level_"):
+            continue
+        if pat.is_integer(field.type) or pat.is_floating(field.type):
+            names.append(field.name)
+        else:
+            rejected.append(f"{field.name} ({field.type})")
+
+    if rejected:
+        raise ValueError(
+            f"Non-numeric columns in returns file: {', '.join(rejected)}. "
+            "Pass `columns` to select the return columns."
+        )
+    return names
+
+
+def _open_source(source, columns: list | None) -> tuple[list, int, object]:
+    """
+    Normalize a returns source into (column names, column count, block reader).
+    The reader takes a block size and yields 2-D float64 row blocks.
+    """
+    if isinstance(source, (str, Path)):
+        path = Path(source)
+        if path.suffix.lower() == ".npy":
+            source = np.load(path, mmap_mode="r")
+        elif path.suffix.lower() in {".parquet", ".pq"}:
+            try:
+                import pyarrow.parquet as pq
+            except ImportError as e:
+                raise ImportError("Reading Parquet panels requires pyarrow.") from e
+
+            parquet = pq.ParquetFile(path)
+            names = columns or _parquet_value_columns(parquet.schema_arrow)
+
+            def read_parquet(block_rows):
+                for batch in parquet.iter_batches(batch_size=block_rows, columns=names):
+                    yield np.column_stack([
+                        batch.column(i).to_numpy(zero_copy_only=False) for i in range(batch.num_columns)
+                    ]).astype(np.float64, copy=False)
+
+            return names, len(names), read_parquet
+        else:
+            raise ValueError(f"Unsupported returns file type: {path.name}")
+
+    if isinstance(source, pd.DataFrame):
+        columns = columns or list(source.columns)
+        source = source.to_numpy()
+
+    array = np.asarray(source)
+    if array.ndim != 2:
+        raise ValueError("Returns source must be two-dimensional (rows x assets).")
+    names = columns or list(range(array.shape[1]))
+
+    def read_array(block_rows):
+        for start in range(0, array.shape[0], block_rows):
+            yield np.asarray(array[start:start + block_rows], dtype=np.float64)
+
+    return names, array.shape[1], read_array
+
+
+def accumulate_moments(
+    source,
+    columns: list | None = None,
+    max_memory_bytes: int = DEFAULT_MAX_MEMORY_BYTES,
+    block_rows: int | None = None,
+    validate: bool = True
+) -> tuple[int, np.ndarray, np.ndarray, list]:
+    """
+    Stream row blocks and accumulate count, mean and centered cross-products.
+
+    Each block's centered X^T X is merged into the running total with the
+    pairwise (Chan et al.) update, which stays accurate for long panels
+    where the raw sum of squares would lose precision:
+
+        M2 = M2_a + M2_b + delta delta^T * n_a n_b / (n_a + n_b)
+
+    Rows containing any NaN are skipped (complete-case statistics).
+
+    Returns:
+        tuple: (row count, mean (N,), centered cross-product matrix (N, N), column names)
+    """
+    names, n_cols, read_blocks = _open_source(source, columns)
+    rows = _resolve_block_rows(n_cols, max_memory_bytes, block_rows)
+
+    count = 0
+    mean = np.zeros(n_cols)
+    m2 = np.zeros((n_cols, n_cols))
+
+    for block in read_blocks(rows):
+        nan_rows = np.isnan(block).any(axis=1)
+        if nan_rows.any():
+            block = block[~nan_rows]
+        if validate and (block < -1).any():
+            raise ValueError("Invalid return values: Less than -100% found.")
+
+        n_block = block.shape[0]
+        if n_block == 0:
+            continue
+
+        block_mean = block.mean(axis=0)
+        centered = block - block_mean
+        block_m2 = centered.T @ centered
+
+        total = count + n_block
+        delta = block_mean - mean
+        mean += delta * (n_block / total)
+        m2 += block_m2
+        m2 += np.outer(delta, delta) * (count * n_block / total)
+        count = total
+
+    return count, mean, m2, names
+
+
+def compute_blocked_covariance_matrix(
+    source,
+    columns: list | None = None,
+    max_memory_bytes: int = DEFAULT_MAX_MEMORY_BYTES,
+    block_rows: int | None = None,
+    validate: bool = True
+) -> pd.DataFrame:
+    """
+    Out-of-core sample covariance matrix (ddof=1), matching `returns.cov()`
+    on NaN-free data.
+
+    Parameters:
+        source: np.ndarray / np.memmap, path to a .npy or Parquet file, or a DataFrame
+        columns (list): Asset names (and, for Parquet, the columns to read)
+        max_memory_bytes (int): Memory budget used to size row blocks
+        block_rows (int): Explicit rows per block (overrides the budget)
+        validate (bool): Reject returns below -100%, checked block by block
+
+    Returns:
+        pd.DataFrame: Covariance matrix
+    """
+    count, _, m2, names = accumulate_moments(source, columns, max_memory_bytes, block_rows, validate)
+    if count < 2:
+        raise ValueError("At least two complete rows are required.")
+
+    return pd.DataFrame(m2 / (count - 1), index=names, columns=names)
+
+
+def compute_blocked_correlation_matrix(
+    source,
+    columns: list | None = None,
+    max_memory_bytes: int = DEFAULT_MAX_MEMORY_BYTES,
+    block_rows: int | None = None,
+    validate: bool = True
+) -> pd.DataFrame:
+    """
+    Out-of-core correlation matrix, matching `returns.corr()` on NaN-free data.
+
+    Returns:
+        pd.DataFrame: Correlation matrix
+    """
+    cov = compute_blocked_covariance_matrix(source, columns, max_memory_bytes, block_rows, validate)
+    std = np.sqrt(np.diag(cov.values))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        corr = cov.values / np.outer(std, std)
+    np.fill_diagonal(corr, np.where(std > 0, 1.0, np.nan))
+
+    return pd.DataFrame(np.clip(corr, -1.0, 1.0), index=cov.index, columns=cov.columns)
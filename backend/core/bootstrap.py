@@ -0,0 +1,205 @@
+import math
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from core.frequency import get_annualization_factor
+from core.parallel import _MP_CONTEXT, _WORKER, _create_shared_array, _init_worker
+
+DEFAULT_MAX_MEMORY_BYTES = 256 * 1024 ** 2
+STATISTICS = ["sharpe_ratio", "sortino_ratio", "historical_var", "historical_cvar"]
+
+
+def stationary_bootstrap_indices(
+    n_periods: int,
+    n_samples: int,
+    mean_block: float,
+    rng: np.random.Generator
+) -> np.ndarray:
+    """
+    Politis-Romano stationary bootstrap resample indices, all samples at once.
+
+    A new block starts with probability 1/mean_block at each period; within a
+    block the index advances by one (wrapping around). The block start in
+    effect at each period is found with a running maximum, so there is no
+    Python loop over time.
+
+    Returns:
+        np.ndarray: (n_samples, n_periods) integer index matrix
+    """
+    t = np.arange(n_periods)
+    new_block = rng.random((n_samples, n_periods)) < 1.0 / mean_block
+    new_block[:, 0] = True
+    starts = rng.integers(0, n_periods, size=(n_samples, n_periods))
+
+    last_start = np.maximum.accumulate(np.where(new_block, t, 0), axis=1)
+    offset = np.take_along_axis(starts, last_start, axis=1)
+    return (offset + t - last_start) % n_periods
+
+
+def circular_block_bootstrap_indices(
+    n_periods: int,
+    n_samples: int,
+    block_size: int,
+    rng: np.random.Generator
+) -> np.ndarray:
+    """
+    Circular moving-block bootstrap resample indices with fixed block length.
+
+    Returns:
+        np.ndarray: (n_samples, n_periods) integer index matrix
+    """
+    n_blocks = -(-n_periods // block_size)
+    starts = rng.integers(0, n_periods, size=(n_samples, n_blocks, 1))
+    idx = (starts + np.arange(block_size)).reshape(n_samples, -1)[:, :n_periods]
+    return idx % n_periods
+
+
+def _batched_statistics(
+    values: np.ndarray,
+    idx: np.ndarray,
+    risk_free_rate: float,
+    annual_factor: int,
+    confidence_level: float
+) -> np.ndarray:
+    """
+    Sharpe, Sortino, historical VaR and CVaR of every asset in every resample,
+    computed as reductions over the (samples, periods, assets) array with the
+    same conventions as core.risk_metrics / core.var_cvar.
+
+    Returns:
+        np.ndarray: (len(STATISTICS), samples, assets)
+    """
+    sample = values[idx]
+    n_periods = sample.shape[1]
+
+    mean = sample.mean(axis=1)
+    std = sample.std(axis=1, ddof=1)
+    excess = (mean - risk_free_rate / annual_factor) * annual_factor
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sharpe = excess / (std * np.sqrt(annual_factor))
+
+        negative = sample < 0
+        downside = np.where(negative, sample, 0.0)
+        n_negative = negative.sum(axis=1)
+        downside_mean = downside.sum(axis=1) / n_negative
+        downside_var = (downside ** 2).sum(axis=1) / n_negative - downside_mean ** 2
+        sortino = excess / (np.sqrt(np.maximum(downside_var, 0.0)) * np.sqrt(annual_factor))
+
+    kth = math.ceil((1 - confidence_level) * (n_periods - 1))
+    var = np.partition(sample, kth, axis=1)[:, kth, :]
+    tail = sample <= var[:, None, :]
+    cvar = np.where(tail, sample, 0.0).sum(axis=1) / tail.sum(axis=1)
+
+    return np.stack([sharpe, sortino, var, cvar])
+
+
+def _bootstrap_chunk(values, n_samples, seed, method, block_size, risk_free_rate, annual_factor, confidence_level):
+    rng = np.random.default_rng(seed)
+    n_periods = values.shape[0]
+    if method == "stationary":
+        idx = stationary_bootstrap_indices(n_periods, n_samples, block_size, rng)
+    else:
+        idx = circular_block_bootstrap_indices(n_periods, n_samples, block_size, rng)
+    return _batched_statistics(values, idx, risk_free_rate, annual_factor, confidence_level)
+
+
+def _bootstrap_chunk_shared(*args):
+    return _bootstrap_chunk(_WORKER["values"], *args)
+
+
+def bootstrap_confidence_intervals(
+    returns: pd.DataFrame,
+    n_samples: int = 1000,
+    block_size: int = 20,
+    method: str = "stationary",
+    interval: float = 0.95,
+    risk_free_rate: float = 0.0,
+    freq: str = 'daily',
+    confidence_level: float = 0.95,
+    seed: int = 0,
+    n_workers: int = 1,
+    max_memory_bytes: int = DEFAULT_MAX_MEMORY_BYTES
+) -> dict:
+    """
+    Block-bootstrap confidence intervals for Sharpe, Sortino, historical VaR
+    and historical CVaR of every asset.
+
+    Resamples are generated as index matrices and evaluated in chunks sized
+    to `max_memory_bytes`. Each chunk has its own child seed from
+    SeedSequence(seed), so results are identical for any `n_workers`; with
+    n_workers > 1 chunks run in a process pool over the shared-memory
+    return matrix from core.parallel.
+
+    Parameters:
+        returns (pd.DataFrame): DataFrame of returns (no NaNs)
+        n_samples (int): Bootstrap resamples
+        block_size (int): Mean (stationary) or fixed (circular) block length
+        method (str): 'stationary' or 'circular'
+        interval (float): Confidence interval coverage, e.g. 0.95
+        risk_free_rate (float): Annualized risk-free rate
+        freq (str): Data frequency
+        confidence_level (float): VaR/CVaR confidence level
+        seed (int): Base seed
+        n_workers (int): Worker processes
+        max_memory_bytes (int): Memory budget per chunk
+
+    Returns:
+        dict: statistic -> asset -> {estimate, lower, upper, std_error}
+    """
+    if method not in {"stationary", "circular"}:
+        raise ValueError("method must be 'stationary' or 'circular'")
+    if returns.isna().any().any():
+        raise ValueError("Returns must not contain missing values.")
+
+    annual_factor = get_annualization_factor(freq)
+    values = returns.to_numpy(dtype=np.float64)
+    n_periods, n_assets = values.shape
+
+    # Resampled array plus a few same-sized temporaries per resample
+    per_sample = n_periods * n_assets * 8 * 4
+    chunk = max(1, min(n_samples, max_memory_bytes // per_sample))
+    sizes = [min(chunk, n_samples - start) for start in range(0, n_samples, chunk)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    params = (method, block_size, risk_free_rate, annual_factor, confidence_level)
+
+    if n_workers > 1 and len(sizes) > 1:
+        shm, shared = _create_shared_array((n_periods, n_assets))
+        try:
+            shared[:] = values
+            with ProcessPoolExecutor(
+                max_workers=n_workers,
+                mp_context=_MP_CONTEXT,
+                initializer=_init_worker,
+                initargs=(shm.name, None, (n_periods, n_assets), returns.index, returns.columns)
+            ) as pool:
+                futures = [pool.submit(_bootstrap_chunk_shared, size, s, *params) for size, s in zip(sizes, seeds)]
+                results = [f.result() for f in futures]
+        finally:
+            del shared
+            shm.close()
+            shm.unlink()
+    else:
+        results = [_bootstrap_chunk(values, size, s, *params) for size, s in zip(sizes, seeds)]
+
+    stats = np.concatenate(results, axis=1)
+    estimate = _batched_statistics(values, np.arange(n_periods)[None], risk_free_rate, annual_factor, confidence_level)[:, 0]
+
+    alpha = (1 - interval) / 2
+    lower = np.nanquantile(stats, alpha, axis=1)
+    upper = np.nanquantile(stats, 1 - alpha, axis=1)
+    std_error = np.nanstd(stats, axis=1, ddof=1)
+
+    return {
+        name: {
+            asset: {
+                "estimate": float(estimate[s, j]),
+                "lower": float(lower[s, j]),
+                "upper": float(upper[s, j]),
+                "std_error": float(std_error[s, j])
+            }
+            for j, asset in enumerate(returns.columns)
+        }
+        for s, name in enumerate(STATISTICS)
+    }
@@ -1,5 +1,7 @@
 import pandas as pd
 import numpy as np
+from core.frequency import get_annualization_factor
+from core.returns import select_returns
 
 def compute_covariance_matrix(returns: pd.DataFrame) -> pd.DataFrame:
     """
@@ -22,23 +24,14 @@ def compute_annualized_covariance(returns: pd.DataFrame, freq: str = 'daily') ->
     Annualize the covariance matrix of returns.
 
     Parameters:
-        returns (pd.DataFrame): DataFrame of returns
-        freq (str): Frequency of data - 'daily', 'weekly', 'monthly'
+        returns (pd.DataFrame | ReturnPyramid): Returns, or a pyramid to take the `freq` level from
+        freq (str): Frequency of data - 'daily', 'weekly', 'monthly', 'quarterly'
 
     Returns:
         pd.DataFrame: Annualized covariance matrix
     """
-    freq_map = {
-        'daily': 252,
-        'weekly': 52,
-        'monthly': 12
-    }
-
-    if freq not in freq_map:
-        raise ValueError(f"Unsupported frequency: {freq}. Choose from {list(freq_map.keys())}")
-
-    cov_matrix = compute_covariance_matrix(returns)
-    annual_factor = freq_map[freq]
+    annual_factor = get_annualization_factor(freq)
+    cov_matrix = compute_covariance_matrix(select_returns(returns, freq))
 
     return cov_matrix * annual_factor
 
@@ -0,0 +1,206 @@
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+PORTFOLIO_COLUMN = "portfolio"
+
+
+def compute_wealth_index(prices: pd.DataFrame, weights: np.ndarray | None = None) -> pd.DataFrame:
+    """
+    Build wealth indices (growth of 1 unit) for each asset and, optionally,
+    the weighted portfolio.
+
+    Parameters:
+        prices (pd.DataFrame): Price data
+        weights (np.ndarray): Portfolio weights (aligned with prices.columns)
+
+    Returns:
+        pd.DataFrame: Wealth index per asset, plus a "portfolio" column if weights are given
+    """
+    values = prices.to_numpy(dtype=float)
+    if (values <= 0).any():
+        raise ValueError("Prices must be strictly positive to compute drawdowns.")
+
+    wealth = pd.DataFrame(values / values[0], index=prices.index, columns=prices.columns)
+
+    if weights is not None:
+        if len(weights) != prices.shape[1]:
+            raise ValueError("Number of weights must match number of assets.")
+        simple_returns = values[1:] / values[:-1] - 1
+        port_returns = simple_returns @ np.asarray(weights, dtype=float)
+        wealth[PORTFOLIO_COLUMN] = np.concatenate([[1.0], np.cumprod(1 + port_returns)])
+
+    return wealth
+
+
+def compute_drawdown_series(wealth: pd.DataFrame) -> pd.DataFrame:
+    """
+    Drawdown from the running peak: W_t / max_{s<=t} W_s - 1
+
+    Returns:
+        pd.DataFrame: Drawdown (<= 0) for each column
+    """
+    values = wealth.to_numpy(dtype=float)
+    peak = np.maximum.accumulate(values, axis=0)
+    return pd.DataFrame(values / peak - 1, index=wealth.index, columns=wealth.columns)
+
+
+def extract_drawdown_episodes(wealth: pd.DataFrame) -> pd.DataFrame:
+    """
+    Extract every drawdown episode of every column in a single vectorized pass.
+
+    Columns are laid out end to end (column-major) with a padding row on each
+    side, so episode starts/ends of all assets come out of one diff of the
+    underwater mask and trough depths out of one segmented reduction.
+
+    Returns:
+        pd.DataFrame with columns: Asset, Peak, Trough, Recovery, Recovered,
+        Depth, Decline Periods, Recovery Periods, Underwater Periods
+        (Recovery is only meaningful where Recovered is True)
+    """
+    values = wealth.to_numpy(dtype=float)
+    n_rows, n_cols = values.shape
+    drawdown = values / np.maximum.accumulate(values, axis=0) - 1
+
+    padded = np.zeros((n_rows + 2, n_cols))
+    padded[1:-1] = drawdown
+    flat_dd = padded.ravel(order="F")
+    underwater = (flat_dd < 0).astype(np.int8)
+
+    edges = np.diff(underwater)
+    starts = np.flatnonzero(edges == 1) + 1
+    ends = np.flatnonzero(edges == -1) + 1
+
+    columns = ["Asset", "Peak", "Trough", "Recovery", "Recovered", "Depth",
+               "Decline Periods", "Recovery Periods", "Underwater Periods"]
+    if len(starts) == 0:
+        return pd.DataFrame(columns=columns)
+
+    stride = n_rows + 2
+    col_idx = starts // stride
+    start_row = starts % stride - 1
+    end_row = ends % stride - 1
+
+    # Minimum over [start_i, start_{i+1}) only sees this episode's negatives
+    # followed by non-negative rows, so it is the episode's depth.
+    depth = np.minimum.reduceat(flat_dd, starts)
+
+    segment = np.zeros(len(flat_dd), dtype=np.int64)
+    segment[starts] = 1
+    segment = np.cumsum(segment) - 1
+    in_segment = segment >= 0
+    hits = np.flatnonzero(in_segment & (flat_dd == depth[np.where(in_segment, segment, 0)]))
+    _, first_hit = np.unique(segment[hits], return_index=True)
+    trough_row = hits[first_hit] % stride - 1
+
+    peak_row = start_row - 1
+    recovered = end_row < n_rows
+    underwater_end = np.where(recovered, end_row, n_rows - 1)
+
+    index = wealth.index
+    return pd.DataFrame({
+        "Asset": wealth.columns[col_idx],
+        "Peak": index[peak_row],
+        "Trough": index[trough_row],
+        "Recovery": index[np.where(recovered, end_row, 0)],
+        "Recovered": recovered,
+        "Depth": depth,
+        "Decline Periods": trough_row - peak_row,
+        "Recovery Periods": np.where(recovered, end_row - trough_row, -1),
+        "Underwater Periods": underwater_end - peak_row
+    })
+
+
+def compute_rolling_max_drawdown(
+    wealth: pd.DataFrame,
+    window: int = 252,
+    max_memory_bytes: int = 64 * 1024 ** 2
+) -> pd.DataFrame:
+    """
+    Rolling maximum drawdown: the worst peak-to-trough decline with both the
+    peak and the trough inside each trailing window (expanding until the
+    first full window).
+
+    Every window is evaluated directly (O(T·W) per column) on a strided view,
+    in column chunks sized to `max_memory_bytes`.
+
+    Returns:
+        pd.DataFrame: Rolling max drawdown (<= 0) for each column
+    """
+    values = wealth.to_numpy(dtype=float)
+    n_rows, n_cols = values.shape
+    window = min(window, n_rows) if n_rows else window
+    result = np.empty_like(values)
+    if n_rows == 0:
+        return pd.DataFrame(result, index=wealth.index, columns=wealth.columns)
+
+    # Repeating the first value in front turns the first W-1 windows into expanding ones
+    padded = np.concatenate([np.repeat(values[:1], window - 1, axis=0), values])
+
+    per_column = n_rows * window * 8 * 2
+    chunk = max(1, int(max_memory_bytes // per_column))
+    for start in range(0, n_cols, chunk):
+        windows = sliding_window_view(padded[:, start:start + chunk], window, axis=0)
+        peaks = np.maximum.accumulate(windows, axis=-1)
+        result[:, start:start + chunk] = (windows / peaks).min(axis=-1) - 1
+
+    return pd.DataFrame(result, index=wealth.index, columns=wealth.columns)
+
+
+def compute_drawdown_analytics(
+    prices: pd.DataFrame,
+    weights: np.ndarray | None = None,
+    top_n: int = 5,
+    window: int | None = None
+) -> dict:
+    """
+    Full drawdown analytics for each asset and the weighted portfolio.
+
+    Parameters:
+        prices (pd.DataFrame): Price data
+        weights (np.ndarray): Portfolio weights (aligned with prices.columns)
+        top_n (int): Number of deepest episodes to keep per column
+        window (int): Rolling max drawdown window; skipped if None
+
+    Returns:
+        dict: Compact JSON-ready summary per column and optional rolling max drawdown
+    """
+    wealth = compute_wealth_index(prices, weights)
+    drawdown = compute_drawdown_series(wealth)
+    episodes = extract_drawdown_episodes(wealth)
+
+    underwater = drawdown < 0
+    time_under_water = underwater.sum()
+    longest = episodes.groupby("Asset")["Underwater Periods"].max()
+    counts = episodes.groupby("Asset").size()
+    top = episodes.sort_values(["Asset", "Depth"]).groupby("Asset", sort=False).head(top_n)
+    top_by_asset = {asset: group for asset, group in top.groupby("Asset", sort=False)}
+
+    summary = {}
+    for col in wealth.columns:
+        col_top = top_by_asset.get(col, top.iloc[:0])
+        summary[col] = {
+            "max_drawdown": float(drawdown[col].min()),
+            "current_drawdown": float(drawdown[col].iloc[-1]),
+            "time_under_water": int(time_under_water[col]),
+            "longest_underwater": int(longest.get(col, 0)),
+            "n_episodes": int(counts.get(col, 0)),
+            "episodes": [
+                {
+                    "peak": row["Peak"],
+                    "trough": row["Trough"],
+                    "recovery": row["Recovery"] if row["Recovered"] else None,
+                    "depth": row["Depth"],
+                    "decline_periods": row["Decline Periods"],
+                    "recovery_periods": row["Recovery Periods"] if row["Recovered"] else None,
+                    "underwater_periods": row["Underwater Periods"]
+                }
+                for row in col_top.to_dict("records")
+            ]
+        }
+
+    result = {"summary": summary}
+    if window is not None:
+        result["rolling_max_drawdown"] = compute_rolling_max_drawdown(wealth, window)
+
+    return result
@@ -0,0 +1,21 @@
+PERIODS_PER_YEAR = {
+    'daily': 252,
+    'weekly': 52,
+    'monthly': 12,
+    'quarterly': 4
+}
+
+
+def get_annualization_factor(freq: str) -> int:
+    """
+    Number of periods per year for a data frequency.
+
+    Parameters:
+        freq (str): 'daily', 'weekly', 'monthly' or 'quarterly'
+
+    Returns:
+        int: Annualization factor
+    """
+    if freq not in PERIODS_PER_YEAR:
+        raise ValueError(f"Unsupported frequency: {freq}. Choose from {list(PERIODS_PER_YEAR.keys())}")
+    return PERIODS_PER_YEAR[freq]
@@ -0,0 +1,180 @@
+import numpy as np
+import pandas as pd
+from scipy.optimize import minimize
+
+PERSISTENCE_BOUNDS = (1e-4, 0.9999)
+SHARE_BOUNDS = (1e-4, 1 - 1e-4)
+
+
+def _garch_components(theta: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Map (persistence, ARCH share) to (omega, alpha, beta) on standardized data.
+    Variance targeting fixes the unconditional variance at 1: omega = 1 - alpha - beta.
+    """
+    persistence, share = theta[:, 0], theta[:, 1]
+    alpha = share * persistence
+    beta = (1 - share) * persistence
+    return 1 - persistence, alpha, beta
+
+
+def _garch_nll_and_grad(theta: np.ndarray, x: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Gaussian GARCH(1,1) negative log-likelihood and its analytic gradient for every asset.
+
+    The variance recursion h_t = omega + alpha x_{t-1}^2 + beta h_{t-1} and its
+    derivatives dh_t = [1, x_{t-1}^2, h_{t-1}] + beta dh_{t-1} run across all
+    assets at once; only the time loop is sequential.
+
+    Parameters:
+        theta (np.ndarray): (N, 2) persistence and ARCH share per asset
+        x (np.ndarray): (T, N) standardized returns
+
+    Returns:
+        tuple: NLL per asset (N,), gradient w.r.t. theta (N, 2)
+    """
+    omega, alpha, beta = _garch_components(theta)
+    n_periods, n_assets = x.shape
+    x2 = x ** 2
+
+    h = np.ones(n_assets)
+    dh = np.zeros((3, n_assets))
+    nll = 0.5 * (np.log(h) + x2[0] / h)
+    grad = np.zeros((3, n_assets))
+
+    for t in range(1, n_periods):
+        dh = np.stack([np.ones(n_assets), x2[t - 1], h]) + beta * dh
+        h = omega + alpha * x2[t - 1] + beta * h
+        inv_h = 1.0 / h
+        nll += 0.5 * (np.log(h) + x2[t] * inv_h)
+        grad += 0.5 * (inv_h - x2[t] * inv_h ** 2) * dh
+
+    # Chain rule: omega = 1 - alpha - beta, then (alpha, beta) -> (persistence, share)
+    g_omega, g_alpha, g_beta = grad
+    g_alpha = g_alpha - g_omega
+    g_beta = g_beta - g_omega
+    persistence, share = theta[:, 0], theta[:, 1]
+    g_persistence = g_alpha * share + g_beta * (1 - share)
+    g_share = (g_alpha - g_beta) * persistence
+
+    return nll, np.column_stack([g_persistence, g_share])
+
+
+def _garch_variance_path(theta: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """
+    Conditional variances h_1..h_{T+1} on standardized data (last row is the one-step forecast).
+    """
+    omega, alpha, beta = _garch_components(theta)
+    n_periods, n_assets = x.shape
+    h = np.empty((n_periods + 1, n_assets))
+    h[0] = 1.0
+    for t in range(1, n_periods + 1):
+        h[t] = omega + alpha * x[t - 1] ** 2 + beta * h[t - 1]
+    return h
+
+
+def fit_garch(
+    returns: pd.DataFrame,
+    init_params: pd.DataFrame | None = None,
+    max_iter: int = 200,
+    tol: float = 1e-8
+) -> dict:
+    """
+    Fit GARCH(1,1) with variance targeting to every asset in one batched problem.
+
+    All assets are optimized jointly with L-BFGS-B on the summed likelihood
+    (the problem is separable, so this is equivalent to per-asset fits) using
+    analytic gradients. Passing the previous day's `params` as `init_params`
+    warm-starts the solver.
+
+    Parameters:
+        returns (pd.DataFrame): DataFrame of returns (no NaNs)
+        init_params (pd.DataFrame): Previous fit's params (columns omega, alpha, beta)
+        max_iter (int): Maximum L-BFGS-B iterations
+        tol (float): L-BFGS-B function tolerance
+
+    Returns:
+        dict: params (omega, alpha, beta), conditional volatility, one-step
+        forecast volatility and solver status
+    """
+    if returns.isna().any().any():
+        raise ValueError("Returns must not contain missing values.")
+
+    raw = returns.to_numpy(dtype=float)
+    n_periods, n_assets = raw.shape
+    if n_periods < 10:
+        raise ValueError("Not enough observations to fit GARCH.")
+
+    loc = raw.mean(axis=0)
+    scale = raw.std(axis=0)
+    scale[scale == 0] = 1.0
+    x = (raw - loc) / scale
+
+    if init_params is not None:
+        prev = init_params.reindex(returns.columns)
+        alpha0 = prev["alpha"].fillna(0.05).to_numpy()
+        beta0 = prev["beta"].fillna(0.90).to_numpy()
+        persistence0 = np.clip(alpha0 + beta0, *PERSISTENCE_BOUNDS)
+        share0 = np.clip(alpha0 / persistence0, *SHARE_BOUNDS)
+    else:
+        persistence0 = np.full(n_assets, 0.95)
+        share0 = np.full(n_assets, 0.05 / 0.95)
+
+    theta0 = np.column_stack([persistence0, share0]).ravel()
+    bounds = [PERSISTENCE_BOUNDS, SHARE_BOUNDS] * n_assets
+
+    def objective(flat):
+        nll, grad = _garch_nll_and_grad(flat.reshape(n_assets, 2), x)
+        return nll.sum() / n_periods, grad.ravel() / n_periods
+
+    result = minimize(
+        objective,
+        theta0,
+        jac=True,
+        method="L-BFGS-B",
+        bounds=bounds,
+        options={"maxiter": max_iter, "ftol": tol}
+    )
+
+    theta = result.x.reshape(n_assets, 2)
+    omega, alpha, beta = _garch_components(theta)
+    h = _garch_variance_path(theta, x)
+
+    params = pd.DataFrame(
+        {"omega": omega * scale ** 2, "alpha": alpha, "beta": beta},
+        index=returns.columns
+    )
+    return {
+        "params": params,
+        "conditional_volatility": pd.DataFrame(
+            np.sqrt(h[:-1]) * scale, index=returns.index, columns=returns.columns
+        ),
+        "forecast_volatility": pd.Series(np.sqrt(h[-1]) * scale, index=returns.columns),
+        "converged": bool(result.success),
+        "iterations": int(result.nit)
+    }
+
+
+def forecast_garch_volatility(
+    returns: pd.DataFrame,
+    horizon: int = 1,
+    init_params: pd.DataFrame | None = None
+) -> pd.Series:
+    """
+    Per-period GARCH(1,1) volatility forecast `horizon` steps ahead for each asset.
+
+    h_{T+k} = sigma^2 + (alpha + beta)^(k-1) (h_{T+1} - sigma^2)
+
+    Returns:
+        pd.Series: Forecast volatility (same frequency as returns, not annualized)
+    """
+    if horizon < 1:
+        raise ValueError("horizon must be at least 1.")
+
+    fit = fit_garch(returns, init_params=init_params)
+    params = fit["params"]
+    persistence = params["alpha"] + params["beta"]
+    long_run = params["omega"] / (1 - persistence)
+    one_step = fit["forecast_volatility"] ** 2
+
+    variance = long_run + persistence ** (horizon - 1) * (one_step - long_run)
+    return np.sqrt(variance)
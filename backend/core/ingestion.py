@@ -0,0 +1,238 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+CACHE_VALUES = "values.npy"
+CACHE_INDEX = "index.npy"
+CACHE_META = "meta.json"
+
+
+def read_price_file(path: str | Path, price_column: str | None = None) -> pd.DataFrame:
+    """
+    Read one CSV or Parquet price history.
+
+    The first column (or the Parquet index) is the date. A file with a single
+    price column, or a per-ticker file read with `price_column` (e.g. "Close"
+    from Date,Open,High,Low,Close,Volume), is named after the file stem
+    (e.g. AAPL.csv -> "AAPL"); wide files keep their own column names.
+
+    Returns:
+        pd.DataFrame: Prices indexed by date, sorted, duplicates dropped
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+
+    if suffix == ".csv":
+        df = pd.read_csv(path, index_col=0)
+    elif suffix in {".parquet", ".pq"}:
+        df = pd.read_parquet(path)
+    else:
+        raise ValueError(f"Unsupported price file type: {path.name}")
+
+    if price_column is not None:
+        if price_column not in df.columns:
+            raise ValueError(f"{path.name} has no '{price_column}' column.")
+        df = df[[price_column]]
+
+    df.index = pd.to_datetime(df.index)
+    df = df.apply(pd.to_numeric, errors="coerce")
+    if df.shape[1] == 1:
+        df.columns = [path.stem]
+
+    df = df[~df.index.duplicated(keep="last")]
+    return df.sort_index()
+
+
+def load_price_files(
+    paths: list[str | Path],
+    max_workers: int | None = None,
+    price_column: str | None = None
+) -> list[pd.DataFrame]:
+    """
+    Read many price files concurrently (file I/O and parsing release the GIL).
+
+    Returns:
+        list[pd.DataFrame]: One frame per file, in input order
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(partial(read_price_file, price_column=price_column), paths))
+
+
+def align_price_series(
+    frames: list[pd.DataFrame],
+    calendar: str = "union",
+    ffill_limit: int | None = 5,
+    stale_after: int | None = 10,
+    stale_action: str = "drop"
+) -> tuple[pd.DataFrame, dict]:
+    """
+    Align ragged per-ticker histories onto one calendar.
+
+    - calendar "union": every date seen in any file; "intersection": dates common to all
+    - gaps are forward-filled for at most `ffill_limit` periods
+    - a series whose last real observation is more than `stale_after`
+      periods before the calendar end is stale and is dropped or flagged
+      (flagged series are forward-filled to the end instead)
+    - rows still containing NaNs are dropped, as in `clean_price_data`
+
+    Returns:
+        tuple: (aligned price DataFrame, alignment report)
+    """
+    if calendar not in {"union", "intersection"}:
+        raise ValueError("calendar must be 'union' or 'intersection'")
+    if stale_action not in {"drop", "flag"}:
+        raise ValueError("stale_action must be 'drop' or 'flag'")
+
+    join = "outer" if calendar == "union" else "inner"
+    raw = pd.concat(frames, axis=1, join=join).sort_index()
+
+    if raw.columns.duplicated().any():
+        dupes = raw.columns[raw.columns.duplicated()].unique().tolist()
+        raise ValueError(f"Duplicate tickers across input files: {dupes}")
+
+    # Periods since each column's last real observation, measured on the aligned calendar
+    observed = raw.notna().to_numpy()
+    last_obs = len(raw) - 1 - np.argmax(observed[::-1], axis=0)
+    lag = np.where(observed.any(axis=0), len(raw) - 1 - last_obs, len(raw))
+
+    stale = []
+    if stale_after is not None:
+        stale = raw.columns[lag > stale_after].tolist()
+
+    prices = raw.ffill(limit=ffill_limit)
+    if stale_action == "drop":
+        prices = prices.drop(columns=stale)
+    elif stale:
+        prices[stale] = raw[stale].ffill()
+
+    before = len(prices)
+    prices = prices.dropna(how="any")
+
+    if prices.empty:
+        raise ValueError("No common history left after alignment.")
+
+    report = {
+        "calendar": calendar,
+        "rows": len(prices),
+        "rows_dropped": before - len(prices),
+        "columns": prices.columns.tolist(),
+        "stale": stale,
+        "stale_action": stale_action,
+        "missing_filled": int(prices.notna().sum().sum() - raw.loc[prices.index, prices.columns].notna().sum().sum())
+    }
+    return prices, report
+
+
+def _fingerprint(paths: list[Path], params: dict) -> str:
+    """
+    Hash input file identities (path, size, mtime) together with the alignment settings.
+    """
+    digest = hashlib.sha256()
+    for path in paths:
+        stat = path.stat()
+        digest.update(f"{path.resolve()}|{stat.st_size}|{stat.st_mtime_ns}\n".encode())
+    digest.update(json.dumps(params, sort_keys=True).encode())
+    return digest.hexdigest()[:32]
+
+
+def write_price_cache(prices: pd.DataFrame, report: dict, cache_path: str | Path):
+    """
+    Write aligned prices as a column-major .npy matrix plus index and metadata.
+    The directory is written to a temporary location and renamed into place.
+    """
+    cache_path = Path(cache_path)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = Path(tempfile.mkdtemp(dir=cache_path.parent, prefix=".tmp-"))
+
+    try:
+        np.save(tmp / CACHE_VALUES, np.asfortranarray(prices.to_numpy(dtype=np.float64)))
+        np.save(tmp / CACHE_INDEX, prices.index.values)
+        meta = {"columns": [str(c) for c in prices.columns], "index_name": prices.index.name, "report": report}
+        (tmp / CACHE_META).write_text(json.dumps(meta))
+        if cache_path.exists():
+            shutil.rmtree(cache_path)
+        os.replace(tmp, cache_path)
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+
+
+def read_price_cache(cache_path: str | Path) -> tuple[pd.DataFrame, dict]:
+    """
+    Load cached prices with the value matrix memory-mapped (read-only, no copy).
+
+    Returns:
+        tuple: (price DataFrame, alignment report)
+    """
+    cache_path = Path(cache_path)
+    values = np.load(cache_path / CACHE_VALUES, mmap_mode="r")
+    meta = json.loads((cache_path / CACHE_META).read_text())
+    index = pd.DatetimeIndex(np.load(cache_path / CACHE_INDEX), name=meta.get("index_name"))
+
+    prices = pd.DataFrame(values, index=index, columns=meta["columns"], copy=False)
+    return prices, meta["report"]
+
+
+def ingest_prices(
+    paths: list[str | Path],
+    cache_dir: str | Path | None = None,
+    calendar: str = "union",
+    ffill_limit: int | None = 5,
+    stale_after: int | None = 10,
+    stale_action: str = "drop",
+    max_workers: int | None = None,
+    price_column: str | None = None
+) -> tuple[pd.DataFrame, dict]:
+    """
+    Read, align and cache multi-asset price histories.
+
+    Output is a sorted, NaN-free price matrix with a DatetimeIndex: exactly
+    what `clean_price_data` produces and `compute_returns` expects. When
+    `cache_dir` is given, a re-run on unchanged files and settings is a
+    memory-mapped load of the cached matrix.
+
+    Parameters:
+        paths (list): CSV/Parquet files, one ticker per file or wide
+        cache_dir (str | Path): Directory for the columnar cache (None disables caching)
+        calendar (str): 'union' or 'intersection'
+        ffill_limit (int): Max consecutive periods to forward-fill
+        stale_after (int): Periods without data before a series counts as stale
+        stale_action (str): 'drop' or 'flag' stale series
+        max_workers (int): Reader threads
+        price_column (str): Column to take from each per-ticker file (e.g. "Close" or "Adj Close")
+
+    Returns:
+        tuple: (price DataFrame, alignment report)
+    """
+    paths = [Path(p) for p in paths]
+    if not paths:
+        raise ValueError("At least one price file is required.")
+
+    params = {
+        "calendar": calendar,
+        "ffill_limit": ffill_limit,
+        "stale_after": stale_after,
+        "stale_action": stale_action
+    }
+
+    cache_path = None
+    if cache_dir is not None:
+        cache_path = Path(cache_dir) / _fingerprint(paths, {**params, "price_column": price_column})
+        if (cache_path / CACHE_META).exists():
+            return read_price_cache(cache_path)
+
+    frames = load_price_files(paths, max_workers=max_workers, price_column=price_column)
+    prices, report = align_price_series(frames, **params)
+
+    if cache_path is not None:
+        write_price_cache(prices, report, cache_path)
+
+    return prices, report
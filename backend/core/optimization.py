@@ -1,6 +1,13 @@
+import math
+
 import numpy as np
 import pandas as pd
 from scipy.optimize import minimize
+from scipy.cluster.hierarchy import linkage, leaves_list
+from scipy.spatial.distance import squareform
+from core.correlation import compute_correlation_matrix
+from core.frequency import get_annualization_factor
+from core.returns import select_returns
 
 
 def minimize_volatility(
@@ -43,20 +50,19 @@ def maximize_sharpe_ratio(
     Maximize the Sharpe Ratio.
 
     Parameters:
-        returns (pd.DataFrame): Historical returns
+        returns (pd.DataFrame | ReturnPyramid): Historical returns
         risk_free_rate (float): Annualized risk-free rate
-        freq (str): 'daily', 'weekly', 'monthly'
+        freq (str): 'daily', 'weekly', 'monthly', 'quarterly'
         allow_short (bool): Allow short positions
 
     Returns:
         np.ndarray: Optimal weights
     """
-    freq_map = {'daily': 252, 'weekly': 52, 'monthly': 12}
-    if freq not in freq_map:
-        raise ValueError(f"Unsupported frequency: {freq}")
+    annual_factor = get_annualization_factor(freq)
+    returns = select_returns(returns, freq)
 
-    mean_returns = returns.mean().values * freq_map[freq]
-    cov_matrix = returns.cov().values * freq_map[freq]
+    mean_returns = returns.mean().values * annual_factor
+    cov_matrix = returns.cov().values * annual_factor
     n = len(mean_returns)
     init_guess = np.ones(n) / n
 
@@ -78,6 +84,138 @@ def maximize_sharpe_ratio(
     return result.x
 
 
+def risk_budget_weights(
+    covariance_matrix: pd.DataFrame,
+    budgets: np.ndarray | None = None,
+    tol: float = 1e-8,
+    max_iter: int = 500
+) -> np.ndarray:
+    """
+    Risk-budgeting (equal risk contribution by default) long-only portfolio.
+
+    Solves min 0.5 x'Σx - Σ_i b_i ln(x_i) by cyclical coordinate descent;
+    at the optimum x_i (Σx)_i = b_i, i.e. each asset's CCTR share equals its
+    budget, and w = x / sum(x). Each coordinate update is the positive root
+    of Σ_ii x_i² + c_i x_i - b_i = 0 and Σx is maintained incrementally, so a
+    sweep costs O(N²) with no matrix factorization.
+
+    Parameters:
+        covariance_matrix (pd.DataFrame): Covariance matrix of returns
+        budgets (np.ndarray): Target risk contribution shares (default 1/N each)
+        tol (float): Max absolute deviation of risk shares from budgets
+        max_iter (int): Maximum number of sweeps
+
+    Returns:
+        np.ndarray: Optimal weights
+    """
+    sigma = np.ascontiguousarray(covariance_matrix, dtype=float)
+    n = sigma.shape[0]
+
+    if budgets is None:
+        budgets = np.ones(n) / n
+    budgets = np.asarray(budgets, dtype=float)
+    if len(budgets) != n:
+        raise ValueError("Budgets length does not match number of assets.")
+    if (budgets <= 0).any():
+        raise ValueError("Risk budgets must be strictly positive.")
+    budgets = budgets / budgets.sum()
+
+    diag = np.diag(sigma).copy()
+    if (diag <= 0).any():
+        raise ValueError("Covariance matrix must have a positive diagonal.")
+
+    # Start from the inverse-volatility portfolio scaled to unit variance
+    x = budgets / np.sqrt(diag)
+    x /= np.sqrt(x @ sigma @ x)
+    sx = sigma @ x
+
+    diag_list = diag.tolist()
+    budget_list = budgets.tolist()
+
+    for _ in range(max_iter):
+        for i in range(n):
+            d = diag_list[i]
+            xi = x[i]
+            c = sx[i] - d * xi
+            new_xi = (-c + math.sqrt(c * c + 4 * d * budget_list[i])) / (2 * d)
+            if new_xi != xi:
+                # Σ is symmetric, so row i is column i and is contiguous
+                sx += sigma[i] * (new_xi - xi)
+                x[i] = new_xi
+
+        contributions = x * sx
+        if np.max(np.abs(contributions / contributions.sum() - budgets)) < tol:
+            break
+
+    return x / x.sum()
+
+
+def _cluster_variance(cov: np.ndarray, items: np.ndarray) -> float:
+    """
+    Variance of the inverse-variance portfolio of a cluster.
+    """
+    sub_cov = cov[np.ix_(items, items)]
+    ivp = 1.0 / np.diag(sub_cov)
+    ivp /= ivp.sum()
+    return float(ivp @ sub_cov @ ivp)
+
+
+def hierarchical_risk_parity(
+    returns: pd.DataFrame,
+    linkage_method: str = 'single'
+) -> np.ndarray:
+    """
+    Hierarchical Risk Parity (López de Prado) weights.
+
+    1. Cluster assets on the correlation distance sqrt((1 - ρ) / 2)
+       (single linkage is computed from the minimum spanning tree in O(N²))
+    2. Quasi-diagonalize: order assets by the dendrogram leaves
+    3. Recursive bisection: split each ordered cluster in half and allocate
+       between the halves inversely to their inverse-variance cluster variance
+
+    No covariance inversion is needed, so near-singular covariance matrices
+    of large universes are handled without instability.
+
+    Parameters:
+        returns (pd.DataFrame): Historical returns
+        linkage_method (str): scipy linkage method ('single', 'ward', 'average', ...)
+
+    Returns:
+        np.ndarray: Long-only weights aligned with returns.columns
+    """
+    n = returns.shape[1]
+    if n < 2:
+        raise ValueError("At least two assets are required for HRP.")
+
+    corr = compute_correlation_matrix(returns).values
+    cov = returns.cov().values
+    if np.isnan(corr).any():
+        raise ValueError("Correlation matrix contains NaNs (constant or empty return series).")
+
+    distance = np.sqrt(np.clip((1.0 - corr) / 2.0, 0.0, None))
+    np.fill_diagonal(distance, 0.0)
+    order = leaves_list(linkage(squareform(distance, checks=False), method=linkage_method))
+
+    weights = np.ones(n)
+    clusters = [order]
+    while clusters:
+        next_clusters = []
+        for cluster in clusters:
+            if len(cluster) < 2:
+                continue
+            half = len(cluster) // 2
+            left, right = cluster[:half], cluster[half:]
+            var_left = _cluster_variance(cov, left)
+            var_right = _cluster_variance(cov, right)
+            alpha = 1.0 - var_left / (var_left + var_right)
+            weights[left] *= alpha
+            weights[right] *= 1.0 - alpha
+            next_clusters.extend([left, right])
+        clusters = next_clusters
+
+    return weights / weights.sum()
+
+
 def compute_portfolio_return(weights: np.ndarray, mean_returns: pd.Series, freq: str = 'daily') -> float:
     """
     Compute expected portfolio return (annualized).
@@ -85,8 +223,7 @@ def compute_portfolio_return(weights: np.ndarray, mean_returns: pd.Series, freq:
     Returns:
         float: Expected return
     """
-    freq_map = {'daily': 252, 'weekly': 52, 'monthly': 12}
-    return weights @ (mean_returns * freq_map[freq])
+    return weights @ (mean_returns * get_annualization_factor(freq))
 
 
 def compute_portfolio_volatility(weights: np.ndarray, covariance_matrix: pd.DataFrame, freq: str = 'daily') -> float:
@@ -96,6 +233,5 @@ def compute_portfolio_volatility(weights: np.ndarray, covariance_matrix: pd.Data
     Returns:
         float: Portfolio standard deviation
     """
-    freq_map = {'daily': 252, 'weekly': 52, 'monthly': 12}
-    port_var = weights.T @ (covariance_matrix.values * freq_map[freq]) @ weights
+    port_var = weights.T @ (covariance_matrix.values * get_annualization_factor(freq)) @ weights
     return np.sqrt(port_var)
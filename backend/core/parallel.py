@@ -0,0 +1,173 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from core.risk_metrics import compute_sharpe_ratio, compute_sortino_ratio, compute_skewness, compute_kurtosis
+from core.var_cvar import compute_historical_var, compute_historical_cvar
+
+# Per-worker state set up once by the pool initializer
+_WORKER = {}
+
+# Pools are created from request threads of a multi-threaded server, where a
+# plain fork can copy held locks (event loop, threadpool, BLAS) into the child
+_MP_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+if _MP_CONTEXT.get_start_method() == "forkserver":
+    # Import numpy/pandas once in the fork server instead of in every worker
+    _MP_CONTEXT.set_forkserver_preload(["core.parallel", "core.bootstrap"])
+
+
+def _create_shared_array(shape: tuple, dtype=np.float64) -> tuple[shared_memory.SharedMemory, np.ndarray]:
+    """
+    Allocate a column-major array backed by shared memory.
+    Column-major keeps every column shard contiguous.
+    """
+    nbytes = max(int(np.prod(shape)) * np.dtype(dtype).itemsize, 1)
+    shm = shared_memory.SharedMemory(create=True, size=nbytes)
+    return shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf, order="F")
+
+
+def _init_worker(in_name: str, out_name: str | None, shape: tuple, index: pd.Index, columns: pd.Index):
+    shm_in = shared_memory.SharedMemory(name=in_name)
+    _WORKER["shm"] = [shm_in]
+    _WORKER["values"] = np.ndarray(shape, dtype=np.float64, buffer=shm_in.buf, order="F")
+    _WORKER["out"] = None
+    if out_name is not None:
+        shm_out = shared_memory.SharedMemory(name=out_name)
+        _WORKER["shm"].append(shm_out)
+        _WORKER["out"] = np.ndarray(shape, dtype=np.float64, buffer=shm_out.buf, order="F")
+    _WORKER["index"] = index
+    _WORKER["columns"] = columns
+
+
+def _run_shard(func, start: int, stop: int, kwargs: dict):
+    """
+    Run `func` on a zero-copy DataFrame view of columns [start, stop).
+    Panel results are written straight into the shared output array.
+    """
+    shard = pd.DataFrame(
+        _WORKER["values"][:, start:stop],
+        index=_WORKER["index"],
+        columns=_WORKER["columns"][start:stop],
+        copy=False
+    )
+    result = func(shard, **kwargs)
+
+    if _WORKER["out"] is not None:
+        _WORKER["out"][:, start:stop] = np.asarray(result, dtype=np.float64)
+        return None
+    return result
+
+
+def run_sharded(
+    func,
+    returns: pd.DataFrame,
+    n_workers: int | None = None,
+    shard_size: int | None = None,
+    output: str = "per_asset",
+    **kwargs
+):
+    """
+    Apply a column-independent metric to column shards in a process pool.
+
+    The return matrix is copied once into `multiprocessing.shared_memory`;
+    workers attach to it by name and wrap their columns without copying, so
+    only shard bounds and the (small) results cross process boundaries.
+
+    Parameters:
+        func: Module-level function taking a returns DataFrame as first argument
+        returns (pd.DataFrame): DataFrame of returns
+        n_workers (int): Worker processes (defaults to os.cpu_count())
+        shard_size (int): Columns per task (defaults to ~4 tasks per worker)
+        output (str): "per_asset" for results indexed by asset (Series or
+            DataFrame, concatenated), "panel" for results shaped like `returns`
+            (e.g. rolling volatility), gathered through a shared output array
+        **kwargs: Extra keyword arguments passed to `func`
+
+    Returns:
+        pd.Series | pd.DataFrame: Same result as func(returns, **kwargs)
+    """
+    if output not in {"per_asset", "panel"}:
+        raise ValueError("output must be 'per_asset' or 'panel'")
+
+    n_workers = n_workers or os.cpu_count() or 1
+    n_rows, n_cols = returns.shape
+    if n_workers == 1 or n_cols < 2:
+        return func(returns, **kwargs)
+
+    shard_size = shard_size or max(1, -(-n_cols // (4 * n_workers)))
+    bounds = [(start, min(start + shard_size, n_cols)) for start in range(0, n_cols, shard_size)]
+
+    shm_in, values = _create_shared_array((n_rows, n_cols))
+    shm_out, out = (None, None)
+    try:
+        values[:] = returns.to_numpy(dtype=np.float64)
+        if output == "panel":
+            shm_out, out = _create_shared_array((n_rows, n_cols))
+
+        with ProcessPoolExecutor(
+            max_workers=n_workers,
+            mp_context=_MP_CONTEXT,
+            initializer=_init_worker,
+            initargs=(shm_in.name, shm_out.name if shm_out else None, (n_rows, n_cols), returns.index, returns.columns)
+        ) as pool:
+            futures = [pool.submit(_run_shard, func, start, stop, kwargs) for start, stop in bounds]
+            results = [f.result() for f in futures]
+
+        if output == "panel":
+            return pd.DataFrame(out.copy(order="C"), index=returns.index, columns=returns.columns)
+        return pd.concat(results)
+
+    finally:
+        del values, out
+        for shm in (shm_in, shm_out):
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+
+
+def compute_asset_metric_table(
+    returns: pd.DataFrame,
+    risk_free_rate: float = 0.0,
+    freq: str = 'daily',
+    confidence_level: float = 0.95
+) -> pd.DataFrame:
+    """
+    Per-asset Sharpe, Sortino, skewness, kurtosis and historical VaR/CVaR.
+
+    Returns:
+        pd.DataFrame: One row per asset
+    """
+    return pd.DataFrame({
+        "sharpe_ratio": compute_sharpe_ratio(returns, risk_free_rate, freq=freq),
+        "sortino_ratio": compute_sortino_ratio(returns, risk_free_rate, freq=freq),
+        "skewness": compute_skewness(returns),
+        "kurtosis": compute_kurtosis(returns),
+        "historical_var": compute_historical_var(returns, confidence_level),
+        "historical_cvar": compute_historical_cvar(returns, confidence_level)
+    })
+
+
+def compute_asset_metrics_parallel(
+    returns: pd.DataFrame,
+    risk_free_rate: float = 0.0,
+    freq: str = 'daily',
+    confidence_level: float = 0.95,
+    n_workers: int | None = None
+) -> pd.DataFrame:
+    """
+    `compute_asset_metric_table` sharded across processes over shared memory.
+    """
+    return run_sharded(
+        compute_asset_metric_table,
+        returns,
+        n_workers=n_workers,
+        risk_free_rate=risk_free_rate,
+        freq=freq,
+        confidence_level=confidence_level
+    )
@@ -1,6 +1,8 @@
 import pandas as pd
 import numpy as np
 from core.covariance import compute_annualized_covariance
+from core.frequency import get_annualization_factor
+from core.returns import select_returns
 from scipy.optimize import minimize
 
 
@@ -10,12 +12,9 @@ def compute_portfolio_return(
     """
     Compute annualized portfolio return from weights and asset returns.
     """
-    freq_map = {"daily": 252, "weekly": 52, "monthly": 12}
-    if freq not in freq_map:
-        raise ValueError("Unsupported frequency.")
-
-    expected_return = returns.mean().values @ weights
-    return expected_return * freq_map[freq]
+    annual_factor = get_annualization_factor(freq)
+    expected_return = select_returns(returns, freq).mean().values @ weights
+    return expected_return * annual_factor
 
 
 def compute_portfolio_volatility(
@@ -0,0 +1,319 @@
+import numpy as np
+import pandas as pd
+from scipy.linalg import LinAlgError, cho_factor, cho_solve
+
+
+class RebalanceState:
+    """
+    State carried from one rebalance to the next (e.g. day to day).
+
+    Holds the previous solution, whether the turnover cap was binding, and
+    the ADMM dual and step size. The next solve starts an active-set method
+    from the previous solution's trading pattern and falls back to ADMM,
+    restarted from these iterates, if that does not verify.
+    """
+
+    def __init__(self):
+        self.weights = None
+        self.cap_active = False
+        self.u = None
+        self.rho = None
+
+    def matches(self, n_assets: int) -> bool:
+        return self.weights is not None and len(self.weights) == n_assets
+
+
+def _soft_threshold(x: np.ndarray, threshold) -> np.ndarray:
+    return np.sign(x) * np.maximum(np.abs(x) - threshold, 0.0)
+
+
+def _prox_costs_and_turnover(
+    v: np.ndarray,
+    current: np.ndarray,
+    threshold: float,
+    lower: np.ndarray,
+    upper: np.ndarray,
+    max_turnover: float | None
+) -> np.ndarray:
+    """
+    Proximal step for threshold·||z - w0||_1 + box bounds + ||z - w0||_1 <= max_turnover.
+
+    Each coordinate is soft-thresholded around the current weight and
+    clipped to its bounds; if the turnover cap binds, the threshold is raised
+    by the cap's multiplier, found by bisection (turnover is monotone in it).
+    """
+    delta = v - current
+    low, high = lower - current, upper - current
+
+    def trade(mu):
+        return np.clip(_soft_threshold(delta, threshold + mu), low, high)
+
+    d = trade(0.0)
+    if max_turnover is None or np.abs(d).sum() <= max_turnover:
+        return current + d
+
+    lo_mu, hi_mu = 0.0, float(np.abs(delta).max())
+    for _ in range(60):
+        mid = 0.5 * (lo_mu + hi_mu)
+        if np.abs(trade(mid)).sum() > max_turnover:
+            lo_mu = mid
+        else:
+            hi_mu = mid
+    return current + trade(hi_mu)
+
+
+def _active_set_kkt(sigma, current, mu, linear_cost, quadratic_cost, max_turnover, fixed, values, sign, cap_active):
+    """
+    Solve the equality-constrained KKT system for one active set.
+
+    Assets in `fixed` stay at `values` (held, or at a bound); the rest trade
+    in the direction `sign`, so the L1 costs are linear on them and only the
+    trading block 2Σ_FF + 2qI is factorized.
+
+    Returns:
+        tuple: (weights, budget multiplier λ, cap multiplier κ), or None if the block is singular.
+        If every trading asset moves the same way only λ + κ·sign is pinned;
+        that sum is returned in place of λ, with κ as None.
+    """
+    free = ~fixed
+    w = np.where(fixed, values, current)
+    s = sign[free]
+    budget = 1.0 - w[fixed].sum()
+
+    if not free.any():
+        return w, None, 0.0
+
+    try:
+        factor = cho_factor(2 * sigma[np.ix_(free, free)] + 2 * quadratic_cost * np.eye(free.sum()), check_finite=False)
+    except LinAlgError:
+        return None
+
+    rhs = mu[free] + 2 * quadratic_cost * current[free] - 2 * sigma[np.ix_(free, fixed)] @ w[fixed] - linear_cost * s
+    a, b, e = cho_solve(factor, np.column_stack([rhs, np.ones(len(s)), s]), check_finite=False).T
+
+    # w_F = a - λb - κe, with the budget (and the turnover cap when binding) pinning λ and κ
+    if cap_active and np.all(s == s[0]):
+        # e = s·b, so the cap row repeats the budget row
+        combined = (a.sum() - budget) / b.sum()
+        w[free] = a - combined * b
+        return w, combined, None
+    if cap_active:
+        room = max_turnover - np.abs(w[fixed] - current[fixed]).sum() + s @ current[free]
+        lhs = np.array([[b.sum(), e.sum()], [s @ b, s @ e]])
+        try:
+            lam, kappa = np.linalg.solve(lhs, np.array([a.sum() - budget, s @ a - room]))
+        except LinAlgError:
+            return None
+    else:
+        lam, kappa = (a.sum() - budget) / b.sum(), 0.0
+
+    w[free] = a - lam * b - kappa * e
+    return w, lam, kappa
+
+
+def _active_set_rebalance(
+    sigma, current, mu, linear_cost, quadratic_cost, max_turnover, lower, upper, guess, cap_active,
+    tol: float, max_iter: int = 30
+):
+    """
+    Primal-dual active-set solve started from the trading pattern of `guess`.
+
+    Each step solves the KKT system for the current active set, then
+    re-classifies every asset with one diagonally scaled proximal step. The
+    result is returned only if it satisfies the full optimality conditions
+    (exact for this convex QP), so a wrong guess costs a few small solves
+    and the caller falls back to ADMM.
+
+    Returns:
+        tuple: (weights, cap_active, iterations), or None if no verified optimum was found
+    """
+    hdiag = 2 * np.diag(sigma) + 2 * quadratic_cost
+    scale = max(float(np.abs(hdiag).max()), 1.0)
+    w_guess = guess
+    seen = set()
+
+    for iteration in range(1, max_iter + 1):
+        fixed = (w_guess == current) | (w_guess <= lower) | (w_guess >= upper)
+        values = np.clip(np.where(w_guess == current, current, w_guess), lower, upper)
+        sign = np.sign(w_guess - current)
+        pattern = (fixed.tobytes(), sign.tobytes(), cap_active)
+        if pattern in seen:
+            return None
+        seen.add(pattern)
+
+        solved = _active_set_kkt(sigma, current, mu, linear_cost, quadratic_cost, max_turnover, fixed, values, sign, cap_active)
+        if solved is None:
+            return None
+        w, lam, kappa = solved
+
+        grad = 2 * (sigma @ w) - mu + 2 * quadratic_cost * (w - current)
+        d = w - current
+        if kappa is None:
+            # Take the smallest κ >= 0 the held assets allow (none if the cap is slack)
+            s0 = sign[~fixed][0]
+            held = fixed & (d == 0)
+            kappa = 0.0
+            if held.any() and np.abs(d).sum() >= max_turnover - tol:
+                kappa = max(0.0, float(np.max(s0 * (grad[held] + lam) - linear_cost)) / 2)
+            lam = lam - kappa * s0
+        t = linear_cost + kappa
+
+        # -(g + λ) must lie in t·∂|d| plus the normal cone of the bounds, with
+        # trading assets judged by their assumed direction (a trade that
+        # solves to ~0 is degenerate, not wrong); on an all-fixed set λ is not
+        # pinned, so take the middle of the range every asset allows (if that
+        # range is empty the check below fails)
+        direction = np.where(fixed, np.sign(d), sign)
+        lo = np.where(direction == 0, -t, t * direction)
+        hi = lo.copy()
+        hi[direction == 0] = t
+        lo[w <= lower] = -np.inf
+        hi[w >= upper] = np.inf
+        if lam is None:
+            lam_lo, lam_hi = np.max(-grad - hi), np.min(-grad - lo)
+            lam = 0.5 * (lam_lo + lam_hi) if np.isfinite(lam_lo + lam_hi) else float(np.clip(0.0, lam_lo, lam_hi))
+
+        residual = -(grad + lam)
+        stationary = np.all(residual >= lo - tol * scale) and np.all(residual <= hi + tol * scale)
+        turnover = np.abs(d).sum()
+        feasible = (
+            abs(w.sum() - 1.0) <= tol and np.all(w >= lower - tol) and np.all(w <= upper + tol)
+            and np.all(d[~fixed] * sign[~fixed] >= -tol)
+            and (max_turnover is None or turnover <= max_turnover + tol)
+            and kappa >= -tol * scale
+        )
+        if stationary and feasible:
+            return w, cap_active, iteration
+
+        # Re-classify with a proximal step from the trial point
+        step = w - (grad + lam) / hdiag
+        w_guess = np.clip(current + _soft_threshold(step - current, np.maximum(t, linear_cost) / hdiag), lower, upper)
+        if max_turnover is not None:
+            cap_active = (cap_active and kappa > 0) or turnover > max_turnover + tol
+
+    return None
+
+
+def rebalance_portfolio(
+    covariance_matrix: pd.DataFrame,
+    current_weights: np.ndarray,
+    linear_cost: float = 0.0,
+    quadratic_cost: float = 0.0,
+    max_turnover: float | None = None,
+    expected_returns: np.ndarray | None = None,
+    allow_short: bool = False,
+    state: RebalanceState | None = None,
+    tol: float = 1e-8,
+    max_iter: int = 5000
+) -> dict:
+    """
+    Turnover-aware minimum-variance rebalance starting from current holdings.
+
+        min  w'Σw - μ'w + c·||w - w0||_1 + q·||w - w0||²
+        s.t. sum(w) = 1,  bounds,  ||w - w0||_1 <= max_turnover
+
+    With a previous `state`, an active-set method starts from the previous
+    solution's pattern of held, bought, sold and bounded assets and only
+    factorizes the block of assets that trade; when inputs moved a little the
+    pattern barely changes, so this takes a few small solves. Otherwise
+    (or if that does not verify) the problem is solved by ADMM: the smooth
+    part with the budget constraint is a linear solve with
+    M = 2Σ + (2q + ρ)I, the costs, bounds and turnover cap are a cheap
+    proximal step, and the iterates are restarted from the previous state.
+
+    Parameters:
+        covariance_matrix (pd.DataFrame): Covariance matrix of returns
+        current_weights (np.ndarray): Current holdings w0
+        linear_cost (float): c, cost per unit traded (objective units)
+        quadratic_cost (float): q, quadratic trading cost coefficient
+        max_turnover (float): Cap on sum |w - w0|; None for no cap
+        expected_returns (np.ndarray): Optional μ (same units as Σ)
+        allow_short (bool): Allow short positions
+        state (RebalanceState): Carried state from the previous rebalance (updated in place)
+        tol (float): Primal/dual residual tolerance
+        max_iter (int): Maximum ADMM iterations
+
+    Returns:
+        dict: weights, turnover, transaction cost, iterations, method ("active_set" or "admm"), converged
+    """
+    sigma = np.asarray(covariance_matrix, dtype=float)
+    n = sigma.shape[0]
+    w0 = np.asarray(current_weights, dtype=float)
+    if len(w0) != n:
+        raise ValueError("Current weights length does not match number of assets.")
+    if max_turnover is not None and max_turnover < 0:
+        raise ValueError("max_turnover must be non-negative.")
+
+    mu = np.zeros(n) if expected_returns is None else np.asarray(expected_returns, dtype=float)
+    lower = np.full(n, -np.inf if allow_short else 0.0)
+    upper = np.full(n, np.inf if allow_short else 1.0)
+    state = state if state is not None else RebalanceState()
+
+    active_set = None
+    if state.matches(n):
+        active_set = _active_set_rebalance(
+            sigma, w0, mu, linear_cost, quadratic_cost, max_turnover, lower, upper,
+            state.weights, state.cap_active, tol=tol
+        )
+
+    if active_set is not None:
+        z, state.cap_active, iterations = active_set
+        method, converged = "active_set", True
+    else:
+        z, iterations, converged = _admm_rebalance(
+            sigma, w0, mu, linear_cost, quadratic_cost, max_turnover, lower, upper, state, tol, max_iter
+        )
+        method = "admm"
+        state.cap_active = max_turnover is not None and np.abs(z - w0).sum() >= max_turnover - tol
+
+    state.weights = z
+    trades = z - w0
+    return {
+        "weights": z,
+        "turnover": float(np.abs(trades).sum()),
+        "transaction_cost": float(linear_cost * np.abs(trades).sum() + quadratic_cost * trades @ trades),
+        "iterations": iterations,
+        "method": method,
+        "converged": converged
+    }
+
+
+def _admm_rebalance(sigma, w0, mu, linear_cost, quadratic_cost, max_turnover, lower, upper, state, tol, max_iter):
+    """
+    ADMM for the rebalance problem, restarted from `state`'s iterates when present.
+
+    Returns:
+        tuple: (weights, iterations, converged)
+    """
+    n = len(w0)
+    rho = max(float(np.mean(np.diag(sigma))) * 2, 1e-12)
+    factor = cho_factor(2 * sigma + (2 * quadratic_cost + rho) * np.eye(n))
+    m_inv_ones = cho_solve(factor, np.ones(n), check_finite=False)
+    ones_m_inv_ones = m_inv_ones.sum()
+
+    if state.matches(n) and state.u is not None:
+        # u is the dual scaled by 1/ρ, so rescale it if ρ changed
+        z, u = state.weights.copy(), state.u * (state.rho / rho)
+    else:
+        z, u = w0.copy(), np.zeros(n)
+
+    converged = False
+    iterations = 0
+    for iterations in range(1, max_iter + 1):
+        rhs = 2 * quadratic_cost * w0 + mu + rho * (z - u)
+        y = cho_solve(factor, rhs, check_finite=False)
+        lam = (y.sum() - 1.0) / ones_m_inv_ones
+        x = y - lam * m_inv_ones
+
+        z_prev = z
+        z = _prox_costs_and_turnover(x + u, w0, linear_cost / rho, lower, upper, max_turnover)
+        u = u + x - z
+
+        primal = np.linalg.norm(x - z)
+        dual = rho * np.linalg.norm(z - z_prev)
+        if primal < tol * np.sqrt(n) and dual < tol * np.sqrt(n):
+            converged = True
+            break
+
+    state.u, state.rho = u, rho
+    return z, iterations, converged
@@ -1,5 +1,7 @@
 import pandas as pd
 import numpy as np
+from core.frequency import get_annualization_factor
+from core.returns import select_returns
 
 def compute_rolling_volatility(
     returns: pd.DataFrame,
@@ -26,13 +28,11 @@ def compute_rolling_sharpe_ratio(
     Returns:
         pd.DataFrame: Rolling Sharpe Ratio
     """
-    freq_map = {'daily': 252, 'weekly': 52, 'monthly': 12}
-    if freq not in freq_map:
-        raise ValueError(f"Unsupported frequency: {freq}")
+    annual_factor = get_annualization_factor(freq)
+    returns = select_returns(returns, freq)
 
     mean_ret = returns.rolling(window).mean()
     std_dev = returns.rolling(window).std(ddof=0)
-    annual_factor = freq_map[freq]
 
     excess_ret = mean_ret - (risk_free_rate / annual_factor)
     return (excess_ret * annual_factor) / std_dev
@@ -54,6 +54,9 @@ def compute_z_score(
     return (series - rolling_mean) / rolling_std
 
 
+REGIME_LABELS = ["Calm", "Neutral", "Volatile"]
+
+
 def detect_volatility_regime(
     rolling_volatility: pd.Series,
     high_threshold: float,
@@ -67,12 +70,242 @@ def detect_volatility_regime(
     - "Neutral" otherwise
 
     Returns:
-        pd.Series: Regime labels for each period
+        pd.Series: Categorical regime labels for each period (NaN where vol is undefined)
+    """
+    vol = rolling_volatility.to_numpy(dtype=float)
+    codes = np.select(
+        [vol < low_threshold, vol > high_threshold, (vol <= high_threshold) & (vol >= low_threshold)],
+        [0, 2, 1],
+        default=-1
+    ).astype(np.int8)
+
+    return pd.Series(
+        pd.Categorical.from_codes(codes, categories=REGIME_LABELS),
+        index=rolling_volatility.index
+    )
+
+
+def _hmm_state_labels(n_states: int) -> dict[int, str]:
+    if n_states == 2:
+        return {0: "Calm", 1: "Volatile"}
+    if n_states == 3:
+        return dict(enumerate(REGIME_LABELS))
+    return {k: f"State {k}" for k in range(n_states)}
+
+
+def _gaussian_log_density(x: np.ndarray, mean: np.ndarray, var: np.ndarray) -> np.ndarray:
+    """
+    Log N(x | mean, var) for every (time, state, asset): x is (T, N), mean/var are (K, N).
+    """
+    log_b = x[:, None, :] - mean[None]
+    log_b *= log_b
+    log_b *= -0.5 / var
+    log_b -= 0.5 * np.log(2 * np.pi * var)
+    return log_b
+
+
+# The recursions below keep states on the middle axis and assets last, i.e.
+# (T, K, N) arrays and a (K, K, N) transition stack, so every time step works
+# on contiguous length-N vectors instead of N tiny K x K products.
+
+def _hmm_forward(pi: np.ndarray, trans: np.ndarray, b: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Batched scaled forward pass in probability space.
+
+    Returns the normalized alpha (T, K, N) and the per-step scale factors
+    c (T, N); the log-likelihood is sum_t log c_t.
+    """
+    n_periods, n_states, n_assets = b.shape
+    alpha = np.empty_like(b)
+    scale = np.empty((n_periods, n_assets))
+    carried = np.empty((n_states, n_states, n_assets))
+
+    a = pi * b[0]
+    for t in range(n_periods):
+        if t:
+            np.multiply(a[:, None, :], trans, out=carried)
+            a = np.add.reduce(carried, axis=0)
+            a *= b[t]
+        c = np.add.reduce(a, axis=0)
+        a /= c
+        alpha[t] = a
+        scale[t] = c
+
+    return alpha, scale
+
+
+def _hmm_backward(trans: np.ndarray, b: np.ndarray, scale: np.ndarray) -> np.ndarray:
+    """
+    Batched scaled backward pass, using the forward scale factors so that
+    alpha * beta is the smoothed state probability. Returns beta (T, K, N).
+    """
+    n_periods, n_states, n_assets = b.shape
+    beta = np.empty_like(b)
+    beta[-1] = 1.0
+    carried = np.empty((n_states, n_states, n_assets))
+
+    for t in range(n_periods - 2, -1, -1):
+        nxt = b[t + 1] * beta[t + 1]
+        nxt /= scale[t + 1]
+        np.multiply(trans, nxt[None, :, :], out=carried)
+        beta[t] = np.add.reduce(carried, axis=1)
+
+    return beta
+
+
+def _hmm_e_step(
+    pi: np.ndarray,
+    trans: np.ndarray,
+    log_b: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Forward-backward for every asset. Returns gamma (T, K, N), the expected
+    transition counts sum_t xi_t (K, K, N) and the log-likelihood (N,).
+    """
+    # Rescale emissions per (time, asset) so the largest is 1; the shift goes back into the likelihood
+    shift = log_b.max(axis=1)
+    b = np.exp(log_b - shift[:, None, :])
+
+    alpha, scale = _hmm_forward(pi, trans, b)
+    beta = _hmm_backward(trans, b, scale)
+
+    gamma = alpha * beta
+    # xi_t(i, j) = alpha_t(i) A(i, j) b_{t+1}(j) beta_{t+1}(j) / c_{t+1}, summed over t in one contraction
+    carried = b[1:] * beta[1:] / scale[1:, None, :]
+    xi_sum = trans * np.einsum("tin,tjn->ijn", alpha[:-1], carried)
+    log_lik = np.log(scale).sum(axis=0) + shift.sum(axis=0)
+    return gamma, xi_sum, log_lik
+
+
+def _hmm_viterbi(log_pi: np.ndarray, log_trans: np.ndarray, log_b: np.ndarray) -> np.ndarray:
+    """
+    Batched Viterbi decoding. Returns the most likely state path (T, N) as int8.
+    """
+    n_periods, n_states, n_assets = log_b.shape
+    backptr = np.empty((n_periods, n_states, n_assets), dtype=np.int8)
+    scores = np.empty((n_states, n_states, n_assets))
+    delta = log_pi + log_b[0]
+
+    for t in range(1, n_periods):
+        np.add(delta[:, None, :], log_trans, out=scores)
+        backptr[t] = scores.argmax(axis=0)
+        delta = scores.max(axis=0)
+        delta += log_b[t]
+
+    assets = np.arange(n_assets)
+    path = np.empty((n_periods, n_assets), dtype=np.int8)
+    path[-1] = delta.argmax(axis=0)
+    for t in range(n_periods - 1, 0, -1):
+        path[t - 1] = backptr[t, path[t], assets]
+
+    return path
+
+
+def fit_gaussian_hmm(
+    returns: pd.DataFrame,
+    n_states: int = 2,
+    n_iter: int = 200,
+    tol: float = 1e-4,
+    init_params: dict | None = None
+) -> dict:
+    """
+    Fit a Gaussian hidden-Markov regime model to every asset at once.
+
+    Baum-Welch runs in scaled probability space with the recursions batched
+    across assets (only the time loop is sequential; emissions, expected
+    transition counts and M-step sums are vectorized over time). States are
+    ordered by variance so code 0 is the calmest regime for every asset.
+
+    Parameters:
+        returns (pd.DataFrame): DataFrame of returns (no NaNs)
+        n_states (int): Number of hidden regimes
+        n_iter (int): Maximum EM iterations
+        tol (float): Stop when no asset improves its per-period log-likelihood by more than tol
+        init_params (dict): "params" from a previous fit, used as a warm start
+
+    Returns:
+        dict: int8 Viterbi labels, category map, smoothed state probabilities,
+        fitted parameters, log-likelihoods, the number of EM iterations run and
+        whether EM converged within n_iter
     """
-    regimes = pd.Series(index=rolling_volatility.index, dtype="object")
+    if returns.isna().any().any():
+        raise ValueError("Returns must not contain missing values.")
+    if n_states < 2:
+        raise ValueError("n_states must be at least 2.")
+
+    raw = returns.to_numpy(dtype=float)
+    n_periods, n_assets = raw.shape
+    if n_periods < 2 * n_states:
+        raise ValueError("Not enough observations to fit the regime model.")
+
+    # Standardize each asset so one set of initial values and floors fits all
+    loc = raw.mean(axis=0)
+    scale = raw.std(axis=0)
+    scale[scale == 0] = 1.0
+    x = (raw - loc) / scale
+
+    # Parameters are held state-major: mean/var/pi are (K, N), trans is (K, K, N)
+    if init_params is not None:
+        mean = (np.asarray(init_params["means"]).T - loc) / scale
+        var = (np.asarray(init_params["volatilities"]).T / scale) ** 2
+        trans = np.asarray(init_params["transition"], dtype=float).transpose(1, 2, 0).copy()
+        pi = np.asarray(init_params["initial"], dtype=float).T.copy()
+    else:
+        mean = np.zeros((n_states, n_assets))
+        var = np.tile(np.geomspace(0.5, 2.0, n_states)[:, None] ** 2, (1, n_assets))
+        stay = 0.95
+        trans = np.full((n_states, n_states, n_assets), (1 - stay) / (n_states - 1))
+        trans[np.arange(n_states), np.arange(n_states)] = stay
+        pi = np.full((n_states, n_assets), 1.0 / n_states)
+
+    prev_lik = np.full(n_assets, -np.inf)
+    iterations = 0
+    converged = False
+    with np.errstate(divide="ignore", under="ignore"):
+        for _ in range(n_iter):
+            iterations += 1
+            log_b = _gaussian_log_density(x, mean, var)
+            gamma, xi_sum, log_lik = _hmm_e_step(pi, trans, log_b)
+            weight = gamma.sum(axis=0)
+
+            pi = np.maximum(gamma[0], 1e-12)
+            pi /= pi.sum(axis=0)
+            trans = np.maximum(xi_sum, 1e-12)
+            trans /= trans.sum(axis=1, keepdims=True)
+            mean = np.einsum("tkn,tn->kn", gamma, x) / weight
+            var = np.einsum("tkn,tkn->kn", gamma, (x[:, None, :] - mean[None]) ** 2) / weight
+            var = np.maximum(var, 1e-4)
+
+            converged = np.all((log_lik - prev_lik) / n_periods < tol)
+            prev_lik = log_lik
+            if converged:
+                break
+
+        # Order states by variance (calm -> volatile) for every asset
+        order = np.argsort(var, axis=0)
+        mean = np.take_along_axis(mean, order, axis=0)
+        var = np.take_along_axis(var, order, axis=0)
+        pi = np.take_along_axis(pi, order, axis=0)
+        trans = np.take_along_axis(np.take_along_axis(trans, order[:, None, :], axis=0), order[None, :, :], axis=1)
 
-    regimes[rolling_volatility > high_threshold] = "Volatile"
-    regimes[rolling_volatility < low_threshold] = "Calm"
-    regimes[(rolling_volatility <= high_threshold) & (rolling_volatility >= low_threshold)] = "Neutral"
+        log_b = _gaussian_log_density(x, mean, var)
+        gamma, _, log_lik = _hmm_e_step(pi, trans, log_b)
+        labels = _hmm_viterbi(np.log(pi), np.log(trans), log_b)
 
-    return regimes
+    params = {
+        "means": (mean * scale + loc).T,
+        "volatilities": (np.sqrt(var) * scale).T,
+        "transition": trans.transpose(2, 0, 1),
+        "initial": pi.T
+    }
+    log_lik_raw = log_lik - n_periods * np.log(scale)
+    return {
+        "labels": pd.DataFrame(labels, index=returns.index, columns=returns.columns),
+        "categories": _hmm_state_labels(n_states),
+        "probabilities": gamma.transpose(0, 2, 1),
+        "volatile_probability": pd.DataFrame(gamma[:, -1, :], index=returns.index, columns=returns.columns),
+        "params": params,
+        "log_likelihood": pd.Series(log_lik_raw, index=returns.columns),
+        "iterations": iterations,
+        "converged": bool(converged)
+    }
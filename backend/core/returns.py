@@ -11,7 +11,7 @@ def clean_price_data(df: pd.DataFrame) -> pd.DataFrame:
     """
     df = df.copy()
     df.index = pd.to_datetime(df.index)
-    df.sort.index(inplace=True)
+    df.sort_index(inplace=True)
     df = df.ffill().dropna(how='any')
     return df
 
@@ -48,4 +48,116 @@ def resample_prices(df: pd.DataFrame, frequency: str = 'W') -> pd.DataFrame:
     Resample price data to a new frequency (e.g., weekly/monthly)
     frequency: 'D', 'W', 'M', 'Q', etc. 
     """
-    return df.resample(frequency).last().dropna()
\ No newline at end of file
+    return df.resample(frequency).last().dropna()
+
+def compute_log_returns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Compute log returns: r_t = ln(P_t / P_{t-1})
+    """
+    return compute_returns(df, method='log')
+
+
+def _last_of_period(df: pd.DataFrame, period: str) -> pd.DataFrame:
+    """
+    Keep the last observation of each calendar period, indexed by its actual date.
+    Equivalent to resample(period).last() on NaN-free data, in one O(T) pass.
+    """
+    periods = df.index.to_period(period)
+    is_last = np.append(periods[1:] != periods[:-1], True)
+    return df[is_last]
+
+
+class ReturnPyramid:
+    """
+    Dataset-level price and return pyramid.
+
+    Daily, weekly, monthly and quarterly prices and returns are computed once
+    and stored side by side; `core` functions that take a `freq` pick the
+    matching level through `select_returns` instead of resampling again.
+    New daily bars are appended with `extend`, which only rebuilds the
+    trailing (possibly incomplete) period of each coarser level.
+    """
+
+    LEVELS = {'daily': None, 'weekly': 'W', 'monthly': 'M', 'quarterly': 'Q'}
+
+    def __init__(self, daily_prices: pd.DataFrame, method: str = 'log'):
+        if method not in {'log', 'simple'}:
+            raise ValueError("method must be 'log' or 'simple'")
+        if not isinstance(daily_prices.index, pd.DatetimeIndex):
+            raise ValueError("ReturnPyramid requires a DatetimeIndex.")
+        if daily_prices.isna().any().any():
+            raise ValueError("Prices must be cleaned (no NaNs) before building a pyramid.")
+
+        self.method = method
+        self._prices = {}
+        self._returns = {}
+
+        daily_prices = daily_prices.sort_index()
+        for freq, period in self.LEVELS.items():
+            level = daily_prices if period is None else _last_of_period(daily_prices, period)
+            self._prices[freq] = level
+            self._returns[freq] = compute_returns(level, method=method)
+
+    @property
+    def columns(self) -> pd.Index:
+        return self._prices['daily'].columns
+
+    def prices(self, freq: str = 'daily') -> pd.DataFrame:
+        if freq not in self.LEVELS:
+            raise ValueError(f"Unsupported frequency: {freq}. Choose from {list(self.LEVELS.keys())}")
+        return self._prices[freq]
+
+    def returns(self, freq: str = 'daily') -> pd.DataFrame:
+        if freq not in self.LEVELS:
+            raise ValueError(f"Unsupported frequency: {freq}. Choose from {list(self.LEVELS.keys())}")
+        return self._returns[freq]
+
+    def extend(self, new_prices: pd.DataFrame):
+        """
+        Append new daily bars (dated after the current last bar) to every level.
+        """
+        if new_prices.empty:
+            return
+        new_prices = new_prices.sort_index()
+        daily = self._prices['daily']
+
+        if not new_prices.columns.equals(daily.columns):
+            raise ValueError("New prices must have the same columns as the pyramid.")
+        if new_prices.index[0] <= daily.index[-1]:
+            raise ValueError("New prices must be dated after the last bar in the pyramid.")
+        if new_prices.isna().any().any():
+            raise ValueError("New prices must not contain NaNs.")
+
+        daily = pd.concat([daily, new_prices])
+
+        for freq, period in self.LEVELS.items():
+            old_prices = self._prices[freq]
+
+            if period is None:
+                kept = old_prices
+                tail = new_prices
+            else:
+                # The period of the first new bar may already have a (partial) row
+                cutoff = new_prices.index[:1].to_period(period)[0].start_time
+                kept = old_prices[old_prices.index < cutoff]
+                tail = _last_of_period(daily[daily.index >= cutoff], period)
+
+            level = pd.concat([kept, tail])
+
+            # Returns of the kept rows are unchanged; recompute from the last kept price on
+            anchor = max(len(kept) - 1, 0)
+            self._returns[freq] = pd.concat([
+                self._returns[freq].iloc[:anchor],
+                compute_returns(level.iloc[anchor:], method=self.method)
+            ])
+            self._prices[freq] = level
+
+
+def select_returns(returns, freq: str = 'daily') -> pd.DataFrame:
+    """
+    Resolve the returns to use for `freq`: the matching level of a
+    ReturnPyramid, or the DataFrame itself (assumed to already be at `freq`).
+    """
+    if isinstance(returns, ReturnPyramid):
+        return returns.returns(freq)
+    return returns
@@ -1,91 +1,398 @@
 import pandas as pd
 import numpy as np
 
-from core.returns import compute_log_returns
-from core.risk_metrics import compute_sharpe_ratio, compute_sortino_ratio, compute_calmar_ratio, compute_max_drawdown, compute_cagr
-from core.covariance import compute_annualized_covariance
-from core.portfolio_risk import compute_portfolio_volatility, compute_marginal_contribution_to_risk, compute_component_contribution_to_risk
-from core.var_cvar import compute_historical_var, compute_historical_cvar, compute_parametric_var, compute_parametric_cvar
-from core.stress_testing import simulate_stress_scenario
-from core.correlation import compute_correlation_matrix
-from core.regime_detection import compute_rolling_volatility, detect_volatility_regime
-from core.optimization import maximize_sharpe_ratio, minimize_volatility, compute_portfolio_return
+# name -> (dependency names, function of the dependencies)
+_NODES = {}
+
+
+def _node(name: str, *deps: str):
+    def register(fn):
+        _NODES[name] = (deps, fn)
+        return fn
+    return register
+
+
+class RiskGraph:
+    """
+    Lazily evaluated dependency graph of report building blocks.
+
+    Inputs are the nodes "prices", "weights" and "config". Every other node is
+    computed on first request from its dependencies and memoized, so a view
+    that asks for a handful of nodes runs only what those nodes need, each
+    exactly once.
+    """
+
+    def __init__(self, prices: pd.DataFrame, weights: np.ndarray, config: dict):
+        self._values = {"prices": prices, "weights": weights, "config": config}
+
+    def __getitem__(self, name: str):
+        if name not in self._values:
+            if name not in _NODES:
+                raise KeyError(f"Unknown report node: {name}")
+            deps, fn = _NODES[name]
+            self._values[name] = fn(*(self[dep] for dep in deps))
+        return self._values[name]
+
+    @property
+    def config(self) -> dict:
+        return self._values["config"]
+
+
+# --- Nodes ---
+# Each node imports its core module on first use, so a view only loads what it needs
+
+@_node("log_returns", "prices")
+def _log_returns(prices):
+    from core.returns import compute_log_returns
+    return compute_log_returns(prices)
+
+
+@_node("rolling_volatility", "log_returns", "config")
+def _rolling_volatility(log_returns, config):
+    from core.regime_detection import compute_rolling_volatility
+    return compute_rolling_volatility(log_returns, window=config["window"])
+
+
+@_node("average_volatility", "rolling_volatility")
+def _average_volatility(rolling_vol):
+    return rolling_vol.mean(axis=1)
+
+
+@_node("volatility_regime", "average_volatility", "config")
+def _volatility_regime(avg_vol, config):
+    from core.regime_detection import detect_volatility_regime
+    return detect_volatility_regime(avg_vol, config["high_vol_threshold"], config["low_vol_threshold"])
+
+
+@_node("hmm_regime", "log_returns", "config")
+def _hmm_regime(log_returns, config):
+    from core.regime_detection import fit_gaussian_hmm
+    # Every asset plus the equal-weighted portfolio in one batch
+    hmm_input = log_returns.assign(portfolio=log_returns.mean(axis=1))
+    return fit_gaussian_hmm(
+        hmm_input,
+        n_states=config.get("hmm_states", 2),
+        n_iter=config.get("hmm_max_iter", 200)
+    )
+
+
+@_node("rolling_sharpe", "log_returns", "config")
+def _rolling_sharpe(log_returns, config):
+    from core.regime_detection import compute_rolling_sharpe_ratio
+    return compute_rolling_sharpe_ratio(
+        log_returns,
+        risk_free_rate=config["risk_free_rate"],
+        window=config["window"],
+        freq=config["freq"]
+    )
+
+
+@_node("cumulative_returns", "log_returns")
+def _cumulative_returns(log_returns):
+    from core.returns import compute_cumulative_returns
+    return compute_cumulative_returns(log_returns).mean(axis=1)
+
+
+@_node("covariance", "log_returns", "config")
+def _covariance(log_returns, config):
+    from core.covariance import compute_annualized_covariance
+    return compute_annualized_covariance(log_returns, freq=config["freq"])
+
+
+@_node("portfolio_volatility", "weights", "covariance")
+def _portfolio_volatility(weights, cov_matrix):
+    from core.portfolio_risk import compute_portfolio_volatility
+    return float(compute_portfolio_volatility(weights, cov_matrix))
+
+
+@_node("portfolio_return", "weights", "log_returns", "config")
+def _portfolio_return(weights, log_returns, config):
+    from core.optimization import compute_portfolio_return
+    return float(compute_portfolio_return(weights, log_returns.mean(), freq=config["freq"]))
+
+
+@_node("mctr", "weights", "covariance")
+def _mctr(weights, cov_matrix):
+    from core.portfolio_risk import compute_marginal_contribution_to_risk
+    return compute_marginal_contribution_to_risk(weights, cov_matrix)
+
+
+@_node("cctr", "weights", "covariance")
+def _cctr(weights, cov_matrix):
+    from core.portfolio_risk import compute_component_contribution_to_risk
+    return compute_component_contribution_to_risk(weights, cov_matrix)
+
+
+@_node("historical_var", "log_returns", "config")
+def _historical_var(log_returns, config):
+    from core.var_cvar import compute_historical_var
+    return compute_historical_var(log_returns, config["confidence_level"])
+
+
+@_node("historical_cvar", "log_returns", "config")
+def _historical_cvar(log_returns, config):
+    from core.var_cvar import compute_historical_cvar
+    return compute_historical_cvar(log_returns, config["confidence_level"])
+
+
+@_node("parametric_var", "log_returns", "config")
+def _parametric_var(log_returns, config):
+    from core.var_cvar import compute_parametric_var
+    return compute_parametric_var(log_returns, config["confidence_level"])
+
+
+@_node("parametric_cvar", "log_returns", "config")
+def _parametric_cvar(log_returns, config):
+    from core.var_cvar import compute_parametric_cvar
+    return compute_parametric_cvar(log_returns, config["confidence_level"])
+
+
+@_node("sharpe", "log_returns", "config")
+def _sharpe(log_returns, config):
+    from core.risk_metrics import compute_sharpe_ratio
+    return compute_sharpe_ratio(log_returns, config["risk_free_rate"], freq=config["freq"])
+
+
+@_node("sortino", "log_returns", "config")
+def _sortino(log_returns, config):
+    from core.risk_metrics import compute_sortino_ratio
+    return compute_sortino_ratio(log_returns, config["risk_free_rate"], freq=config["freq"])
+
+
+@_node("calmar", "prices", "config")
+def _calmar(prices, config):
+    from core.risk_metrics import compute_calmar_ratio
+    return compute_calmar_ratio(prices, freq=config["freq"])
+
+
+@_node("cagr", "prices", "config")
+def _cagr(prices, config):
+    from core.risk_metrics import compute_cagr
+    return compute_cagr(prices, freq=config["freq"])
+
+
+@_node("max_drawdown", "prices")
+def _max_drawdown(prices):
+    from core.risk_metrics import compute_max_drawdown
+    return compute_max_drawdown(prices)
+
+
+@_node("correlation_matrix", "log_returns")
+def _correlation_matrix(log_returns):
+    from core.correlation import compute_correlation_matrix
+    return compute_correlation_matrix(log_returns)
+
+
+@_node("drawdowns", "prices", "weights", "config")
+def _drawdowns(prices, weights, config):
+    from core.drawdown import compute_drawdown_analytics
+    return compute_drawdown_analytics(
+        prices,
+        weights,
+        top_n=config.get("drawdown_top_n", 5),
+        window=config.get("drawdown_window")
+    )
+
+
+@_node("confidence_intervals", "log_returns", "config")
+def _confidence_intervals(log_returns, config):
+    from core.bootstrap import bootstrap_confidence_intervals
+    options = config.get("bootstrap", {})
+    return bootstrap_confidence_intervals(
+        log_returns,
+        risk_free_rate=config["risk_free_rate"],
+        freq=config["freq"],
+        confidence_level=config["confidence_level"],
+        **options
+    )
+
+
+# --- JSON conversion ---
+# JSON has no NaN/inf (rolling warm-up rows, undefined ratios), so they become None
+
+def _finite(value, digits: int | None = None):
+    value = float(value)
+    if not np.isfinite(value):
+        return None
+    return round(value, digits) if digits is not None else value
+
+
+def _to_dict(obj) -> dict:
+    """
+    Series/DataFrame -> dict with missing and non-finite values as None.
+    """
+    if isinstance(obj, pd.Series) and not pd.api.types.is_numeric_dtype(obj):
+        mask = obj.notna().to_numpy()
+    else:
+        mask = np.isfinite(obj.to_numpy(dtype=float))
+    return obj.astype(object).where(mask, None).to_dict()
+
+
+def _to_list(values: np.ndarray) -> list:
+    return [_finite(v) for v in values]
+
+
+def _json_safe(obj):
+    """
+    Replace non-finite floats in a (small) nested dict/list structure.
+    """
+    if isinstance(obj, dict):
+        return {k: _json_safe(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_json_safe(v) for v in obj]
+    if isinstance(obj, (float, np.floating)):
+        return _finite(obj)
+    return obj
+
+
+# --- Report sections ---
+
+def _section_portfolio(graph: RiskGraph) -> dict:
+    return {
+        "expected_return": _finite(graph["portfolio_return"]),
+        "volatility": _finite(graph["portfolio_volatility"]),
+        "sharpe_ratio": _finite(graph["sharpe"].mean()),
+        "sortino_ratio": _finite(graph["sortino"].mean()),
+        "calmar_ratio": _finite(graph["calmar"].mean()),
+        "cagr": _finite(graph["cagr"].mean()),
+        "max_drawdown": _finite(graph["max_drawdown"].mean())
+    }
+
+
+def _section_risk_contributions(graph: RiskGraph) -> dict:
+    return {
+        "marginal": _to_list(graph["mctr"]),
+        "component": _to_list(graph["cctr"])
+    }
+
+
+def _section_tail_risk(graph: RiskGraph) -> dict:
+    return {
+        "historical_var": _to_dict(graph["historical_var"]),
+        "historical_cvar": _to_dict(graph["historical_cvar"]),
+        "parametric_var": _to_dict(graph["parametric_var"]),
+        "parametric_cvar": _to_dict(graph["parametric_cvar"])
+    }
+
+
+def _section_correlation_matrix(graph: RiskGraph) -> dict:
+    return _to_dict(graph["correlation_matrix"])
+
+
+def _section_drawdowns(graph: RiskGraph) -> dict:
+    return _json_safe(graph["drawdowns"]["summary"])
+
+
+def _section_regime(graph: RiskGraph) -> dict:
+    return {
+        "labels": _to_dict(graph["volatility_regime"]),
+        "rolling_volatility": _to_dict(graph["rolling_volatility"])
+    }
+
+
+def _section_confidence_intervals(graph: RiskGraph) -> dict:
+    return _json_safe(graph["confidence_intervals"])
+
+
+REPORT_SECTIONS = {
+    "portfolio": _section_portfolio,
+    "risk_contributions": _section_risk_contributions,
+    "tail_risk": _section_tail_risk,
+    "correlation_matrix": _section_correlation_matrix,
+    "drawdowns": _section_drawdowns,
+    "regime": _section_regime,
+    "confidence_intervals": _section_confidence_intervals
+}
+
+# Bootstrap intervals are opt-in: they cost far more than the rest of the report
+DEFAULT_SECTIONS = [name for name in REPORT_SECTIONS if name != "confidence_intervals"]
+
 
 def generate_risk_report(
     prices: pd.DataFrame,
     weights: np.ndarray,
-    config: dict
+    config: dict,
+    sections: list[str] | None = None
 ) -> dict:
     """
-    Generate a full portfolio risk report.
+    Generate a portfolio risk report.
 
     Parameters:
         prices (pd.DataFrame): Price data
         weights (np.ndarray): Portfolio weights (aligned with prices.columns)
         config (dict): Settings like freq, window, confidence_level, risk_free_rate
+        sections (list[str]): Sections to include (see REPORT_SECTIONS); DEFAULT_SECTIONS
+            if None. Only the graph nodes needed by these sections are computed.
 
     Returns:
-        dict: Full risk metrics and decompositions
+        dict: Requested risk metrics and decompositions
     """
-    # Step 1: Returns
-    log_returns = compute_log_returns(prices)
-
-    # Step 2: Rolling metrics
-    rolling_vol = compute_rolling_volatility(log_returns, window=config["window"])
-    volatility_regime = detect_volatility_regime(
-        rolling_vol.mean(axis=1),
-        config["high_vol_threshold"],
-        config["low_vol_threshold"]
-    )
+    if sections is None:
+        sections = DEFAULT_SECTIONS
 
-    # Step 3: Portfolio stats
-    cov_matrix = compute_annualized_covariance(log_returns, freq=config["freq"])
-    port_vol = compute_portfolio_volatility(weights, cov_matrix, freq=config["freq"])
-    port_ret = compute_portfolio_return(weights, log_returns.mean(), freq=config["freq"])
+    unknown = [s for s in sections if s not in REPORT_SECTIONS]
+    if unknown:
+        raise ValueError(f"Unknown report sections: {unknown}. Choose from {list(REPORT_SECTIONS)}")
 
-    # Step 4: Risk contribution
-    mctr = compute_marginal_contribution_to_risk(weights, cov_matrix)
-    cctr = compute_component_contribution_to_risk(weights, cov_matrix)
+    graph = RiskGraph(prices, weights, config)
+    return {name: REPORT_SECTIONS[name](graph) for name in sections}
 
-    # Step 5: VaR & CVaR
-    hist_var = compute_historical_var(log_returns, config["confidence_level"])
-    hist_cvar = compute_historical_cvar(log_returns, config["confidence_level"])
-    param_var = compute_parametric_var(log_returns, config["confidence_level"])
-    param_cvar = compute_parametric_cvar(log_returns, config["confidence_level"])
 
-    # Step 6: Traditional metrics
-    sharpe = compute_sharpe_ratio(log_returns, config["risk_free_rate"], freq=config["freq"])
-    sortino = compute_sortino_ratio(log_returns, config["risk_free_rate"], freq=config["freq"])
-    calmar = compute_calmar_ratio(prices, freq=config["freq"])
-    cagr = compute_cagr(prices)
-    max_dd = compute_max_drawdown(prices)
+def generate_risk_summary(prices: pd.DataFrame, weights: np.ndarray, config: dict) -> dict:
+    """
+    Headline portfolio numbers (the /risk-summary view over the report graph).
 
-    # Step 7: Correlation matrix
-    corr_matrix = compute_correlation_matrix(log_returns)
+    Returns:
+        dict: Point-in-time summary metrics rounded to 5 decimals
+    """
+    graph = RiskGraph(prices, weights, config)
+    regime = graph["volatility_regime"].iloc[-1]
 
     return {
-        "portfolio": {
-            "expected_return": port_ret,
-            "volatility": port_vol,
-            "sharpe_ratio": float(sharpe.mean()),
-            "sortino_ratio": float(sortino.mean()),
-            "calmar_ratio": float(calmar.mean()),
-            "cagr": float(cagr.mean()),
-            "max_drawdown": float(max_dd.mean())
-        },
-        "risk_contributions": {
-            "marginal": mctr.tolist(),
-            "component": cctr.tolist()
-        },
-        "tail_risk": {
-            "historical_var": hist_var.to_dict(),
-            "historical_cvar": hist_cvar.to_dict(),
-            "parametric_var": param_var.to_dict(),
-            "parametric_cvar": param_cvar.to_dict()
-        },
-        "correlation_matrix": corr_matrix.to_dict(),
-        "regime": {
-            "labels": volatility_regime.astype(str).to_dict(),
-            "rolling_volatility": rolling_vol.to_dict()
+        "portfolio_return": _finite(graph["portfolio_return"], 5),
+        "portfolio_volatility": _finite(graph["portfolio_volatility"], 5),
+        "sharpe_ratio": _finite(graph["sharpe"].mean(), 5),
+        "cagr": _finite(graph["cagr"].mean(), 5),
+        "max_drawdown": _finite(graph["max_drawdown"].mean(), 5),
+        "parametric_var": _finite(graph["parametric_var"].mean(), 5),
+        "parametric_cvar": _finite(graph["parametric_cvar"].mean(), 5),
+        "current_volatility": _finite(graph["average_volatility"].iloc[-1], 5),
+        "regime": None if pd.isna(regime) else regime
+    }
+
+
+def generate_risk_history(prices: pd.DataFrame, config: dict) -> dict:
+    """
+    Time series view (the /risk-history view over the report graph) for an
+    equal-weighted portfolio of the given assets.
+
+    Returns:
+        dict: Rolling metrics, regime labels, cumulative returns and drawdowns
+    """
+    n_assets = prices.shape[1]
+    graph = RiskGraph(prices, np.ones(n_assets) / n_assets, {"drawdown_window": config["window"], **config})
+
+    if config.get("regime_model", "threshold") == "hmm":
+        hmm = graph["hmm_regime"]
+        regime = {
+            "regime_labels": _to_dict(hmm["labels"]["portfolio"].map(hmm["categories"])),
+            "regime_probabilities": _to_dict(hmm["volatile_probability"]["portfolio"].round(5)),
+            "regime_converged": hmm["converged"],
+            "asset_regimes": {
+                "codes": hmm["labels"].drop(columns="portfolio").to_dict(),
+                "categories": hmm["categories"]
+            }
         }
+    else:
+        regime = {"regime_labels": _to_dict(graph["volatility_regime"])}
+
+    drawdowns = graph["drawdowns"]
+
+    return {
+        "rolling_volatility": _to_dict(graph["rolling_volatility"].round(5)),
+        "rolling_sharpe_ratio": _to_dict(graph["rolling_sharpe"].round(5)),
+        **regime,
+        "portfolio_cumulative_returns": _to_dict(graph["cumulative_returns"].round(5)),
+        "drawdowns": _json_safe(drawdowns["summary"]),
+        "rolling_max_drawdown": _to_dict(drawdowns["rolling_max_drawdown"].round(5))
     }
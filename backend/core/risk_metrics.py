@@ -1,29 +1,27 @@
 import pandas as pd
 import numpy as np
+from core.frequency import get_annualization_factor
+from core.returns import select_returns
 
 
 def compute_volatility(returns: pd.DataFrame, freq: str = 'daily') -> pd.Series:
     """
     Annualized volatility of each asset.
     """
-    freq_map = {'daily': 252, 'weekly': 52, 'monthly': 12}
-    if freq not in freq_map:
-        raise ValueError(f"Unsupported frequency: {freq}")
-    
-    return returns.std() * np.sqrt(freq_map[freq])
+    annual_factor = get_annualization_factor(freq)
+    return select_returns(returns, freq).std() * np.sqrt(annual_factor)
 
 
 def compute_sharpe_ratio(returns: pd.DataFrame, risk_free_rate: float = 0.0, freq: str = 'daily') -> pd.Series:
     """
     Annualized Sharpe Ratio of each asset.
     """
-    freq_map = {'daily': 252, 'weekly': 52, 'monthly': 12}
-    if freq not in freq_map:
-        raise ValueError(f"Unsupported frequency: {freq}")
+    annual_factor = get_annualization_factor(freq)
+    returns = select_returns(returns, freq)
 
-    excess_returns = returns - risk_free_rate / freq_map[freq]
-    annualized_returns = excess_returns.mean() * freq_map[freq]
-    annualized_volatility = excess_returns.std() * np.sqrt(freq_map[freq])
+    excess_returns = returns - risk_free_rate / annual_factor
+    annualized_returns = excess_returns.mean() * annual_factor
+    annualized_volatility = excess_returns.std() * np.sqrt(annual_factor)
     
     return annualized_returns / annualized_volatility
 
@@ -37,11 +35,12 @@ def compute_max_drawdown(cumulative_returns: pd.DataFrame) -> pd.Series:
     return drawdown.min()
 
 
-def compute_cagr(cumulative_returns: pd.DataFrame, periods_per_year: int = 252) -> pd.Series:
+def compute_cagr(cumulative_returns: pd.DataFrame, freq: str = 'daily') -> pd.Series:
     """
     Compute Compound Annual Growth Rate.
     Assumes input is cumulative returns like (1 + r).cumprod() - 1
     """
+    periods_per_year = get_annualization_factor(freq)
     n_periods = cumulative_returns.shape[0]
     ending_values = (1 + cumulative_returns).iloc[-1]
     return (1 + ending_values) ** (periods_per_year / n_periods) - 1
@@ -50,13 +49,12 @@ def compute_sortino_ratio(returns: pd.DataFrame, risk_free_rate: float = 0.0, fr
     """
     Sortino Ratio = (Return - RiskFree) / Downside Deviation
     """
-    freq_map = {'daily': 252, 'weekly': 52, 'monthly': 12}
-    if freq not in freq_map:
-        raise ValueError(f"Unsupported frequency: {freq}")
+    annual_factor = get_annualization_factor(freq)
+    returns = select_returns(returns, freq)
 
     downside_returns = returns[returns < 0]
-    expected_return = (returns.mean() - risk_free_rate / freq_map[freq]) * freq_map[freq]
-    downside_deviation = downside_returns.std(ddof=0) * np.sqrt(freq_map[freq])
+    expected_return = (returns.mean() - risk_free_rate / annual_factor) * annual_factor
+    downside_deviation = downside_returns.std(ddof=0) * np.sqrt(annual_factor)
 
     return expected_return / downside_deviation
 
@@ -65,23 +63,30 @@ def compute_calmar_ratio(cumulative_returns: pd.DataFrame, freq: str = 'daily')
     """
     Calmar Ratio = CAGR / |Max Drawdown|
     """
-    cagr = compute_cagr(cumulative_returns)
+    cagr = compute_cagr(cumulative_returns, freq=freq)
     max_dd = compute_max_drawdown(cumulative_returns).abs()
     return cagr / max_dd
 
-def compute_rolling_sharpe(returns: pd.DataFrame, window: int = 60, risk_free_rate: float = 0.0) -> pd.DataFrame:
+def compute_rolling_sharpe(
+    returns: pd.DataFrame,
+    window: int = 60,
+    risk_free_rate: float = 0.0,
+    freq: str = 'daily'
+) -> pd.DataFrame:
     """
     Compute rolling Sharpe Ratio.
     """
-    excess = returns - risk_free_rate / 252
-    return (excess.rolling(window).mean() / excess.rolling(window).std()) * np.sqrt(252)
+    annual_factor = get_annualization_factor(freq)
+    excess = select_returns(returns, freq) - risk_free_rate / annual_factor
+    return (excess.rolling(window).mean() / excess.rolling(window).std()) * np.sqrt(annual_factor)
 
 
-def compute_rolling_volatility(returns: pd.DataFrame, window: int = 60) -> pd.DataFrame:
+def compute_rolling_volatility(returns: pd.DataFrame, window: int = 60, freq: str = 'daily') -> pd.DataFrame:
     """
     Rolling annualized volatility.
     """
-    return returns.rolling(window).std() * np.sqrt(252)
+    annual_factor = get_annualization_factor(freq)
+    return select_returns(returns, freq).rolling(window).std() * np.sqrt(annual_factor)
 
 def compute_skewness(returns: pd.DataFrame) -> pd.Series:
     """
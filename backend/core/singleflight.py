@@ -0,0 +1,68 @@
+import asyncio
+import hashlib
+from collections import defaultdict
+
+from starlette.concurrency import run_in_threadpool
+
+
+def request_key(namespace: str, body: bytes) -> str:
+    """
+    Coalescing key for a request: a BLAKE2b digest of the raw request body.
+
+    The key is taken over the raw bytes, not the parsed model, so payloads
+    that differ only in key order or whitespace are not merged.
+    """
+    digest = hashlib.blake2b(namespace.encode(), digest_size=16)
+    digest.update(body)
+    return digest.hexdigest()
+
+
+class SingleFlight:
+    """
+    Coalesce identical concurrent calls.
+
+    The first caller for a key starts the computation in the thread pool as
+    its own task; every caller with that key, the first included, awaits it
+    on the event loop, so duplicates hold no worker thread and a disconnecting
+    client does not cancel the work for the others. Nothing is cached once
+    the call finishes, so later requests always recompute.
+
+    Only computations occupy threads from anyio's default limiter (40), so
+    that limit bounds concurrent *distinct* requests; raise it with
+    `anyio.to_thread.current_default_thread_limiter().total_tokens` if needed.
+    Must be used from the event loop (async handlers).
+    """
+
+    def __init__(self):
+        self._calls: dict[str, asyncio.Future] = {}
+        self._counts = defaultdict(lambda: {"executed": 0, "merged": 0})
+
+    def _finished(self, key: str, task: asyncio.Future) -> None:
+        self._calls.pop(key, None)
+        if not task.cancelled():
+            task.exception()  # mark retrieved even if every caller went away
+
+    async def do(self, namespace: str, key: str, fn):
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(run_in_threadpool(fn))
+            self._calls[key] = task
+            task.add_done_callback(lambda t: self._finished(key, t))
+            self._counts[namespace]["executed"] += 1
+        else:
+            self._counts[namespace]["merged"] += 1
+
+        return await asyncio.shield(task)
+
+    def stats(self) -> dict:
+        """
+        Per-namespace executed/merged counts and the number of calls in flight.
+        """
+        return {
+            "in_flight": len(self._calls),
+            "endpoints": {name: dict(counts) for name, counts in self._counts.items()}
+        }
+
+
+# Shared by all coalesced routes
+SINGLE_FLIGHT = SingleFlight()
@@ -0,0 +1,153 @@
+import numpy as np
+import pandas as pd
+from scipy.special import xlogy
+from scipy.stats import chi2
+
+
+def compute_rolling_historical_var(
+    returns: pd.DataFrame,
+    confidence_level: float = 0.95,
+    window: int = 250
+) -> pd.DataFrame:
+    """
+    Compute a rolling Historical VaR series for each asset.
+
+    Uses the same "higher" quantile convention as `compute_historical_var`;
+    pandas maintains the window order statistic incrementally, so each
+    column costs O(T log W) instead of re-sorting every window.
+
+    Parameters:
+        returns (pd.DataFrame): DataFrame of returns
+        confidence_level (float): VaR confidence level, e.g. 0.95
+        window (int): Rolling window size (in periods)
+
+    Returns:
+        pd.DataFrame: VaR at each date using the window ending on that date
+    """
+    if window < 1:
+        raise ValueError("window must be a positive integer.")
+    if len(returns) < window:
+        raise ValueError("Not enough observations for the requested window.")
+    if returns.isna().any().any():
+        raise ValueError("Returns must not contain missing values.")
+
+    return returns.rolling(window).quantile(1 - confidence_level, interpolation="higher")
+
+
+def kupiec_pof_test(n_obs: int, n_exceedances: int, confidence_level: float = 0.95) -> dict:
+    """
+    Kupiec proportion-of-failures (unconditional coverage) test.
+
+    LR_pof = -2 ln[(1-p)^(T-x) p^x] + 2 ln[(1-x/T)^(T-x) (x/T)^x],
+    asymptotically chi-squared with 1 degree of freedom.
+
+    Returns:
+        dict: Likelihood ratio statistic and p-value
+    """
+    if n_obs == 0:
+        return {"lr_statistic": float("nan"), "p_value": float("nan")}
+
+    p = 1 - confidence_level
+    x = n_exceedances
+    rate = x / n_obs
+
+    log_null = xlogy(n_obs - x, 1 - p) + xlogy(x, p)
+    log_alt = xlogy(n_obs - x, 1 - rate) + xlogy(x, rate)
+    lr = max(-2 * (log_null - log_alt), 0.0)
+
+    return {"lr_statistic": float(lr), "p_value": float(chi2.sf(lr, df=1))}
+
+
+def christoffersen_independence_test(exceedances: np.ndarray) -> dict:
+    """
+    Christoffersen independence test on a sequence of VaR exceedances.
+
+    Compares a first-order Markov chain for the hit sequence against the
+    i.i.d. alternative; asymptotically chi-squared with 1 degree of freedom.
+
+    Returns:
+        dict: Transition counts, likelihood ratio statistic and p-value
+    """
+    hits = np.asarray(exceedances, dtype=bool)
+    prev, curr = hits[:-1], hits[1:]
+
+    n00 = int(np.sum(~prev & ~curr))
+    n01 = int(np.sum(~prev & curr))
+    n10 = int(np.sum(prev & ~curr))
+    n11 = int(np.sum(prev & curr))
+    counts = {"n00": n00, "n01": n01, "n10": n10, "n11": n11}
+
+    total = n00 + n01 + n10 + n11
+    if total == 0:
+        return {**counts, "lr_statistic": float("nan"), "p_value": float("nan")}
+
+    pi0 = n01 / (n00 + n01) if n00 + n01 > 0 else 0.0
+    pi1 = n11 / (n10 + n11) if n10 + n11 > 0 else 0.0
+    pi = (n01 + n11) / total
+
+    log_null = xlogy(n00 + n10, 1 - pi) + xlogy(n01 + n11, pi)
+    log_alt = (
+        xlogy(n00, 1 - pi0) + xlogy(n01, pi0)
+        + xlogy(n10, 1 - pi1) + xlogy(n11, pi1)
+    )
+    lr = max(-2 * (log_null - log_alt), 0.0)
+
+    return {**counts, "lr_statistic": float(lr), "p_value": float(chi2.sf(lr, df=1))}
+
+
+def backtest_historical_var(
+    returns: pd.DataFrame,
+    confidence_level: float = 0.95,
+    window: int = 250
+) -> dict:
+    """
+    Backtest rolling Historical VaR for each asset.
+
+    The VaR estimated on the window ending at t-1 is the forecast for t;
+    an exceedance is recorded when the realized return falls below it.
+
+    Parameters:
+        returns (pd.DataFrame): DataFrame of returns
+        confidence_level (float): VaR confidence level, e.g. 0.95
+        window (int): Estimation window size (in periods)
+
+    Returns:
+        dict: VaR forecasts, exceedance flags and per-asset backtest statistics
+    """
+    var_forecast = compute_rolling_historical_var(returns, confidence_level, window).shift(1)
+    var_forecast = var_forecast.iloc[window:]
+    realized = returns.iloc[window:]
+
+    if realized.empty:
+        raise ValueError("At least window + 1 observations are required for a backtest.")
+
+    exceedances = realized < var_forecast
+    expected_rate = 1 - confidence_level
+
+    stats = {}
+    for col in returns.columns:
+        hits = exceedances[col].to_numpy()
+        n_obs = len(hits)
+        n_exc = int(hits.sum())
+        pof = kupiec_pof_test(n_obs, n_exc, confidence_level)
+        ind = christoffersen_independence_test(hits)
+        cc_lr = pof["lr_statistic"] + ind["lr_statistic"]
+
+        stats[col] = {
+            "observations": n_obs,
+            "exceedances": n_exc,
+            "expected_exceedances": n_obs * expected_rate,
+            "exceedance_rate": n_exc / n_obs,
+            "kupiec_pof": pof,
+            "christoffersen_independence": ind,
+            "conditional_coverage": {
+                "lr_statistic": float(cc_lr),
+                "p_value": float(chi2.sf(cc_lr, df=2))
+            }
+        }
+
+    return {
+        "var_forecast": var_forecast,
+        "exceedances": exceedances,
+        "statistics": stats
+    }
@@ -1,6 +1,7 @@
 import numpy as np
 import pandas as pd
 from scipy.stats import norm
+from core.garch import forecast_garch_volatility
 
 def compute_historical_var(returns: pd.DataFrame, confidence_level: float = 0.95) -> pd.Series:
     """
@@ -32,32 +33,67 @@ def compute_historical_cvar(returns: pd.DataFrame, confidence_level: float = 0.9
     return cvar
 
 
-def compute_parametric_var(returns: pd.DataFrame, confidence_level: float = 0.95) -> pd.Series:
+def compute_parametric_var(
+    returns: pd.DataFrame,
+    confidence_level: float = 0.95,
+    volatility: pd.Series | None = None
+) -> pd.Series:
     """
     Compute Parametric (Gaussian) VaR for each asset.
     VaR = - (μ + z * σ)
 
+    Parameters:
+        volatility (pd.Series): Optional σ per asset (e.g. a GARCH forecast);
+            defaults to the sample standard deviation
+
     Returns:
         pd.Series: Parametric VaR values for each asset
     """
     z = norm.ppf(1 - confidence_level)
     mean = returns.mean()
-    std = returns.std(ddof=0)
+    std = returns.std(ddof=0) if volatility is None else volatility
 
     return -(mean + z * std)
 
 
-def compute_parametric_cvar(returns: pd.DataFrame, confidence_level: float = 0.95) -> pd.Series:
+def compute_parametric_cvar(
+    returns: pd.DataFrame,
+    confidence_level: float = 0.95,
+    volatility: pd.Series | None = None
+) -> pd.Series:
     """
     Compute Parametric (Gaussian) CVaR for each asset.
     CVaR = - (μ + (φ(z) / (1 - α)) * σ)
 
+    Parameters:
+        volatility (pd.Series): Optional σ per asset (e.g. a GARCH forecast);
+            defaults to the sample standard deviation
+
     Returns:
         pd.Series: Parametric CVaR values for each asset
     """
     z = norm.ppf(1 - confidence_level)
     phi = norm.pdf(z)
     mean = returns.mean()
-    std = returns.std(ddof=0)
+    std = returns.std(ddof=0) if volatility is None else volatility
 
     return -(mean + (phi / (1 - confidence_level)) * std)
+
+
+def compute_garch_var_cvar(
+    returns: pd.DataFrame,
+    confidence_level: float = 0.95,
+    horizon: int = 1
+) -> tuple[pd.Series, pd.Series]:
+    """
+    Parametric VaR and CVaR using GARCH(1,1) forecast volatility instead of
+    the sample standard deviation.
+
+    Returns:
+        tuple: (VaR per asset, CVaR per asset)
+    """
+    volatility = forecast_garch_volatility(returns, horizon=horizon)
+    return (
+        compute_parametric_var(returns, confidence_level, volatility=volatility),
+        compute_parametric_cvar(returns, confidence_level, volatility=volatility)
+    )
@@ -0,0 +1,85 @@
+import importlib
+import os
+import threading
+import time
+
+WARMUP_ENV = "RISK_API_WARMUP"
+
+# Core modules that routes import on first use
+WARMUP_MODULES = [
+    "core.risk_engine",
+    "core.optimization",
+    "core.rebalance",
+    "core.stress_testing",
+    "core.var_cvar",
+    "core.var_backtest",
+    "core.what_if",
+]
+
+_STATUS = {"ready": False, "warmup": False, "seconds": None, "error": None}
+
+
+def warmup_enabled() -> bool:
+    return os.environ.get(WARMUP_ENV, "").lower() in {"1", "true", "yes"}
+
+
+def run_warmup(n_assets: int = 3, n_periods: int = 120) -> float:
+    """
+    Import the heavy core modules and run a tiny synthetic full risk report,
+    so the first real request does not pay for imports or first-call
+    initialization in BLAS, pandas and scipy.
+
+    Returns:
+        float: Warm-up time in seconds
+    """
+    start = time.perf_counter()
+    for module in WARMUP_MODULES:
+        importlib.import_module(module)
+
+    import numpy as np
+    import pandas as pd
+    from core.risk_engine import generate_risk_report, REPORT_SECTIONS
+
+    rng = np.random.default_rng(0)
+    log_prices = np.cumsum(rng.normal(0, 0.01, size=(n_periods, n_assets)), axis=0)
+    prices = pd.DataFrame(100 * np.exp(log_prices), columns=[f"ASSET{i}" for i in range(n_assets)])
+    config = {
+        "freq": "daily",
+        "confidence_level": 0.95,
+        "window": 20,
+        "risk_free_rate": 0.02,
+        "high_vol_threshold": 0.03,
+        "low_vol_threshold": 0.01,
+        "bootstrap": {"n_samples": 20}
+    }
+    generate_risk_report(prices, np.ones(n_assets) / n_assets, config, sections=list(REPORT_SECTIONS))
+
+    return time.perf_counter() - start
+
+
+def _warmup_thread():
+    try:
+        _STATUS["seconds"] = round(run_warmup(), 4)
+    except Exception as e:
+        # A failed warm-up only costs latency; keep serving
+        _STATUS["error"] = str(e)
+    finally:
+        _STATUS["ready"] = True
+
+
+def start_warmup() -> None:
+    """
+    Start the warm-up in a background thread if RISK_API_WARMUP is set,
+    otherwise mark the app ready immediately (heavy modules then load on
+    the first request that needs them).
+    """
+    if not warmup_enabled():
+        _STATUS["ready"] = True
+        return
+
+    _STATUS["warmup"] = True
+    threading.Thread(target=_warmup_thread, name="warmup", daemon=True).start()
+
+
+def readiness() -> dict:
+    return dict(_STATUS)
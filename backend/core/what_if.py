@@ -0,0 +1,200 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+from scipy.stats import norm
+
+from core.frequency import get_annualization_factor
+from core.returns import compute_log_returns
+
+_STATE_CACHE: "OrderedDict[str, RiskState]" = OrderedDict()
+_STATE_CACHE_SIZE = 32
+_STATE_CACHE_LOCK = threading.Lock()
+
+
+class RiskState:
+    """
+    Cached portfolio risk state: annualized Σ, Σw, w'Σw and mean returns.
+
+    Every `with_*` method returns a new state updated incrementally:
+    a sparse weight change of k assets costs O(N·k), adding an asset
+    borders Σ with one new row/column (O(N·T)), and removing one drops its
+    row/column and downdates Σw, instead of recomputing from prices.
+    """
+
+    def __init__(
+        self,
+        assets: list,
+        weights: np.ndarray,
+        cov: np.ndarray,
+        mean: np.ndarray,
+        centered: np.ndarray,
+        freq: str,
+        sigma_w: np.ndarray | None = None,
+        variance: float | None = None
+    ):
+        self.assets = list(assets)
+        self.weights = weights
+        self.cov = cov
+        self.mean = mean
+        self.centered = centered
+        self.freq = freq
+        self.sigma_w = cov @ weights if sigma_w is None else sigma_w
+        self.variance = float(weights @ self.sigma_w) if variance is None else variance
+
+    @classmethod
+    def from_prices(cls, prices: pd.DataFrame, weights: np.ndarray, freq: str = 'daily') -> "RiskState":
+        if prices.shape[1] != len(weights):
+            raise ValueError("Number of weights must match number of assets.")
+        returns = compute_log_returns(prices).to_numpy(dtype=float)
+        mean = returns.mean(axis=0)
+        centered = returns - mean
+        cov = centered.T @ centered / (len(returns) - 1) * get_annualization_factor(freq)
+        return cls(list(prices.columns), np.asarray(weights, dtype=float), cov, mean, centered, freq)
+
+    def _index(self, asset) -> int:
+        try:
+            return self.assets.index(asset)
+        except ValueError:
+            raise ValueError(f"Unknown asset: {asset}") from None
+
+    def with_weight_delta(self, deltas: dict) -> "RiskState":
+        """
+        Apply Δw on k assets: Σw' = Σw + Σ[:, k] Δw_k,
+        w'Σw' = w'Σw + 2 Δw_k·(Σw)_k + Δw_k' Σ[k, k] Δw_k.
+        """
+        if not deltas:
+            return self
+        idx = np.array([self._index(a) for a in deltas])
+        dw = np.array(list(deltas.values()), dtype=float)
+
+        weights = self.weights.copy()
+        np.add.at(weights, idx, dw)
+        cov_cols = self.cov[:, idx]
+        sigma_w = self.sigma_w + cov_cols @ dw
+        variance = self.variance + 2 * dw @ self.sigma_w[idx] + dw @ cov_cols[idx] @ dw
+
+        return RiskState(self.assets, weights, self.cov, self.mean, self.centered, self.freq, sigma_w, variance)
+
+    def with_asset_added(self, asset, prices: pd.Series | np.ndarray, weight: float = 0.0) -> "RiskState":
+        """
+        Border Σ with a new asset whose prices are aligned with the original price history.
+        """
+        if asset in self.assets:
+            raise ValueError(f"Asset already in portfolio: {asset}")
+        prices = np.asarray(prices, dtype=float)
+        if len(prices) != len(self.centered) + 1:
+            raise ValueError(f"Prices for {asset} must be aligned with the existing price history.")
+
+        r = np.log(prices[1:] / prices[:-1])
+        r_mean = r.mean()
+        r_centered = r - r_mean
+        factor = get_annualization_factor(self.freq) / (len(r) - 1)
+        c = self.centered.T @ r_centered * factor
+        s = float(r_centered @ r_centered * factor)
+
+        n = len(self.assets)
+        cov = np.empty((n + 1, n + 1))
+        cov[:n, :n] = self.cov
+        cov[:n, n] = cov[n, :n] = c
+        cov[n, n] = s
+
+        sigma_w = np.append(self.sigma_w + c * weight, c @ self.weights + s * weight)
+        variance = self.variance + 2 * weight * (c @ self.weights) + s * weight ** 2
+
+        return RiskState(
+            self.assets + [asset],
+            np.append(self.weights, weight),
+            cov,
+            np.append(self.mean, r_mean),
+            np.column_stack([self.centered, r_centered]),
+            self.freq,
+            sigma_w,
+            variance
+        )
+
+    def with_asset_removed(self, asset) -> "RiskState":
+        """
+        Drop an asset (and its weight): Σw' = (Σw - Σ[:, j] w_j) without row j.
+        """
+        j = self._index(asset)
+        w_j = self.weights[j]
+        sigma_w = self.sigma_w - self.cov[:, j] * w_j
+        variance = self.variance - 2 * w_j * self.sigma_w[j] + self.cov[j, j] * w_j ** 2
+
+        keep = np.arange(len(self.assets)) != j
+        return RiskState(
+            [a for a in self.assets if a != asset],
+            self.weights[keep],
+            self.cov[np.ix_(keep, keep)],
+            self.mean[keep],
+            self.centered[:, keep],
+            self.freq,
+            sigma_w[keep],
+            variance
+        )
+
+    def metrics(self, confidence_level: float = 0.95) -> dict:
+        """
+        Portfolio volatility, MCTR, CCTR and parametric VaR from the cached state.
+
+        Volatility and risk contributions use the sample covariance (ddof=1),
+        like /risk-report's portfolio volatility; parametric VaR uses the
+        population variance (ddof=0), like core.var_cvar, so what-if deltas
+        line up with the main report.
+        """
+        annual_factor = get_annualization_factor(self.freq)
+        variance = max(self.variance, 0.0)
+        volatility = np.sqrt(variance)
+        mctr = self.sigma_w / volatility if volatility > 0 else np.zeros_like(self.sigma_w)
+        cctr = self.weights * mctr
+
+        period_mean = float(self.mean @ self.weights)
+        n_periods = len(self.centered)
+        period_vol = np.sqrt(variance / annual_factor * (n_periods - 1) / n_periods)
+        z = norm.ppf(1 - confidence_level)
+
+        return {
+            "weights": dict(zip(self.assets, self.weights.tolist())),
+            "expected_return": period_mean * annual_factor,
+            "variance": variance,
+            "volatility": float(volatility),
+            "marginal": dict(zip(self.assets, mctr.tolist())),
+            "component": dict(zip(self.assets, cctr.tolist())),
+            "parametric_var": float(-(period_mean + z * period_vol))
+        }
+
+
+def _state_key(prices: pd.DataFrame, weights: np.ndarray, freq: str) -> str:
+    digest = hashlib.sha256()
+    digest.update(repr(list(prices.columns)).encode())
+    digest.update(np.ascontiguousarray(prices.to_numpy(dtype=float)).tobytes())
+    digest.update(np.asarray(weights, dtype=float).tobytes())
+    digest.update(freq.encode())
+    return digest.hexdigest()
+
+
+def get_risk_state(prices: pd.DataFrame, weights: np.ndarray, freq: str = 'daily') -> tuple[RiskState, bool]:
+    """
+    Return the cached RiskState for (prices, weights, freq), building it on a miss.
+
+    Returns:
+        tuple: (RiskState, whether it came from the cache)
+    """
+    key = _state_key(prices, weights, freq)
+    with _STATE_CACHE_LOCK:
+        state = _STATE_CACHE.get(key)
+        if state is not None:
+            _STATE_CACHE.move_to_end(key)
+            return state, True
+
+    # Build outside the lock; a concurrent miss on the same key just builds it twice
+    state = RiskState.from_prices(prices, weights, freq)
+    with _STATE_CACHE_LOCK:
+        _STATE_CACHE[key] = state
+        _STATE_CACHE.move_to_end(key)
+        while len(_STATE_CACHE) > _STATE_CACHE_SIZE:
+            _STATE_CACHE.popitem(last=False)
+    return state, False
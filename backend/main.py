@@ -1,11 +1,25 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
-from routes import risk_report, optimize, stress_test, var_cvar, risk_summary, risk_history
+# Routers are light: numpy, pandas, scipy and core analytics load on first use (or during warm-up)
+from routes import risk_report, optimize, stress_test, var_cvar, risk_summary, risk_history, var_backtest, what_if, metrics, health
+from core.warmup import start_warmup
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # With RISK_API_WARMUP=1, /api/ready returns 503 until a synthetic report has run
+    start_warmup()
+    yield
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 app.include_router(risk_report.router, prefix="/api")
 app.include_router(optimize.router, prefix="/api")
 app.include_router(stress_test.router, prefix="/api")
 app.include_router(var_cvar.router, prefix="/api")
 app.include_router(risk_summary.router, prefix="/api")
-app.include_router(risk_history.router, prefix="/api")
\ No newline at end of file
+app.include_router(risk_history.router, prefix="/api")
+app.include_router(var_backtest.router, prefix="/api")
+app.include_router(what_if.router, prefix="/api")
+app.include_router(metrics.router, prefix="/api")
+app.include_router(health.router, prefix="/api")
\ No newline at end of file
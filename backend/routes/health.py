@@ -0,0 +1,16 @@
+from fastapi import APIRouter, HTTPException
+
+from core.warmup import readiness
+
+router = APIRouter()
+
+@router.get("/health")
+def health():
+    return {"status": "ok"}
+
+@router.get("/ready")
+def ready():
+    status = readiness()
+    if not status["ready"]:
+        raise HTTPException(status_code=503, detail="Warm-up in progress")
+    return status
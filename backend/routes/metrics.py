@@ -0,0 +1,11 @@
+from fastapi import APIRouter
+
+from core.singleflight import SINGLE_FLIGHT
+
+router = APIRouter()
+
+@router.get("/metrics/coalescing")
+async def coalescing_metrics():
+    # Async so the counters are read on the event loop that updates them;
+    # "merged" requests shared another request's in-flight computation
+    return SINGLE_FLIGHT.stats()
@@ -1,21 +1,39 @@
+import threading
+from collections import OrderedDict
+
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
-from typing import Dict, List, Literal
-import pandas as pd
-import numpy as np
-
-from core.optimization import maximize_sharpe_ratio, minimize_volatility
+from typing import Dict, List, Literal, Optional
 
 router = APIRouter()
 
+# Previous rebalance state per client-supplied state_id (and problem shape), so a
+# client's daily reruns warm-start from its own previous solve; LRU-bounded
+_REBALANCE_STATES: "OrderedDict[tuple, RebalanceState]" = OrderedDict()
+_MAX_REBALANCE_STATES = 64
+_REBALANCE_STATES_LOCK = threading.Lock()
+
 class OptimizeRequest(BaseModel):
     returns: Dict[str, List[float]]     # e.g., { "AAPL": [...], "MSFT": [...] }
     freq: Literal["daily", "weekly", "monthly"] = "daily"
     risk_free_rate: float = 0.02
     allow_short: bool = False           # default to long-only
+    objectives: List[Literal["min_volatility", "max_sharpe", "risk_parity", "hrp", "rebalance"]] = ["min_volatility", "max_sharpe"]
+    risk_budgets: Optional[Dict[str, float]] = None   # risk_parity only; default equal risk contribution
+    current_weights: Optional[Dict[str, float]] = None  # rebalance only
+    linear_cost: float = 0.0            # rebalance: cost per unit of turnover
+    quadratic_cost: float = 0.0         # rebalance: quadratic trading cost coefficient
+    max_turnover: Optional[float] = None  # rebalance: cap on sum |w - w_current|
+    state_id: Optional[str] = None      # rebalance: warm-start from this id's previous solve; None = stateless
 
 @router.post("/optimize")
 def optimize_portfolio(req: OptimizeRequest):
+    import pandas as pd
+    import numpy as np
+    from core.optimization import maximize_sharpe_ratio, minimize_volatility, risk_budget_weights, hierarchical_risk_parity
+    from core.covariance import compute_annualized_covariance
+    from core.rebalance import RebalanceState, rebalance_portfolio
+
     try:
         # Reconstruct return DataFrame
         returns_df = pd.DataFrame(req.returns)
@@ -23,22 +41,73 @@ def optimize_portfolio(req: OptimizeRequest):
         if returns_df.shape[1] < 2:
             raise ValueError("At least two assets are required for optimization.")
 
+        asset_names = list(returns_df.columns)
+        result = {"assets": asset_names}
+
         # Get optimal weights
-        min_vol_weights = minimize_volatility(returns_df.cov(), allow_short=req.allow_short)
-        max_sharpe_weights = maximize_sharpe_ratio(
-            returns_df,
-            risk_free_rate=req.risk_free_rate,
-            freq=req.freq,
-            allow_short=req.allow_short
-        )
+        if "min_volatility" in req.objectives:
+            min_vol_weights = minimize_volatility(returns_df.cov(), allow_short=req.allow_short)
+            result["min_volatility_weights"] = dict(zip(asset_names, min_vol_weights))
 
-        asset_names = list(returns_df.columns)
+        if "max_sharpe" in req.objectives:
+            max_sharpe_weights = maximize_sharpe_ratio(
+                returns_df,
+                risk_free_rate=req.risk_free_rate,
+                freq=req.freq,
+                allow_short=req.allow_short
+            )
+            result["max_sharpe_weights"] = dict(zip(asset_names, max_sharpe_weights))
+
+        if "risk_parity" in req.objectives:
+            budgets = None
+            if req.risk_budgets is not None:
+                missing = set(asset_names) - set(req.risk_budgets)
+                if missing:
+                    raise ValueError(f"Missing risk budgets for: {sorted(missing)}")
+                budgets = np.array([req.risk_budgets[name] for name in asset_names])
+            risk_parity_weights = risk_budget_weights(returns_df.cov(), budgets)
+            result["risk_parity_weights"] = dict(zip(asset_names, risk_parity_weights))
+
+        if "hrp" in req.objectives:
+            hrp_weights = hierarchical_risk_parity(returns_df)
+            result["hrp_weights"] = dict(zip(asset_names, hrp_weights))
+
+        if "rebalance" in req.objectives:
+            if req.current_weights is None:
+                raise ValueError("current_weights are required for the rebalance objective.")
+            current = np.array([req.current_weights.get(name, 0.0) for name in asset_names])
+
+            key = (req.state_id, tuple(asset_names), req.freq, req.quadratic_cost, req.allow_short)
+            state = None
+            if req.state_id is not None:
+                with _REBALANCE_STATES_LOCK:
+                    state = _REBALANCE_STATES.pop(key, None)
+            state = state or RebalanceState()
+            rebalance = rebalance_portfolio(
+                compute_annualized_covariance(returns_df, freq=req.freq),
+                current,
+                linear_cost=req.linear_cost,
+                quadratic_cost=req.quadratic_cost,
+                max_turnover=req.max_turnover,
+                allow_short=req.allow_short,
+                state=state
+            )
+            if req.state_id is not None:
+                with _REBALANCE_STATES_LOCK:
+                    _REBALANCE_STATES[key] = state
+                    while len(_REBALANCE_STATES) > _MAX_REBALANCE_STATES:
+                        _REBALANCE_STATES.popitem(last=False)
+
+            result["rebalance_weights"] = dict(zip(asset_names, rebalance["weights"]))
+            result["rebalance"] = {
+                "turnover": rebalance["turnover"],
+                "transaction_cost": rebalance["transaction_cost"],
+                "iterations": rebalance["iterations"],
+                "method": rebalance["method"],
+                "converged": rebalance["converged"]
+            }
 
-        return {
-            "assets": asset_names,
-            "min_volatility_weights": dict(zip(asset_names, min_vol_weights)),
-            "max_sharpe_weights": dict(zip(asset_names, max_sharpe_weights))
-        }
+        return result
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -1,11 +1,6 @@
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Dict, List, Literal
-import pandas as pd
-import numpy as np
-
-from core.returns import compute_log_returns, compute_cumulative_returns
-from core.regime_detection import compute_rolling_volatility, compute_rolling_sharpe_ratio, detect_volatility_regime
 
 router = APIRouter()
 
@@ -16,39 +11,32 @@ class RiskHistoryRequest(BaseModel):
     risk_free_rate: float = 0.02
     high_vol_threshold: float = 0.03
     low_vol_threshold: float = 0.01
+    drawdown_top_n: int = 5
+    regime_model: Literal["threshold", "hmm"] = "threshold"
+    hmm_states: int = 2
+    hmm_max_iter: int = Field(200, ge=1, le=1000)
 
 @router.post("/risk-history")
 def risk_history(req: RiskHistoryRequest):
+    import pandas as pd
+    from core.risk_engine import generate_risk_history
+
     try:
         price_df = pd.DataFrame(req.prices)
-        log_returns = compute_log_returns(price_df)
-
-        # Rolling metrics
-        rolling_vol = compute_rolling_volatility(log_returns, window=req.window)
-        rolling_sharpe = compute_rolling_sharpe_ratio(
-            log_returns,
-            risk_free_rate=req.risk_free_rate,
-            window=req.window,
-            freq=req.freq
-        )
 
-        # Regime detection
-        avg_vol_series = rolling_vol.mean(axis=1)
-        regime_labels = detect_volatility_regime(
-            avg_vol_series,
-            high_threshold=req.high_vol_threshold,
-            low_threshold=req.low_vol_threshold
-        )
-
-        # Cumulative returns
-        portfolio_cum_returns = compute_cumulative_returns(log_returns).mean(axis=1)
-
-        return {
-            "rolling_volatility": rolling_vol.round(5).to_dict(),
-            "rolling_sharpe_ratio": rolling_sharpe.round(5).to_dict(),
-            "regime_labels": regime_labels.astype(str).to_dict(),
-            "portfolio_cumulative_returns": portfolio_cum_returns.round(5).to_dict()
+        config = {
+            "freq": req.freq,
+            "window": req.window,
+            "risk_free_rate": req.risk_free_rate,
+            "high_vol_threshold": req.high_vol_threshold,
+            "low_vol_threshold": req.low_vol_threshold,
+            "drawdown_top_n": req.drawdown_top_n,
+            "regime_model": req.regime_model,
+            "hmm_states": req.hmm_states,
+            "hmm_max_iter": req.hmm_max_iter
         }
 
+        return generate_risk_history(price_df, config)
+
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
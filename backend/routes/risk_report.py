@@ -1,13 +1,24 @@
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
-from typing import List, Dict, Literal
-import pandas as pd
-import numpy as np
+import os
 
-from core.risk_engine import generate_risk_report
+from fastapi import APIRouter, HTTPException, Request
+from pydantic import BaseModel, Field
+from typing import List, Dict, Literal, Optional
+
+from core.singleflight import SINGLE_FLIGHT, request_key
 
 router = APIRouter()
 
+# Bootstrap options are client input: bound the work and processes one request can ask for
+MAX_BOOTSTRAP_SAMPLES = 20000
+
+class ConfidenceIntervalOptions(BaseModel):
+    n_samples: int = Field(1000, ge=10, le=MAX_BOOTSTRAP_SAMPLES)
+    block_size: int = Field(20, ge=1)
+    method: Literal["stationary", "circular"] = "stationary"
+    interval: float = Field(0.95, gt=0, lt=1)
+    seed: int = 0
+    n_workers: int = Field(1, ge=1, le=os.cpu_count() or 1)
+
 # Define request schema
 class RiskReportRequest(BaseModel):
     prices: Dict[str, List[float]]         # e.g., { "AAPL": [...], "MSFT": [...] }
@@ -18,31 +29,51 @@ class RiskReportRequest(BaseModel):
     risk_free_rate: float                  # e.g., 0.02
     high_vol_threshold: float              # e.g., 0.03
     low_vol_threshold: float               # e.g., 0.01
+    sections: Optional[List[Literal[
+        "portfolio", "risk_contributions", "tail_risk",
+        "correlation_matrix", "drawdowns", "regime"
+    ]]] = None                             # None = default report, [] = no sections
+    confidence_intervals: Optional[ConfidenceIntervalOptions] = None   # opt-in bootstrap block
+
+
+def _risk_report(req: RiskReportRequest):
+    import pandas as pd
+    import numpy as np
+    from core.risk_engine import generate_risk_report, DEFAULT_SECTIONS
+
+    # Reconstruct price DataFrame
+    price_df = pd.DataFrame(req.prices)
+
+    # Convert to NumPy array
+    weights = np.array(req.weights)
+
+    if price_df.shape[1] != len(weights):
+        raise ValueError("Number of weights must match number of assets (price columns).")
+
+    config = {
+        "freq": req.freq,
+        "confidence_level": req.confidence_level,
+        "window": req.window,
+        "risk_free_rate": req.risk_free_rate,
+        "high_vol_threshold": req.high_vol_threshold,
+        "low_vol_threshold": req.low_vol_threshold
+    }
+
+    sections = list(DEFAULT_SECTIONS if req.sections is None else req.sections)
+    if req.confidence_intervals is not None:
+        config["bootstrap"] = req.confidence_intervals.model_dump()
+        sections.append("confidence_intervals")
+
+    report = generate_risk_report(price_df, weights, config, sections=sections)
+    return report
 
 
 @router.post("/risk-report")
-def risk_report(req: RiskReportRequest):
+async def risk_report(req: RiskReportRequest, request: Request):
     try:
-        # Reconstruct price DataFrame
-        price_df = pd.DataFrame(req.prices)
-
-        # Convert to NumPy array
-        weights = np.array(req.weights)
-
-        if price_df.shape[1] != len(weights):
-            raise ValueError("Number of weights must match number of assets (price columns).")
-
-        config = {
-            "freq": req.freq,
-            "confidence_level": req.confidence_level,
-            "window": req.window,
-            "risk_free_rate": req.risk_free_rate,
-            "high_vol_threshold": req.high_vol_threshold,
-            "low_vol_threshold": req.low_vol_threshold
-        }
-
-        report = generate_risk_report(price_df, weights, config)
-        return report
+        # Identical concurrent requests share one computation
+        key = request_key("risk-report", await request.body())
+        return await SINGLE_FLIGHT.do("risk-report", key, lambda: _risk_report(req))
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -1,20 +1,35 @@
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
-from typing import List, Dict
-import pandas as pd
-import numpy as np
-
-from core.stress_testing import simulate_stress_scenario
+from pydantic import BaseModel, Field
+from typing import List, Dict, Literal, Optional
 
 router = APIRouter()
 
+# Each scenario needing repair costs a few dozen batched eigendecompositions of the N x N matrix
+MAX_CORRELATION_SCENARIOS = 250
+
 class StressTestRequest(BaseModel):
     prices: Dict[str, List[float]]          # e.g., { "AAPL": [...], "MSFT": [...] }
     weights: List[float]                    # e.g., [0.5, 0.5]
     shock: Dict[str, float]                # e.g., { "AAPL": -0.2, "MSFT": -0.1 }
 
+class CorrelationOverride(BaseModel):
+    assets: List[str]                       # e.g., ["AAPL", "MSFT"]
+    with_assets: Optional[List[str]] = None # cross-group block; within "assets" if omitted
+    correlation: float                      # e.g., 0.9
+
+class CorrelationStressRequest(BaseModel):
+    prices: Dict[str, List[float]]
+    weights: List[float]
+    scenarios: Dict[str, List[CorrelationOverride]] = Field(max_length=MAX_CORRELATION_SCENARIOS)  # name -> overrides
+    confidence_level: float = 0.95
+    freq: Literal["daily", "weekly", "monthly"] = "daily"
+
 @router.post("/stress-test")
 def stress_test(req: StressTestRequest):
+    import pandas as pd
+    import numpy as np
+    from core.stress_testing import simulate_stress_scenario
+
     try:
         price_df = pd.DataFrame(req.prices)
         weights = np.array(req.weights)
@@ -32,3 +47,30 @@ def stress_test(req: StressTestRequest):
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/stress-test/correlation")
+def correlation_stress_test(req: CorrelationStressRequest):
+    import pandas as pd
+    import numpy as np
+    from core.stress_testing import simulate_correlation_stress
+    from core.returns import compute_log_returns
+
+    try:
+        price_df = pd.DataFrame(req.prices)
+        weights = np.array(req.weights)
+        scenarios = {
+            name: [o.model_dump(exclude_none=True) for o in overrides]
+            for name, overrides in req.scenarios.items()
+        }
+
+        return simulate_correlation_stress(
+            compute_log_returns(price_df),
+            weights,
+            scenarios,
+            confidence_level=req.confidence_level,
+            freq=req.freq
+        )
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
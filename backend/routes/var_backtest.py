@@ -0,0 +1,33 @@
+from fastapi import APIRouter, HTTPException
+from pydantic import ConfigDict
+
+from routes.var_cvar import TailRiskRequest
+
+router = APIRouter()
+
+class VaRBacktestRequest(TailRiskRequest):
+    # Backtests historical VaR only; reject options such as volatility_model instead of ignoring them
+    model_config = ConfigDict(extra="forbid")
+
+    window: int = 250                   # estimation window for each VaR forecast
+
+@router.post("/var-backtest")
+def var_backtest(req: VaRBacktestRequest):
+    import pandas as pd
+    from core.var_backtest import backtest_historical_var
+
+    try:
+        returns_df = pd.DataFrame(req.returns)
+
+        result = backtest_historical_var(returns_df, req.confidence_level, req.window)
+
+        return {
+            "confidence_level": req.confidence_level,
+            "window": req.window,
+            "statistics": result["statistics"],
+            "var_forecast": result["var_forecast"].round(5).to_dict(),
+            "exceedances": result["exceedances"].to_dict()
+        }
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
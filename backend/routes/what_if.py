@@ -0,0 +1,46 @@
+from fastapi import APIRouter, HTTPException
+from pydantic import BaseModel
+from typing import Dict, List, Literal, Optional
+
+router = APIRouter()
+
+class WhatIfRequest(BaseModel):
+    prices: Dict[str, List[float]]                      # same payload as /risk-report
+    weights: List[float]                                # current weights, same order as prices.keys()
+    freq: Literal["daily", "weekly", "monthly"] = "daily"
+    confidence_level: float = 0.95
+    deltas: Dict[str, float] = {}                       # e.g., { "AAPL": 0.02, "MSFT": -0.02 }
+    add_assets: Optional[Dict[str, List[float]]] = None # new assets' prices, aligned with `prices`
+    remove_assets: Optional[List[str]] = None
+
+@router.post("/what-if")
+def what_if(req: WhatIfRequest):
+    import pandas as pd
+    import numpy as np
+    from core.what_if import get_risk_state
+
+    try:
+        price_df = pd.DataFrame(req.prices)
+        weights = np.array(req.weights)
+
+        if price_df.shape[1] != len(weights):
+            raise ValueError("Number of weights must match number of assets (price columns).")
+
+        base, cached = get_risk_state(price_df, weights, req.freq)
+
+        # Removals and additions first so deltas can target new assets
+        scenario = base
+        for asset in req.remove_assets or []:
+            scenario = scenario.with_asset_removed(asset)
+        for asset, prices in (req.add_assets or {}).items():
+            scenario = scenario.with_asset_added(asset, prices)
+        scenario = scenario.with_weight_delta(req.deltas)
+
+        return {
+            "cached": cached,
+            "before": base.metrics(req.confidence_level),
+            "after": scenario.metrics(req.confidence_level)
+        }
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
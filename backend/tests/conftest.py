@@ -0,0 +1,82 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Tests import modules the way the app does ("from core.x import ..."), relative to backend/
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+# Synthetic data factories shared across tests; each takes a seed so tests
+# can draw independent samples
+
+@pytest.fixture
+def make_returns():
+    """
+    Returns for n_assets columns A0, A1, ...: i.i.d. normal with per-asset
+    `vol` (scalar or array), Student-t with `tail_df` degrees of freedom
+    instead if given, plus a common market factor with `loadings` (scalar
+    or array) if `market_vol` > 0.
+    `dated` adds a business-day index named "date".
+    """
+    def make(n_periods=500, n_assets=4, seed=0, vol=0.01, market_vol=0.0, loadings=1.0, tail_df=None, dated=False):
+        rng = np.random.default_rng(seed)
+        shape = (n_periods, n_assets)
+        noise = rng.standard_t(tail_df, shape) if tail_df else rng.normal(0, 1, shape)
+        values = noise * np.asarray(vol)
+        if market_vol:
+            values += rng.normal(0, market_vol, (n_periods, 1)) * np.asarray(loadings)
+        index = pd.bdate_range("2020-01-01", periods=n_periods, name="date") if dated else None
+        return pd.DataFrame(values, index=index, columns=[f"A{i}" for i in range(n_assets)])
+    return make
+
+
+@pytest.fixture
+def make_prices(make_returns):
+    """
+    Geometric random-walk prices starting near 100, from `make_returns`.
+    """
+    def make(n_periods=300, n_assets=4, seed=0, vol=0.01, dated=False):
+        returns = make_returns(n_periods, n_assets, seed=seed, vol=vol, dated=dated)
+        return 100 * np.exp(returns.cumsum())
+    return make
+
+
+@pytest.fixture
+def make_covariances(make_returns):
+    """
+    Annualized sample covariances of two overlapping windows one period
+    apart (consecutive days' risk model), with a common factor.
+    """
+    def make(n_assets=300, n_periods=1000, seed=0, loadings=1.0):
+        returns = make_returns(n_periods + 1, n_assets, seed=seed, market_vol=0.008, loadings=loadings).to_numpy()
+        return np.cov(returns[:-1], rowvar=False) * 252, np.cov(returns[1:], rowvar=False) * 252
+    return make
+
+
+@pytest.fixture
+def make_correlation():
+    """
+    Valid n x n correlation matrix from a three-factor model.
+    """
+    def make(n, seed=0):
+        rng = np.random.default_rng(seed)
+        factors = rng.normal(size=(n, 3))
+        cov = factors @ factors.T + np.diag(rng.uniform(1, 2, n))
+        d = np.sqrt(np.diag(cov))
+        return pd.DataFrame(cov / np.outer(d, d), index=range(n), columns=range(n))
+    return make
+
+
+@pytest.fixture
+def make_regime_returns(make_returns):
+    """
+    Returns that alternate between calm (1%) and volatile (3%) regimes
+    every 100 periods.
+    """
+    def make(n_periods=600, n_assets=3, seed=0):
+        vol = np.where((np.arange(n_periods) // 100) % 2, 0.03, 0.01)[:, None]
+        return make_returns(n_periods, n_assets, seed=seed, vol=vol)
+    return make
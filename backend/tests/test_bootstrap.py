@@ -0,0 +1,32 @@
+import numpy as np
+import pandas as pd
+
+from core.bootstrap import bootstrap_confidence_intervals
+from core.risk_metrics import compute_sharpe_ratio, compute_sortino_ratio
+from core.var_cvar import compute_historical_cvar, compute_historical_var
+
+
+def test_results_do_not_depend_on_n_workers(make_returns):
+    returns = make_returns(tail_df=4)
+    # A small memory budget forces several chunks, so the pool path is used
+    kwargs = dict(n_samples=200, seed=7, max_memory_bytes=returns.size * 8 * 4 * 25)
+
+    serial = bootstrap_confidence_intervals(returns, n_workers=1, **kwargs)
+    pooled = bootstrap_confidence_intervals(returns, n_workers=3, **kwargs)
+
+    assert pooled == serial
+
+
+def test_point_estimates_match_core_metrics(make_returns):
+    returns = make_returns(tail_df=4, seed=1)
+    result = bootstrap_confidence_intervals(returns, n_samples=50, risk_free_rate=0.02, freq="daily")
+
+    expected = {
+        "sharpe_ratio": compute_sharpe_ratio(returns, 0.02, freq="daily"),
+        "sortino_ratio": compute_sortino_ratio(returns, 0.02, freq="daily"),
+        "historical_var": compute_historical_var(returns, 0.95),
+        "historical_cvar": compute_historical_cvar(returns, 0.95)
+    }
+    for name, series in expected.items():
+        estimates = pd.Series({asset: stats["estimate"] for asset, stats in result[name].items()})
+        assert np.allclose(estimates[series.index], series), name
@@ -0,0 +1,98 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import core.ingestion
+from core.ingestion import align_price_series, ingest_prices
+
+
+def _write_ohlcv(path, dates, close):
+    close = np.asarray(close, dtype=float)
+    pd.DataFrame(
+        {"Open": close, "High": close * 1.01, "Low": close * 0.99, "Close": close, "Volume": 1000},
+        index=pd.Index(dates, name="Date")
+    ).to_csv(path)
+    return path
+
+
+def _is_memory_mapped(array):
+    while array is not None and not isinstance(array, np.memmap):
+        array = array.base
+    return array is not None
+
+
+def _series(name, dates, values):
+    return pd.DataFrame({name: np.asarray(values, dtype=float)}, index=pd.DatetimeIndex(dates))
+
+
+def test_price_column_reads_per_ticker_ohlcv_files(tmp_path):
+    dates = pd.bdate_range("2024-01-01", periods=30)
+    paths = [
+        _write_ohlcv(tmp_path / "AAPL.csv", dates, np.linspace(100, 110, 30)),
+        _write_ohlcv(tmp_path / "MSFT.csv", dates, np.linspace(200, 190, 30))
+    ]
+
+    with pytest.raises(ValueError, match="Duplicate tickers"):
+        ingest_prices(paths)
+
+    prices, report = ingest_prices(paths, price_column="Close")
+    assert list(prices.columns) == ["AAPL", "MSFT"]
+    assert np.allclose(prices["AAPL"], np.linspace(100, 110, 30))
+
+    with pytest.raises(ValueError, match="no 'Adj Close' column"):
+        ingest_prices(paths, price_column="Adj Close")
+
+
+def test_cache_hit_on_rerun_and_invalidation_on_mtime_change(tmp_path, monkeypatch):
+    dates = pd.bdate_range("2024-01-01", periods=30)
+    paths = [
+        _write_ohlcv(tmp_path / "AAPL.csv", dates, np.linspace(100, 110, 30)),
+        _write_ohlcv(tmp_path / "MSFT.csv", dates, np.linspace(200, 190, 30))
+    ]
+    cache_dir = tmp_path / "cache"
+    first, _ = ingest_prices(paths, cache_dir=cache_dir, price_column="Close")
+
+    calls = []
+    original = core.ingestion.load_price_files
+    monkeypatch.setattr(core.ingestion, "load_price_files", lambda *a, **k: calls.append(1) or original(*a, **k))
+
+    cached, _ = ingest_prices(paths, cache_dir=cache_dir, price_column="Close")
+    assert calls == []
+    assert _is_memory_mapped(cached.values)
+    pd.testing.assert_frame_equal(cached, first, check_freq=False)
+
+    stat = paths[0].stat()
+    os.utime(paths[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    ingest_prices(paths, cache_dir=cache_dir, price_column="Close")
+    assert calls == [1]
+    assert len(list(cache_dir.iterdir())) == 2
+
+
+def test_ffill_limit_bounds_gap_filling():
+    dates = pd.bdate_range("2024-01-01", periods=10)
+    full = _series("A", dates, np.arange(10) + 100)
+    gappy = _series("B", dates.delete([4, 5, 6]), np.arange(7) + 50)
+
+    filled, report = align_price_series([full, gappy], ffill_limit=3, stale_after=None)
+    assert len(filled) == 10 and report["missing_filled"] == 3
+    assert (filled["B"].iloc[3:7] == filled["B"].iloc[3]).all()
+
+    limited, report = align_price_series([full, gappy], ffill_limit=2, stale_after=None)
+    assert len(limited) == 9 and report["rows_dropped"] == 1
+    assert dates[6] not in limited.index
+
+
+def test_stale_series_dropped_or_flagged():
+    dates = pd.bdate_range("2024-01-01", periods=30)
+    live = _series("LIVE", dates, np.arange(30) + 100)
+    stale = _series("STALE", dates[:15], np.arange(15) + 50)
+
+    dropped, report = align_price_series([live, stale], ffill_limit=5, stale_after=10, stale_action="drop")
+    assert list(dropped.columns) == ["LIVE"] and len(dropped) == 30
+    assert report["stale"] == ["STALE"]
+
+    flagged, report = align_price_series([live, stale], ffill_limit=5, stale_after=10, stale_action="flag")
+    assert list(flagged.columns) == ["LIVE", "STALE"] and len(flagged) == 30
+    assert report["stale"] == ["STALE"] and (flagged["STALE"].iloc[14:] == 64).all()
@@ -0,0 +1,58 @@
+import asyncio
+import json
+
+import httpx
+from fastapi import FastAPI
+
+from benchmarks.load_test import ROUTES, _timed_post, build_parser, run_load_test, unique_body
+
+
+def test_smoke_run_covers_all_routes_without_errors():
+    args = build_parser().parse_args([
+        "--concurrency", "2", "--requests", "24", "--pool-size", "2",
+        "--min-assets", "3", "--max-assets", "5", "--min-periods", "120", "--max-periods", "200"
+    ])
+    result = run_load_test(args)
+
+    assert set(result["endpoints"]) == set(ROUTES)
+    assert all(warm["ok"] for warm in result["warmup"].values()), result["warmup"]
+    assert result["overall"]["requests"] == 24
+    for route, stats in result["endpoints"].items():
+        assert stats.get("errors", 0) == 0, (route, stats.get("error_samples"))
+
+
+def test_server_exceptions_are_recorded_as_errors():
+    app = FastAPI()
+
+    @app.post("/api/boom")
+    def boom():
+        raise RuntimeError("boom")
+
+    async def post():
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await _timed_post(client, "boom", b"{}", {"content-type": "application/json"})
+
+    route, seconds, ok, error = asyncio.run(post())
+    assert route == "boom" and not ok
+    assert error.startswith("HTTP 500")
+
+
+def test_unique_payloads_are_never_coalesced():
+    args = build_parser().parse_args([
+        "--routes", "risk-report", "risk-summary", "--concurrency", "4", "--requests", "16",
+        "--pool-size", "1", "--min-assets", "3", "--max-assets", "3",
+        "--min-periods", "120", "--max-periods", "120", "--unique-payloads"
+    ])
+    result = run_load_test(args)
+
+    assert set(result["coalescing"]) == {"risk-report", "risk-summary"}
+    assert all(counts["merged"] == 0 for counts in result["coalescing"].values())
+    assert sum(counts["executed"] for counts in result["coalescing"].values()) == 16
+
+
+def test_unique_body_only_adds_whitespace():
+    body = json.dumps({"a": [1, 2]}).encode()
+    tagged = [unique_body(body, n) for n in range(64)]
+    assert len(set(tagged)) == 64
+    assert all(json.loads(t) == {"a": [1, 2]} for t in tagged)
@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.optimization import hierarchical_risk_parity, risk_budget_weights
+
+
+@pytest.mark.parametrize("budgets", [None, np.array([0.3, 0.2, 0.15, 0.1, 0.1, 0.08, 0.05, 0.02])])
+def test_risk_budget_shares_match_budgets(budgets, make_returns):
+    cov = make_returns(n_assets=8, vol=np.linspace(0.005, 0.02, 8), market_vol=0.01).cov()
+    w = risk_budget_weights(cov, budgets)
+
+    sigma = cov.values
+    shares = w * (sigma @ w) / (w @ sigma @ w)
+    expected = np.full(len(w), 1 / len(w)) if budgets is None else budgets
+    assert np.all(w > 0) and np.isclose(w.sum(), 1.0)
+    np.testing.assert_allclose(shares, expected, atol=1e-7)
+
+
+def test_hrp_weights_are_long_only_and_fully_invested(make_returns):
+    w = hierarchical_risk_parity(make_returns(n_assets=25, seed=1, vol=np.linspace(0.005, 0.02, 25), market_vol=0.01))
+    assert w.shape == (25,)
+    assert np.all(w > 0) and np.isclose(w.sum(), 1.0)
+
+
+def test_hrp_matches_hand_computed_three_asset_case():
+    # A0 and A1 share a factor, A2 is independent, so single linkage merges
+    # {A0, A1} first and the ordered leaves are [A2, A0, A1]
+    rng = np.random.default_rng(2)
+    common = rng.normal(0, 0.01, 1000)
+    returns = pd.DataFrame({
+        "A0": common + rng.normal(0, 0.002, 1000),
+        "A1": 2 * common + rng.normal(0, 0.002, 1000),
+        "A2": rng.normal(0, 0.015, 1000),
+    })
+    cov = returns.cov().values
+
+    # First bisection: [A2] vs [A0, A1], the latter at its inverse-variance mix
+    ivp = 1 / np.diag(cov)[:2]
+    ivp /= ivp.sum()
+    var_pair = ivp @ cov[:2, :2] @ ivp
+    w2 = var_pair / (cov[2, 2] + var_pair)
+    # Second bisection: [A0] vs [A1]
+    w0 = (1 - w2) * cov[1, 1] / (cov[0, 0] + cov[1, 1])
+    w1 = (1 - w2) - w0
+
+    np.testing.assert_allclose(hierarchical_risk_parity(returns), [w0, w1, w2], rtol=1e-12)
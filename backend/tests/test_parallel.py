@@ -0,0 +1,14 @@
+import pandas as pd
+
+from core.parallel import compute_asset_metric_table, compute_asset_metrics_parallel, run_sharded
+from core.regime_detection import compute_rolling_volatility
+
+
+def test_sharded_results_match_serial(make_returns):
+    returns = make_returns(n_periods=300, n_assets=10)
+
+    table = compute_asset_metrics_parallel(returns, risk_free_rate=0.02, n_workers=2)
+    panel = run_sharded(compute_rolling_volatility, returns, n_workers=2, output="panel", window=20)
+
+    pd.testing.assert_frame_equal(table, compute_asset_metric_table(returns, risk_free_rate=0.02))
+    pd.testing.assert_frame_equal(panel, compute_rolling_volatility(returns, window=20))
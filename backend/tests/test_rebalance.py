@@ -0,0 +1,59 @@
+import copy
+
+import numpy as np
+import pytest
+
+import core.rebalance
+from core.rebalance import RebalanceState, rebalance_portfolio
+
+KWARGS = dict(linear_cost=0.001, quadratic_cost=0.01, max_turnover=0.2)
+
+
+@pytest.mark.parametrize("traded", [True, False])
+def test_active_set_warm_start_gives_the_cold_solution(traded, make_covariances):
+    cov_day1, cov_day2 = make_covariances()
+    initial = np.full(cov_day1.shape[0], 1 / cov_day1.shape[0])
+
+    state = RebalanceState()
+    day1 = rebalance_portfolio(cov_day1, initial, state=state, **KWARGS)
+    # Either yesterday's trades were executed, or the client still holds the old portfolio
+    current = day1["weights"] if traded else initial
+
+    cold = rebalance_portfolio(cov_day2, current, **KWARGS)
+    warm = rebalance_portfolio(cov_day2, current, state=state, **KWARGS)
+
+    assert cold["method"] == "admm" and cold["converged"]
+    assert warm["method"] == "active_set" and warm["converged"]
+    assert warm["iterations"] < 10
+    assert np.abs(warm["weights"] - cold["weights"]).max() < 1e-6
+    assert np.isclose(warm["weights"].sum(), 1.0) and warm["turnover"] <= KWARGS["max_turnover"] + 1e-8
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_active_set_verifies_after_executed_trades_with_uneven_factor_loadings(seed, make_covariances):
+    # These cases end on degenerate active sets: a trade that solves to ~0,
+    # or every trading asset moving the same way under a binding cap
+    loadings = np.random.default_rng(seed).uniform(0.5, 1.5, 300)
+    cov_day1, cov_day2 = make_covariances(seed=seed, loadings=loadings)
+    state = RebalanceState()
+    current = rebalance_portfolio(cov_day1, np.full(300, 1 / 300), state=state, **KWARGS)["weights"]
+
+    cold = rebalance_portfolio(cov_day2, current, **KWARGS)
+    warm = rebalance_portfolio(cov_day2, current, state=state, **KWARGS)
+
+    assert warm["method"] == "active_set"
+    assert np.abs(warm["weights"] - cold["weights"]).max() < 1e-6
+
+
+def test_unverified_active_set_falls_back_to_warm_admm(monkeypatch, make_covariances):
+    cov_day1, cov_day2 = make_covariances(n_assets=100)
+    current = np.full(100, 1 / 100)
+    state = RebalanceState()
+    rebalance_portfolio(cov_day1, current, state=state, **KWARGS)
+    cold = rebalance_portfolio(cov_day2, current, **KWARGS)
+
+    monkeypatch.setattr(core.rebalance, "_active_set_rebalance", lambda *args, **kwargs: None)
+    warm = rebalance_portfolio(cov_day2, current, state=copy.deepcopy(state), **KWARGS)
+
+    assert warm["method"] == "admm" and warm["converged"]
+    assert np.abs(warm["weights"] - cold["weights"]).max() < 1e-6
@@ -0,0 +1,57 @@
+import numpy as np
+
+from core.regime_detection import fit_gaussian_hmm
+from core.risk_engine import generate_risk_history
+
+
+def _log_space_log_likelihood(x, params):
+    """Plain per-asset log-space forward recursion as a reference."""
+    mean, vol = params["means"], params["volatilities"]
+    log_lik = []
+    for n in range(x.shape[1]):
+        log_b = -0.5 * (np.log(2 * np.pi * vol[n] ** 2) + (x[:, n, None] - mean[n]) ** 2 / vol[n] ** 2)
+        log_trans = np.log(params["transition"][n])
+        log_alpha = np.log(params["initial"][n]) + log_b[0]
+        for t in range(1, len(x)):
+            log_alpha = np.logaddexp.reduce(log_alpha[:, None] + log_trans, axis=0) + log_b[t]
+        log_lik.append(np.logaddexp.reduce(log_alpha))
+    return np.array(log_lik)
+
+
+def test_scaled_recursions_match_log_space_likelihood(make_regime_returns):
+    returns = make_regime_returns()
+    fit = fit_gaussian_hmm(returns)
+
+    expected = _log_space_log_likelihood(returns.to_numpy(), fit["params"])
+    assert np.allclose(fit["log_likelihood"].to_numpy(), expected)
+    assert np.allclose(fit["probabilities"].sum(axis=2), 1.0)
+    # Volatile blocks are decoded as the volatile state
+    volatile = (np.arange(len(returns)) // 100) % 2 == 1
+    assert (fit["labels"].to_numpy()[volatile] == 1).mean() > 0.9
+
+
+def test_default_fit_converges_and_warm_start_agrees(make_regime_returns):
+    returns = make_regime_returns(seed=1)
+    cold = fit_gaussian_hmm(returns)
+    warm = fit_gaussian_hmm(returns, init_params=cold["params"])
+
+    assert cold["converged"] and warm["converged"]
+    assert warm["iterations"] < cold["iterations"]
+    assert np.allclose(warm["log_likelihood"], cold["log_likelihood"], rtol=1e-4)
+
+
+def test_hmm_history_does_not_depend_on_earlier_requests(make_regime_returns):
+    config = {
+        "freq": "daily", "window": 20, "risk_free_rate": 0.0, "high_vol_threshold": 0.03,
+        "low_vol_threshold": 0.01, "drawdown_top_n": 3, "regime_model": "hmm", "hmm_states": 2
+    }
+    prices_a = 100 * np.exp(make_regime_returns(seed=2).cumsum())
+    prices_b = 100 * np.exp(make_regime_returns(seed=3).cumsum() * 2)
+
+    first = generate_risk_history(prices_a, config)
+    generate_risk_history(prices_b, config)  # same tickers, different history
+    again = generate_risk_history(prices_a, config)
+
+    assert first["regime_converged"]
+    assert again["regime_labels"] == first["regime_labels"]
+    assert again["asset_regimes"] == first["asset_regimes"]
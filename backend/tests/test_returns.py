@@ -0,0 +1,29 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.returns import ReturnPyramid
+
+
+@pytest.mark.parametrize("method", ["log", "simple"])
+def test_extended_pyramid_matches_fresh_build(method, make_prices):
+    prices = make_prices(n_periods=400, n_assets=3, dated=True)
+    # Split points fall mid-week, mid-month and mid-quarter, plus a single-bar update
+    splits = [150, 151, 233, 317, len(prices)]
+
+    pyramid = ReturnPyramid(prices.iloc[:splits[0]], method=method)
+    for start, stop in zip(splits[:-1], splits[1:]):
+        pyramid.extend(prices.iloc[start:stop])
+    fresh = ReturnPyramid(prices, method=method)
+
+    for freq in ReturnPyramid.LEVELS:
+        pd.testing.assert_frame_equal(pyramid.prices(freq), fresh.prices(freq), check_freq=False)
+        pd.testing.assert_frame_equal(pyramid.returns(freq), fresh.returns(freq), check_freq=False)
+
+
+def test_rolling_volatility_annualizes_at_the_requested_frequency(make_returns):
+    from core.risk_metrics import compute_rolling_volatility
+
+    weekly = make_returns(n_periods=20, n_assets=3)
+    rolling = compute_rolling_volatility(weekly, window=10, freq="weekly")
+    pd.testing.assert_frame_equal(rolling, weekly.rolling(10).std() * np.sqrt(52))
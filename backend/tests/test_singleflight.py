@@ -0,0 +1,63 @@
+import asyncio
+import threading
+import time
+
+import httpx
+
+from core.singleflight import SingleFlight, request_key
+
+
+def test_concurrent_duplicates_share_one_computation():
+    flight = SingleFlight()
+    calls = []
+
+    def work():
+        calls.append(threading.get_ident())
+        time.sleep(0.1)
+        return {"value": 1}
+
+    async def run():
+        key = request_key("test", b'{"a": 1}')
+        return await asyncio.gather(*(flight.do("test", key, work) for _ in range(20)))
+
+    results = asyncio.run(run())
+    assert len(calls) == 1
+    assert all(r == {"value": 1} for r in results)
+    assert flight.stats() == {"in_flight": 0, "endpoints": {"test": {"executed": 1, "merged": 19}}}
+
+
+def test_errors_reach_every_waiter_and_are_not_cached():
+    flight = SingleFlight()
+
+    def fail():
+        time.sleep(0.05)
+        raise ValueError("boom")
+
+    async def run():
+        return await asyncio.gather(*(flight.do("test", "k", fail) for _ in range(5)), return_exceptions=True)
+
+    assert all(isinstance(r, ValueError) for r in asyncio.run(run()))
+    asyncio.run(run())
+    assert flight.stats()["endpoints"]["test"] == {"executed": 2, "merged": 8}
+
+
+def test_risk_summary_route_coalesces_identical_bodies():
+    from main import app
+    from core.singleflight import SINGLE_FLIGHT
+
+    prices = {"A": [100 + i + (i % 3) for i in range(80)], "B": [50 + 0.5 * i - (i % 4) for i in range(80)]}
+    payload = {"prices": prices, "weights": [0.5, 0.5], "window": 20}
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await asyncio.gather(*(client.post("/api/risk-summary", json=payload) for _ in range(8)))
+
+    before = dict(SINGLE_FLIGHT.stats()["endpoints"].get("risk-summary", {"executed": 0, "merged": 0}))
+    responses = asyncio.run(run())
+    after = SINGLE_FLIGHT.stats()["endpoints"]["risk-summary"]
+
+    assert all(r.status_code == 200 for r in responses)
+    assert len({r.text for r in responses}) == 1
+    assert after["executed"] + after["merged"] - before["executed"] - before["merged"] == 8
+    assert after["executed"] - before["executed"] < 8
@@ -0,0 +1,34 @@
+import numpy as np
+
+from core.stress_testing import apply_correlation_overrides, nearest_correlation_matrix
+
+
+def test_repair_is_valid_and_matches_plain_alternating_projections(make_correlation):
+    corr = make_correlation(30)
+    stressed = np.stack([
+        apply_correlation_overrides(corr, [
+            {"assets": list(range(10)), "correlation": 0.95},
+            {"assets": list(range(10, 15)), "with_assets": list(range(5)), "correlation": -0.8}
+        ]),
+        apply_correlation_overrides(corr, [{"assets": [0, 1], "correlation": 0.3}]),
+    ])
+
+    repaired, min_eig, iterations, converged = nearest_correlation_matrix(stressed)
+    reference, _, _, _ = nearest_correlation_matrix(stressed, depth=0, tol=1e-12, max_iter=20000)
+
+    assert min_eig[0] < 0 and converged.all()
+    assert np.linalg.eigvalsh(repaired[0]).min() > -1e-12
+    assert np.allclose(np.diag(repaired[0]), 1.0)
+    assert np.abs(repaired[0] - reference[0]).max() < 1e-6
+    # Already-valid scenarios are returned untouched
+    assert iterations[1] == 0 and np.array_equal(repaired[1], stressed[1])
+
+
+def test_duplicate_scenarios_are_repaired_once(make_correlation):
+    corr = make_correlation(12, seed=1)
+    override = [{"assets": list(range(6)), "correlation": 0.9}, {"assets": [6, 7], "with_assets": [0, 1], "correlation": -0.9}]
+    stressed = np.stack([apply_correlation_overrides(corr, override)] * 3)
+
+    repaired, min_eig, iterations, converged = nearest_correlation_matrix(stressed)
+    assert (min_eig < 0).all() and converged.all()
+    assert np.array_equal(repaired[0], repaired[2]) and len(set(iterations)) == 1
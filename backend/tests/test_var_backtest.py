@@ -0,0 +1,41 @@
+import asyncio
+
+import httpx
+import numpy as np
+import pandas as pd
+
+from core.var_backtest import compute_rolling_historical_var
+from core.var_cvar import compute_historical_var
+
+
+def test_rolling_var_matches_per_window_historical_var():
+    rng = np.random.default_rng(0)
+    returns = pd.DataFrame(rng.standard_t(4, (400, 3)) * 0.01, columns=["A", "B", "C"])
+    returns.iloc[::7] = 0.0  # ties
+    window = 60
+
+    result = compute_rolling_historical_var(returns, 0.95, window)
+
+    assert result.iloc[:window - 1].isna().all().all()
+    for t in range(window - 1, len(returns)):
+        expected = compute_historical_var(returns.iloc[t - window + 1:t + 1], 0.95)
+        assert np.array_equal(result.iloc[t].to_numpy(), expected.to_numpy())
+
+
+def test_backtest_route_rejects_var_cvar_only_options():
+    from main import app
+
+    rng = np.random.default_rng(1)
+    body = {"returns": {"A": list(rng.normal(0, 0.01, 300)), "B": list(rng.normal(0, 0.01, 300))}, "window": 100}
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return (
+                await client.post("/api/var-backtest", json=body),
+                await client.post("/api/var-backtest", json={**body, "volatility_model": "garch"})
+            )
+
+    accepted, rejected = asyncio.run(run())
+    assert accepted.status_code == 200
+    assert rejected.status_code == 422
@@ -0,0 +1,27 @@
+import numpy as np
+import pandas as pd
+
+from core.returns import compute_log_returns
+from core.var_cvar import compute_parametric_var
+from core.what_if import RiskState, get_risk_state
+
+
+def test_parametric_var_matches_core_var_cvar(make_prices):
+    prices = make_prices(n_periods=120)
+    weights = np.array([0.1, 0.2, 0.3, 0.4])
+    portfolio = pd.DataFrame({"p": compute_log_returns(prices).to_numpy() @ weights})
+
+    state, _ = get_risk_state(prices, weights)
+    assert np.isclose(state.metrics()["parametric_var"], compute_parametric_var(portfolio).iloc[0])
+
+
+def test_incremental_updates_match_a_rebuild(make_prices):
+    prices = make_prices(n_periods=120, n_assets=5)
+    weights = np.full(5, 0.2)
+    state = RiskState.from_prices(prices.iloc[:, :4], weights[:4] / weights[:4].sum())
+
+    updated = state.with_asset_added("A4", prices["A4"], 0.1).with_weight_delta({"A0": -0.1}).with_asset_removed("A1")
+    rebuilt = RiskState.from_prices(prices[updated.assets], updated.weights)
+
+    for key in ["variance", "volatility", "parametric_var"]:
+        assert np.isclose(updated.metrics()[key], rebuilt.metrics()[key])